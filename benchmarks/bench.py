@@ -0,0 +1,331 @@
+"""Benchmark suite for the engine, strategies, guardrails and control loop.
+
+Results are written as JSON so a run can be compared against a stored baseline:
+
+    uv run python benchmarks/bench.py --output baseline.json
+    uv run python benchmarks/bench.py --baseline baseline.json --max-regression 0.25
+
+Each case reports per-call seconds (min / median / mean over --repeat runs). The
+comparison uses the minimum, which is the least noisy statistic on shared machines,
+and exits with status 1 if any case regressed by more than --max-regression.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from adaptive_experimentation import (
+    Constraints,
+    Engine,
+    Observation,
+    ObservationTable,
+    PosteriorStats,
+    __version__,
+    posterior,
+)
+from adaptive_experimentation.explanations import AllocationExplanation
+from adaptive_experimentation.guardrails import apply_guardrails
+from adaptive_experimentation.integrations.control_loop import run_once
+from adaptive_experimentation.types import observation_columns
+
+VARIANT_COUNTS = (2, 10, 100, 1000)
+
+Case = Callable[[], Callable[[], object]]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register a benchmark: a setup function returning the zero-arg callable to time."""
+
+    def decorator(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+
+    return decorator
+
+
+def _observations(n: int) -> dict[str, Observation]:
+    return {
+        f"v{i:04d}": Observation(trials=5000, successes=250 + (i * 37) % 200) for i in range(n)
+    }
+
+
+def _uniform(n: int) -> dict[str, float]:
+    return {f"v{i:04d}": 1.0 / n for i in range(n)}
+
+
+def _constraints(n: int) -> Constraints:
+    return Constraints(min_trials=1000, max_step=0.1, min_weight=min(0.01, 0.5 / n))
+
+
+def _engine_case(
+    strategy: str, n: int, *, explain: bool = True, table: bool = False
+) -> Case:
+    def setup() -> Callable[[], object]:
+        engine = Engine(strategy=strategy, explain=explain)
+        obs, prev, constraints = _observations(n), _uniform(n), _constraints(n)
+        if table:
+            obs = ObservationTable.from_mapping(obs)
+        return lambda: engine.compute(
+            observations=obs,
+            previous_weights=prev,
+            constraints=constraints,
+            seed=7,
+        )
+
+    return setup
+
+
+for _strategy in ("heuristic", "thompson"):
+    for _n in VARIANT_COUNTS:
+        case(f"engine.compute[{_strategy},n={_n}]")(_engine_case(_strategy, _n))
+    case(f"engine.compute[{_strategy},lean,n=100]")(_engine_case(_strategy, 100, explain=False))
+    case(f"engine.compute[{_strategy},lean,table,n=100]")(
+        _engine_case(_strategy, 100, explain=False, table=True)
+    )
+
+for _strategy in ("ucb1", "kl_ucb", "bayes_ucb", "top_two_thompson"):
+    case(f"engine.compute[{_strategy},n=100]")(_engine_case(_strategy, 100))
+    case(f"engine.compute[{_strategy},lean,n=100]")(_engine_case(_strategy, 100, explain=False))
+
+
+@case("engine.compute[thompson,posterior_stats,n=100]")
+def _engine_posterior_stats() -> Callable[[], object]:
+    engine = Engine(strategy="thompson", posterior_stats=PosteriorStats())
+    obs, prev, constraints = _observations(100), _uniform(100), _constraints(100)
+    return lambda: engine.compute(
+        observations=obs, previous_weights=prev, constraints=constraints, seed=7
+    )
+
+
+def _posterior_summarize(*, cached: bool) -> Case:
+    def setup() -> Callable[[], object]:
+        _, trials, successes = observation_columns(_observations(100))
+        ids = list(_uniform(100))
+        alpha = [1.0 + s for s in successes]
+        beta = [1.0 + t - s for t, s in zip(trials, successes, strict=True)]
+        stats = PosteriorStats()
+
+        def run() -> object:
+            if not cached:
+                posterior.clear_cache()
+            return posterior.summarize(ids, alpha, beta, stats)
+
+        return run
+
+    return setup
+
+
+case("posterior.summarize[cached,n=100]")(_posterior_summarize(cached=True))
+case("posterior.summarize[uncached,n=100]")(_posterior_summarize(cached=False))
+
+
+@case("guardrails.apply[no_floor,n=100]")
+def _guardrails_no_floor() -> Callable[[], object]:
+    n = 100
+    obs, prev, constraints = _observations(n), _uniform(n), _constraints(n)
+    proposed = {vid: (1.0 + (i % 3) * 0.1) for i, vid in enumerate(prev)}
+    total = sum(proposed.values())
+    proposed = {vid: w / total for vid, w in proposed.items()}
+    return lambda: apply_guardrails(
+        observations=obs, previous_weights=prev, proposed_weights=proposed, constraints=constraints
+    )
+
+
+@case("guardrails.apply[floor,n=100]")
+def _guardrails_floor() -> Callable[[], object]:
+    n = 100
+    obs, prev = _observations(n), _uniform(n)
+    constraints = Constraints(min_trials=1000, max_step=1.0, min_weight=0.005)
+    # Half the variants collapse to ~0 and hit the min_weight floor.
+    proposed = {vid: (0.0 if i % 2 else 2.0 / n) for i, vid in enumerate(prev)}
+    return lambda: apply_guardrails(
+        observations=obs, previous_weights=prev, proposed_weights=proposed, constraints=constraints
+    )
+
+
+def _thompson_explanation(n: int):
+    return Engine(strategy="thompson").compute(
+        observations=_observations(n),
+        previous_weights=_uniform(n),
+        constraints=_constraints(n),
+        seed=7,
+    ).explanation
+
+
+@case("explanation.asdict[thompson,n=100]")
+def _explanation_asdict() -> Callable[[], object]:
+    expl = _thompson_explanation(100)
+    return lambda: asdict(expl)
+
+
+@case("explanation.to_dict[thompson,n=100]")
+def _explanation_to_dict() -> Callable[[], object]:
+    return _thompson_explanation(100).to_dict
+
+
+@case("explanation.json_dumps_asdict[thompson,n=100]")
+def _explanation_json_asdict() -> Callable[[], object]:
+    expl = _thompson_explanation(100)
+    return lambda: json.dumps(asdict(expl))
+
+
+@case("explanation.to_json[thompson,n=100]")
+def _explanation_to_json() -> Callable[[], object]:
+    return _thompson_explanation(100).to_json
+
+
+@case("explanation.to_bytes[thompson,n=100]")
+def _explanation_to_bytes() -> Callable[[], object]:
+    return _thompson_explanation(100).to_bytes
+
+
+@case("explanation.from_bytes[thompson,n=100]")
+def _explanation_from_bytes() -> Callable[[], object]:
+    data = _thompson_explanation(100).to_bytes()
+    return lambda: AllocationExplanation.from_bytes(data)
+
+
+class _MemStore:
+    def __init__(self, weights: dict[str, float]) -> None:
+        self.initial = dict(weights)
+        self.weights = dict(weights)
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return self.weights
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        # Keep every iteration identical: do not carry weights over between runs.
+        self.weights = self.initial
+
+
+class _MemSource:
+    def __init__(self, observations: dict[str, Observation]) -> None:
+        self.observations = observations
+
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        return self.observations
+
+
+@case("control_loop.run_once[in_memory,n=10]")
+def _run_once() -> Callable[[], object]:
+    n = 10
+    store, source = _MemStore(_uniform(n)), _MemSource(_observations(n))
+    constraints = _constraints(n)
+    return lambda: run_once(
+        experiment_id="bench",
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        store=store,
+        source=source,
+        strategy="thompson",
+        constraints=constraints,
+        seed=7,
+    )
+
+
+@dataclass(frozen=True)
+class Timing:
+    number: int
+    repeat: int
+    min_s: float
+    median_s: float
+    mean_s: float
+
+    def to_dict(self) -> dict[str, float | int]:
+        return {
+            "number": self.number,
+            "repeat": self.repeat,
+            "min_s": self.min_s,
+            "median_s": self.median_s,
+            "mean_s": self.mean_s,
+        }
+
+
+def measure(fn: Callable[[], object], *, repeat: int, min_time_s: float) -> Timing:
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time_s:
+            break
+        number *= 2
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return Timing(
+        number=number,
+        repeat=repeat,
+        min_s=min(per_call),
+        median_s=statistics.median(per_call),
+        mean_s=statistics.fmean(per_call),
+    )
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    max_regression: float,
+) -> list[str]:
+    """Return names of cases slower than baseline by more than max_regression."""
+    regressed = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = current["min_s"] / base["min_s"]
+        flag = "REGRESSED" if ratio > 1.0 + max_regression else ""
+        print(f"{name:48s} {ratio:6.2f}x {flag}")
+        if flag:
+            regressed.append(name)
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only run cases containing this text.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Seconds per timed run.")
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    parser.add_argument("--baseline", help="Compare against a results JSON from an earlier run.")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, float]] = {}
+    for name, setup in CASES.items():
+        if args.filter not in name:
+            continue
+        timing = measure(setup(), repeat=args.repeat, min_time_s=args.min_time)
+        results[name] = timing.to_dict()
+        print(f"{name:48s} {timing.min_s * 1e6:12.2f} us/call", flush=True)
+
+    report = {
+        "meta": {
+            "package_version": __version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Wrote: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        print("\nvs baseline (min per-call time ratio):")
+        if compare(results, baseline, max_regression=args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,6 +7,7 @@ import json
 from dataclasses import asdict
 
 from adaptive_experimentation import Constraints, Engine, Observation
+from adaptive_experimentation.seeding import derive_seed
 
 
 def _maybe_plot(weights_csv: str, out_png: str = "weights_over_time.png") -> None:
@@ -191,7 +192,8 @@ def main() -> int:
                 observations=observations,
                 previous_weights=weights,
                 constraints=constraints,
-                seed=window_seed,  # also makes Thompson reproducible per window
+                # Separate stream from the traffic simulation, reproducible per window
+                seed=derive_seed(args.seed, "strategy", w),
             )
 
             _print_window_summary(
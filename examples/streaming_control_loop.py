@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import argparse
 import random
-import time
 from collections.abc import Mapping
 from dataclasses import dataclass
 
-from adaptive_experimentation import Constraints, Observation
+from adaptive_experimentation import Constraints
 from adaptive_experimentation.explanations import AllocationExplanation
 from adaptive_experimentation.integrations.control_loop import run_once
-from adaptive_experimentation.integrations.protocols import AllocationStore, ObservationSource
+from adaptive_experimentation.integrations.protocols import AllocationStore
+from adaptive_experimentation.integrations.streaming import StreamingAggregator
 
 
 @dataclass
@@ -30,30 +30,6 @@ class InMemoryStore(AllocationStore):
         self.writes += 1
 
 
-@dataclass
-class WindowedAggregator(ObservationSource):
-    """Aggregates a continuous stream into windowed Observation counts.
-
-    In production, this would usually read from a datastore populated by stream processors.
-    Here we keep it in-memory to demonstrate the control loop pattern.
-    """
-
-    counts: dict[str, Observation]
-
-    def read_observations(
-        self,
-        experiment_id: str,
-        window_start_epoch_s: int,
-        window_end_epoch_s: int,
-    ) -> Mapping[str, Observation]:
-        # Return a snapshot (don't hand out internal references)
-        return {k: Observation(v.trials, v.successes) for k, v in self.counts.items()}
-
-    def reset_window(self) -> None:
-        for k in list(self.counts.keys()):
-            self.counts[k] = Observation(trials=0, successes=0)
-
-
 def _bar(p: float, width: int = 24) -> str:
     n = max(0, min(width, int(round(p * width))))
     return "█" * n + " " * (width - n)
@@ -97,8 +73,9 @@ def main() -> None:
     # Initial weights: uniform
     store = InMemoryStore(weights={v: 1.0 / len(vids) for v in vids})
 
-    # Aggregator starts with 0 counts
-    source = WindowedAggregator(counts={v: Observation(trials=0, successes=0) for v in vids})
+    # Tumbling windows: each window's counts live in their own bucket, so no reset is needed.
+    # In production, a stream consumer would call source.ingest(...) as batches arrive.
+    source = StreamingAggregator(window_s=args.window_seconds)
 
     constraints = {
         "safe": Constraints.safe_defaults(),
@@ -107,6 +84,7 @@ def main() -> None:
     }[args.constraints]
 
     experiment_id = "streaming_example"
+    source.register(experiment_id, vids)
 
     print(
         f"variants={vids} winner={args.winner} base_ctr={args.base_ctr:.3f} "
@@ -119,12 +97,14 @@ def main() -> None:
     )
 
     for w in range(args.windows):
-        # Simulate a "stream" for one window: we emit events continuously
-        start = int(time.time())
+        # Simulate a "stream" for one window on a simulated clock aligned to windows
+        start = w * args.window_seconds
         end = start + args.window_seconds
 
         # Generate events for this window
         total_events = args.events_per_second * args.window_seconds
+        exposures: list[str] = []
+        clicks: list[bool] = []
         for _ in range(total_events):
             # route event to a variant based on current weights
             r = rng.random()
@@ -136,16 +116,12 @@ def main() -> None:
                     chosen = v
                     break
 
-            # exposure
-            obs = source.counts[chosen]
-            source.counts[chosen] = Observation(trials=obs.trials + 1, successes=obs.successes)
+            # exposure, and click based on CTR
+            exposures.append(chosen)
+            clicks.append(rng.random() < ctr[chosen])
 
-            # click based on CTR
-            if rng.random() < ctr[chosen]:
-                obs2 = source.counts[chosen]
-                source.counts[chosen] = Observation(
-                    trials=obs2.trials, successes=obs2.successes + 1
-                )
+        # Hand the window's events to the aggregator as one batch
+        source.ingest(experiment_id, exposures, clicks, event_time_epoch_s=start)
 
         # Run the control loop once per window
         result = run_once(
@@ -156,7 +132,8 @@ def main() -> None:
             source=source,
             strategy=args.strategy,
             constraints=constraints,
-            seed=args.seed if args.strategy == "thompson" else None,
+            # Independent, reproducible Thompson draws per window
+            root_seed=args.seed if args.strategy == "thompson" else None,
         )
 
         hold = result.allocation.explanation.guardrails.hold_reason or "none"
@@ -168,9 +145,6 @@ def main() -> None:
             print(f"  {v} {wt:.3f} {_bar(wt)}")
         print("")
 
-        # Reset window counts (new window)
-        source.reset_window()
-
     print(f"writes={store.writes} final_top={max(store.weights, key=store.weights.get)}")
     print("final_weights:", store.weights)
 
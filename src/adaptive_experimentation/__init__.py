@@ -5,9 +5,19 @@ from .explanations import (
            ObservationsSummary,
            StrategyExplanation,
 )
-from .types import AllocationResult, Constraints, Observation
+from .posterior import PosteriorStats
+from .types import (
+    AllocationResult,
+    ComputeRequest,
+    Constraints,
+    ContinuousObservation,
+    Observation,
+    ObservationTable,
+)
 
-__all__ = ["Engine", "Constraints", "Observation", "AllocationResult", "AllocationExplanation",
-           "GuardrailExplanation", "ObservationsSummary", "StrategyExplanation", "__version__"]
+__all__ = ["Engine", "Constraints", "Observation", "ContinuousObservation", "ObservationTable",
+           "AllocationResult",
+           "ComputeRequest", "AllocationExplanation", "GuardrailExplanation",
+           "ObservationsSummary", "StrategyExplanation", "PosteriorStats", "__version__"]
 
 __version__ = "0.0.0"
@@ -0,0 +1,185 @@
+"""Minimal msgpack encoder/decoder (stdlib only).
+
+Covers the types explanations contain: None, bool, int, float, str, bytes, lists,
+tuples and mappings. Output is standard msgpack, readable by any msgpack library;
+floats are always encoded as float64 so values round-trip exactly. Tuples decode as
+lists.
+"""
+from __future__ import annotations
+
+import struct
+from collections.abc import Mapping
+from typing import Any
+
+_pack_f64 = struct.Struct(">d").pack
+_unpack_f64 = struct.Struct(">d").unpack_from
+
+
+def packb(obj: Any) -> bytes:
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+def _pack_header(out: bytearray, n: int, fix: int, fix_max: int, c16: int, c32: int) -> None:
+    if n <= fix_max:
+        out.append(fix | n)
+    elif n <= 0xFFFF:
+        out.append(c16)
+        out += n.to_bytes(2, "big")
+    else:
+        out.append(c32)
+        out += n.to_bytes(4, "big")
+
+
+def _pack(obj: Any, out: bytearray) -> None:
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += _pack_f64(obj)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        n = len(data)
+        if n <= 31:
+            out.append(0xA0 | n)
+        elif n <= 0xFF:
+            out.append(0xD9)
+            out.append(n)
+        else:
+            _pack_header(out, n, 0, -1, 0xDA, 0xDB)
+        out += data
+    elif isinstance(obj, Mapping):
+        _pack_header(out, len(obj), 0x80, 15, 0xDE, 0xDF)
+        for key, value in obj.items():
+            _pack(key, out)
+            _pack(value, out)
+    elif isinstance(obj, (list, tuple)):
+        _pack_header(out, len(obj), 0x90, 15, 0xDC, 0xDD)
+        for item in obj:
+            _pack(item, out)
+    elif isinstance(obj, (bytes, bytearray)):
+        n = len(obj)
+        if n <= 0xFF:
+            out.append(0xC4)
+            out.append(n)
+        else:
+            _pack_header(out, n, 0, -1, 0xC5, 0xC6)
+        out += obj
+    else:
+        raise TypeError(f"cannot msgpack-encode {type(obj).__name__}")
+
+
+def _pack_int(n: int, out: bytearray) -> None:
+    if 0 <= n <= 0x7F:
+        out.append(n)
+    elif -32 <= n < 0:
+        out.append(n & 0xFF)
+    elif n >= 0:
+        if n <= 0xFF:
+            out.append(0xCC)
+            out.append(n)
+        elif n <= 0xFFFF:
+            out.append(0xCD)
+            out += n.to_bytes(2, "big")
+        elif n <= 0xFFFFFFFF:
+            out.append(0xCE)
+            out += n.to_bytes(4, "big")
+        elif n <= 0xFFFFFFFFFFFFFFFF:
+            out.append(0xCF)
+            out += n.to_bytes(8, "big")
+        else:
+            raise OverflowError("int too large for msgpack")
+    else:
+        for code, size in ((0xD0, 1), (0xD1, 2), (0xD2, 4), (0xD3, 8)):
+            if n >= -(1 << (8 * size - 1)):
+                out.append(code)
+                out += n.to_bytes(size, "big", signed=True)
+                return
+        raise OverflowError("int too large for msgpack")
+
+
+def unpackb(data: bytes) -> Any:
+    view = memoryview(data)
+    obj, pos = _unpack(view, 0)
+    if pos != len(view):
+        raise ValueError("extra bytes after msgpack object")
+    return obj
+
+
+def _uint(view: memoryview, pos: int, size: int) -> int:
+    return int.from_bytes(view[pos : pos + size], "big")
+
+
+def _unpack(view: memoryview, pos: int) -> tuple[Any, int]:
+    code = view[pos]
+    pos += 1
+
+    if code <= 0x7F:
+        return code, pos
+    if code >= 0xE0:
+        return code - 0x100, pos
+    if 0xA0 <= code <= 0xBF:
+        n = code & 0x1F
+        return str(view[pos : pos + n], "utf-8"), pos + n
+    if 0x80 <= code <= 0x8F:
+        return _unpack_map(view, pos, code & 0x0F)
+    if 0x90 <= code <= 0x9F:
+        return _unpack_array(view, pos, code & 0x0F)
+
+    if code == 0xC0:
+        return None, pos
+    if code == 0xC2:
+        return False, pos
+    if code == 0xC3:
+        return True, pos
+    if code == 0xCB:
+        return _unpack_f64(view, pos)[0], pos + 8
+    if code == 0xCA:
+        return struct.unpack_from(">f", view, pos)[0], pos + 4
+    if 0xCC <= code <= 0xCF:
+        size = 1 << (code - 0xCC)
+        return _uint(view, pos, size), pos + size
+    if 0xD0 <= code <= 0xD3:
+        size = 1 << (code - 0xD0)
+        return int.from_bytes(view[pos : pos + size], "big", signed=True), pos + size
+    if code in (0xD9, 0xDA, 0xDB):
+        size = 1 << (code - 0xD9)
+        n = _uint(view, pos, size)
+        pos += size
+        return str(view[pos : pos + n], "utf-8"), pos + n
+    if code in (0xC4, 0xC5, 0xC6):
+        size = 1 << (code - 0xC4)
+        n = _uint(view, pos, size)
+        pos += size
+        return bytes(view[pos : pos + n]), pos + n
+    if code in (0xDC, 0xDD):
+        size = 2 if code == 0xDC else 4
+        return _unpack_array(view, pos + size, _uint(view, pos, size))
+    if code in (0xDE, 0xDF):
+        size = 2 if code == 0xDE else 4
+        return _unpack_map(view, pos + size, _uint(view, pos, size))
+
+    raise ValueError(f"unsupported msgpack type byte: 0x{code:02x}")
+
+
+def _unpack_array(view: memoryview, pos: int, n: int) -> tuple[list[Any], int]:
+    items = []
+    for _ in range(n):
+        item, pos = _unpack(view, pos)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(view: memoryview, pos: int, n: int) -> tuple[dict[Any, Any], int]:
+    out = {}
+    for _ in range(n):
+        key, pos = _unpack(view, pos)
+        out[key], pos = _unpack(view, pos)
+    return out, pos
@@ -0,0 +1,28 @@
+"""Optional NumPy support.
+
+NumPy is not a runtime dependency of this library. Modules that can make use of it
+import it through these helpers so the fallback behavior lives in one place.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+
+def optional_numpy() -> Any | None:
+    """Return the numpy module, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def require_numpy(feature: str) -> Any:
+    """Return the numpy module, or raise ImportError naming the feature that needs it."""
+    np = optional_numpy()
+    if np is None:
+        raise ImportError(
+            f"{feature} requires numpy; install it with "
+            "`pip install adaptive-experimentation[numpy]`"
+        )
+    return np
@@ -0,0 +1,205 @@
+"""Regularized incomplete beta function and its inverse (stdlib only).
+
+Used for Beta posterior quantiles (Bayes-UCB, credible intervals) without SciPy.
+betainc follows the continued-fraction evaluation of Numerical Recipes (modified
+Lentz); betaincinv is a Newton iteration safeguarded by bisection. betaincinv_array
+runs the same iterations on NumPy arrays, for all variants at once.
+"""
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import Any
+
+from ._numpy import require_numpy
+
+_EPS = 1e-15
+_TINY = 1e-300
+_MAX_CF_TERMS = 10_000
+_MAX_INV_ITERATIONS = 200
+_STD_NORMAL = NormalDist()
+# Relative tolerance on the quantile.
+_INV_TOL = 1e-13
+
+
+def _log_beta(a: float, b: float) -> float:
+    return math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)
+
+
+def _beta_cf(a: float, b: float, x: float) -> float:
+    """Continued fraction for I_x(a, b), valid for x < (a + 1) / (a + b + 2)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > _TINY else _TINY)
+    h = d
+    for m in range(1, _MAX_CF_TERMS + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > _TINY else _TINY)
+        c = 1.0 + aa / c
+        c = c if abs(c) > _TINY else _TINY
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > _TINY else _TINY)
+        c = 1.0 + aa / c
+        c = c if abs(c) > _TINY else _TINY
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < _EPS:
+            return h
+    raise ArithmeticError(f"betainc did not converge for a={a}, b={b}, x={x}")
+
+
+def betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta I_x(a, b), the CDF of Beta(a, b) at x."""
+    if a <= 0.0 or b <= 0.0:
+        raise ValueError("a and b must be > 0")
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = a * math.log(x) + b * math.log1p(-x) - _log_beta(a, b)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_cf(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _beta_cf(b, a, 1.0 - x) / b
+
+
+def betaincinv(a: float, b: float, p: float) -> float:
+    """Inverse of betainc in x: the p-quantile of Beta(a, b)."""
+    if a <= 0.0 or b <= 0.0:
+        raise ValueError("a and b must be > 0")
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("p must be in [0, 1]")
+    if p == 0.0:
+        return 0.0
+    if p == 1.0:
+        return 1.0
+
+    log_norm = _log_beta(a, b)
+    lo, hi = 0.0, 1.0
+    # Start from the normal approximation, clipped away from the bounds.
+    mean = a / (a + b)
+    sd = math.sqrt(a * b / ((a + b) ** 2 * (a + b + 1.0)))
+    x = min(max(mean + _STD_NORMAL.inv_cdf(p) * sd, 1e-12), 1.0 - 1e-12)
+    for _ in range(_MAX_INV_ITERATIONS):
+        err = betainc(a, b, x) - p
+        if err == 0.0:
+            return x
+        if err > 0.0:
+            hi = x
+        else:
+            lo = x
+        log_pdf = (a - 1.0) * math.log(x) + (b - 1.0) * math.log1p(-x) - log_norm
+        pdf = math.exp(log_pdf) if log_pdf < 700.0 else math.inf
+        step = err / pdf if pdf > 0.0 else math.inf
+        if abs(step) <= _INV_TOL * x:
+            return x - step
+        nxt = x - step
+        if not lo < nxt < hi:
+            # Newton left the bracket; bisect instead.
+            nxt = 0.5 * (lo + hi)
+            if hi - lo <= _INV_TOL * nxt:
+                return nxt
+        x = nxt
+    return x
+
+
+def _log_beta_array(a: Any, b: Any) -> Any:
+    np = require_numpy("betaincinv_array")
+    # NumPy has no lgamma; apply math.lgamma elementwise.
+    lgamma = np.frompyfunc(math.lgamma, 1, 1)
+    return (lgamma(a) + lgamma(b) - lgamma(a + b)).astype(np.float64)
+
+
+def _beta_cf_array(a: Any, b: Any, x: Any) -> Any:
+    """Vectorized _beta_cf; every element must satisfy x < (a + 1) / (a + b + 2)."""
+    np = require_numpy("betaincinv_array")
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+
+    def clamp(v: Any) -> Any:
+        return np.where(np.abs(v) > _TINY, v, _TINY)
+
+    c = np.ones_like(x)
+    d = 1.0 / clamp(1.0 - qab * x / qap)
+    h = d.copy()
+    active = np.ones(x.shape, dtype=bool)
+    for m in range(1, _MAX_CF_TERMS + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 / clamp(1.0 + aa * d)
+        c = clamp(1.0 + aa / c)
+        h = np.where(active, h * d * c, h)
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 / clamp(1.0 + aa * d)
+        c = clamp(1.0 + aa / c)
+        delta = d * c
+        h = np.where(active, h * delta, h)
+        active &= np.abs(delta - 1.0) >= _EPS
+        if not active.any():
+            return h
+    raise ArithmeticError("betainc did not converge")
+
+
+def betainc_array(a: Any, b: Any, x: Any) -> Any:
+    """Vectorized betainc for float64 arrays a, b > 0 and x strictly inside (0, 1)."""
+    np = require_numpy("betaincinv_array")
+    log_front = a * np.log(x) + b * np.log1p(-x) - _log_beta_array(a, b)
+    direct = x < (a + 1.0) / (a + b + 2.0)
+    # Evaluate the continued fraction on whichever side converges, as in betainc.
+    cf = _beta_cf_array(
+        np.where(direct, a, b), np.where(direct, b, a), np.where(direct, x, 1.0 - x)
+    )
+    front = np.exp(log_front) * cf
+    return np.where(direct, front / a, 1.0 - front / b)
+
+
+def betaincinv_array(a: Any, b: Any, p: float) -> Any:
+    """
+    p-quantiles of Beta(a[i], b[i]) for float64 arrays a, b > 0.
+
+    The same safeguarded Newton iteration as betaincinv, run on all elements at
+    once; elements stop updating as they converge.
+    """
+    np = require_numpy("betaincinv_array")
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if (a <= 0.0).any() or (b <= 0.0).any():
+        raise ValueError("a and b must be > 0")
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("p must be in [0, 1]")
+    if p in (0.0, 1.0):
+        return np.full(a.shape, p)
+
+    log_norm = _log_beta_array(a, b)
+    lo, hi = np.zeros_like(a), np.ones_like(a)
+    mean = a / (a + b)
+    sd = np.sqrt(a * b / ((a + b) ** 2 * (a + b + 1.0)))
+    x = np.clip(mean + _STD_NORMAL.inv_cdf(p) * sd, 1e-12, 1.0 - 1e-12)
+    active = np.ones(a.shape, dtype=bool)
+    for _ in range(_MAX_INV_ITERATIONS):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        ai, bi, xi = a[idx], b[idx], x[idx]
+        err = betainc_array(ai, bi, xi) - p
+        lo[idx] = np.where(err < 0.0, xi, lo[idx])
+        hi[idx] = np.where(err > 0.0, xi, hi[idx])
+        log_pdf = (ai - 1.0) * np.log(xi) + (bi - 1.0) * np.log1p(-xi) - log_norm[idx]
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            pdf = np.exp(np.minimum(log_pdf, 700.0))
+            step = np.where(pdf > 0.0, err / pdf, np.inf)
+        step = np.where(err == 0.0, 0.0, step)
+
+        converged = np.abs(step) <= _INV_TOL * xi
+        nxt = xi - step
+        outside = ~converged & ~((lo[idx] < nxt) & (nxt < hi[idx]))
+        # Newton left the bracket; bisect instead.
+        mid = 0.5 * (lo[idx] + hi[idx])
+        nxt = np.where(outside, mid, nxt)
+        converged |= outside & (hi[idx] - lo[idx] <= _INV_TOL * mid)
+        x[idx] = nxt
+        active[idx[converged]] = False
+    return x
@@ -0,0 +1,318 @@
+"""Contextual allocation with a linear bandit model.
+
+Running Engine.compute once per segment (device, country, ...) learns every segment
+from scratch. LinearContextualBandit instead shares one ridge-regression model per
+variant across segments: the expected reward of variant a in context x is x . theta_a.
+
+Each variant keeps the sufficient statistics of its regression,
+
+    A_a = ridge * I + sum(x x^T)      b_a = sum(reward * x)
+
+stored as A_a^-1 and updated in O(d^2) per event with the Sherman-Morrison rank-1
+formula, so the model is never refit. Weights for many segments are scored in one
+batched evaluation and passed through apply_guardrails_array.
+
+Requires NumPy (`pip install adaptive-experimentation[numpy]`).
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from ._numpy import require_numpy
+from .explanations import (
+    AllocationExplanation,
+    GuardrailExplanation,
+    ObservationsSummary,
+    StrategyExplanation,
+)
+from .guardrails import apply_guardrails_array
+from .types import AllocationResult, Constraints, VariantId
+from .validation import ValidationError, validate_previous_weights
+
+POLICIES = ("thompson", "ucb")
+
+# Upper bound on (samples x contexts x variants) Monte Carlo draws held at once.
+_MAX_DRAWS = 1 << 22
+
+
+class LinearContextualBandit:
+    """
+    Linear Thompson Sampling / LinUCB over a fixed set of variants.
+
+    policy="thompson": each variant's reward in context x is Normal(x . theta_a,
+      exploration^2 * x^T A_a^-1 x); weights are P(variant has the highest reward)
+      estimated from num_samples joint draws per context.
+    policy="ucb": score = x . theta_a + exploration * sqrt(x^T A_a^-1 x); the top
+      variant gets all proposed weight (ties split evenly), and guardrails then limit
+      the step and apply floors.
+
+    Updates and scoring are safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        variant_ids: Iterable[VariantId],
+        num_features: int,
+        *,
+        policy: str = "thompson",
+        ridge: float = 1.0,
+        exploration: float = 1.0,
+        num_samples: int = 1000,
+    ) -> None:
+        np = require_numpy("LinearContextualBandit")
+        ids = tuple(dict.fromkeys(variant_ids))
+        if len(ids) < 1:
+            raise ValueError("variant_ids must be non-empty")
+        if num_features < 1:
+            raise ValueError("num_features must be >= 1")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}; got {policy!r}")
+        if ridge <= 0.0:
+            raise ValueError("ridge must be > 0")
+        if exploration < 0.0:
+            raise ValueError("exploration must be >= 0")
+        if num_samples < 1:
+            raise ValueError("num_samples must be >= 1")
+
+        self.policy = policy
+        self.ridge = float(ridge)
+        self.exploration = float(exploration)
+        self.num_samples = int(num_samples)
+        self._ids = ids
+        self._positions = {vid: i for i, vid in enumerate(ids)}
+        self._d = int(num_features)
+
+        k, d = len(ids), self._d
+        self._a_inv = np.broadcast_to(np.eye(d) / self.ridge, (k, d, d)).copy()
+        self._b = np.zeros((k, d))
+        self._trials = np.zeros(k, dtype=np.int64)
+        self._reward_sum = np.zeros(k)
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return f"linear_{self.policy}"
+
+    @property
+    def variant_ids(self) -> tuple[VariantId, ...]:
+        return self._ids
+
+    @property
+    def num_features(self) -> int:
+        return self._d
+
+    def trials(self) -> dict[VariantId, int]:
+        """Number of updates recorded per variant."""
+        with self._lock:
+            return dict(zip(self._ids, self._trials.tolist(), strict=True))
+
+    def coefficients(self) -> Any:
+        """Ridge estimates theta_a = A_a^-1 b_a, shape (variants, features)."""
+        np = require_numpy("LinearContextualBandit")
+        with self._lock:
+            return np.einsum("kde,ke->kd", self._a_inv, self._b)
+
+    def update(self, variant_id: VariantId, context: Sequence[float], reward: float) -> None:
+        """Record one observed reward for variant_id served in context."""
+        self.update_many([variant_id], [context], [reward])
+
+    def update_many(
+        self,
+        variant_ids: Sequence[VariantId],
+        contexts: Any,
+        rewards: Sequence[float],
+    ) -> None:
+        """Record a batch of (variant, context, reward) events, one rank-1 update each."""
+        np = require_numpy("LinearContextualBandit")
+        x = self._contexts(contexts)
+        r = np.asarray(rewards, dtype=np.float64).reshape(-1)
+        if not (len(variant_ids) == len(x) == len(r)):
+            raise ValidationError("variant_ids, contexts and rewards must have the same length")
+        if not np.isfinite(r).all():
+            raise ValidationError("rewards must be finite")
+        idx = [self._position(vid) for vid in variant_ids]
+
+        with self._lock:
+            a_inv, b = self._a_inv, self._b
+            for j, xi, ri in zip(idx, x, r, strict=True):
+                # Sherman-Morrison: (A + x x^T)^-1 = A^-1 - (A^-1 x)(A^-1 x)^T / (1 + x^T A^-1 x)
+                u = a_inv[j] @ xi
+                a_inv[j] -= np.outer(u, u) / (1.0 + xi @ u)
+                b[j] += ri * xi
+            np.add.at(self._trials, idx, 1)
+            np.add.at(self._reward_sum, idx, r)
+
+    def propose_weights(self, contexts: Any, *, seed: int | None = None) -> Any:
+        """Proposed (pre-guardrail) weights, shape (contexts, variants)."""
+        a_inv, b, _, _ = self._snapshot()
+        mean, width = self._scores(self._contexts(contexts), a_inv, b)
+        return self._weights(mean, width, seed=seed)
+
+    def compute(
+        self,
+        contexts: Mapping[str, Sequence[float]],
+        previous_weights: Mapping[str, Mapping[VariantId, float]],
+        constraints: Constraints,
+        *,
+        seed: int | None = None,
+        explain: bool = True,
+    ) -> dict[str, AllocationResult]:
+        """
+        Compute guarded weights for every segment in one batched evaluation.
+
+        contexts maps segment id -> feature vector; previous_weights maps segment id ->
+        the weights currently served in that segment. min_trials applies to the
+        per-variant update counts shared by all segments. Returns results keyed by
+        segment id in the order of contexts. Each segment's previous_weights are validated
+        like Engine.compute's: within [0, 1] and summing to 1.
+        """
+        np = require_numpy("LinearContextualBandit")
+        segments = list(contexts)
+        if not segments:
+            return {}
+        missing = [s for s in segments if s not in previous_weights]
+        if missing:
+            raise ValidationError(f"previous_weights missing for segments: {sorted(missing)}")
+        prev = np.empty((len(segments), len(self._ids)))
+        # validate_previous_weights only compares keys against the observations mapping.
+        variants = dict.fromkeys(self._ids)
+        for row, segment in enumerate(segments):
+            weights = previous_weights[segment]
+            if set(weights) != set(self._ids):
+                raise ValidationError(
+                    f"previous_weights for segment {segment!r} must cover exactly the "
+                    f"bandit's variants {list(self._ids)}"
+                )
+            try:
+                validate_previous_weights(
+                    weights, observations=variants, epsilon=constraints.epsilon
+                )
+            except ValidationError as exc:
+                raise ValidationError(f"segment {segment!r}: {exc}") from None
+            prev[row] = [weights[vid] for vid in self._ids]
+
+        x = self._contexts([contexts[s] for s in segments])
+        # One consistent model state for scoring, guardrails and the summary.
+        a_inv, b, trials, reward_sum = self._snapshot()
+        mean, width = self._scores(x, a_inv, b)
+        proposed = self._weights(mean, width, seed=seed)
+
+        final, deltas = apply_guardrails_array(
+            variant_ids=self._ids,
+            trials=np.broadcast_to(trials, prev.shape),
+            previous_weights=prev,
+            proposed_weights=proposed,
+            constraints=constraints,
+        )
+
+        results: dict[str, AllocationResult] = {}
+        for row, segment in enumerate(segments):
+            weights = dict(zip(self._ids, final[row].tolist(), strict=True))
+            if not explain:
+                results[segment] = AllocationResult(weights=weights, explanation=None)
+                continue
+            delta = deltas[row]
+            results[segment] = AllocationResult(
+                weights=weights,
+                explanation=AllocationExplanation(
+                    strategy=StrategyExplanation(
+                        name=self.name,
+                        details=self._details(x[row], mean[row], width[row], seed),
+                    ),
+                    observations=ObservationsSummary(
+                        num_variants=len(self._ids),
+                        total_trials=int(trials.sum()),
+                        total_successes=float(reward_sum.sum()),
+                    ),
+                    proposed_weights=dict(zip(self._ids, proposed[row].tolist(), strict=True)),
+                    final_weights=dict(weights),
+                    guardrails=GuardrailExplanation(
+                        changed=bool(delta.get("changed", True)),
+                        hold_reason=delta.get("hold_reason"),
+                        guardrails_applied=tuple(delta.get("guardrails_applied", ())),
+                        max_step_clamps=delta.get("max_step_clamps"),
+                        min_weight_floors=delta.get("min_weight_floors"),
+                    ),
+                ),
+            )
+        return results
+
+    def _position(self, vid: VariantId) -> int:
+        try:
+            return self._positions[vid]
+        except KeyError:
+            raise ValidationError(f"unknown variant {vid!r}") from None
+
+    def _contexts(self, contexts: Any) -> Any:
+        np = require_numpy("LinearContextualBandit")
+        x = np.asarray(contexts, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        if x.ndim != 2 or x.shape[1] != self._d:
+            raise ValidationError(
+                f"contexts must have {self._d} features each; got shape {tuple(x.shape)}"
+            )
+        if not np.isfinite(x).all():
+            raise ValidationError("contexts must be finite")
+        return x
+
+    def _snapshot(self) -> tuple[Any, Any, Any, Any]:
+        """Copy (A^-1, b, trials, reward_sum) under a single lock acquisition."""
+        with self._lock:
+            return (
+                self._a_inv.copy(),
+                self._b.copy(),
+                self._trials.copy(),
+                self._reward_sum.copy(),
+            )
+
+    def _scores(self, x: Any, a_inv: Any, b: Any) -> tuple[Any, Any]:
+        """Return (mean, width) per (context, variant): x . theta_a and sqrt(x^T A_a^-1 x)."""
+        np = require_numpy("LinearContextualBandit")
+        theta = np.einsum("kde,ke->kd", a_inv, b)
+        mean = x @ theta.T
+        variance = np.einsum("md,kde,me->mk", x, a_inv, x)
+        return mean, np.sqrt(np.maximum(variance, 0.0))
+
+    def _weights(self, mean: Any, width: Any, *, seed: int | None) -> Any:
+        np = require_numpy("LinearContextualBandit")
+        m, k = mean.shape
+        if self.policy == "ucb":
+            ucb = mean + self.exploration * width
+            top = ucb >= ucb.max(axis=1, keepdims=True)
+            return top / top.sum(axis=1, keepdims=True)
+
+        rng = np.random.default_rng(seed)
+        sd = self.exploration * width
+        wins = np.zeros((m, k))
+        rows = max(1, _MAX_DRAWS // (self.num_samples * k))
+        for start in range(0, m, rows):
+            stop = min(m, start + rows)
+            draws = rng.normal(
+                mean[start:stop], sd[start:stop], size=(self.num_samples, stop - start, k)
+            )
+            best = draws.argmax(axis=2)
+            for j in range(k):
+                wins[start:stop, j] = (best == j).sum(axis=0)
+        return wins / self.num_samples
+
+    def _details(self, x: Any, mean: Any, width: Any, seed: int | None) -> dict[str, object]:
+        details: dict[str, object] = {
+            "strategy": self.name,
+            "ridge": self.ridge,
+            "exploration": self.exploration,
+            "context": x.tolist(),
+            "expected_reward": dict(zip(self._ids, mean.tolist(), strict=True)),
+            "uncertainty": dict(zip(self._ids, width.tolist(), strict=True)),
+        }
+        if self.policy == "thompson":
+            details["num_samples"] = self.num_samples
+            details["seed"] = seed
+        else:
+            details["ucb"] = {
+                vid: mu + self.exploration * w
+                for vid, mu, w in zip(self._ids, mean.tolist(), width.tolist(), strict=True)
+            }
+        return details
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from dataclasses import dataclass
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
 
 from .explanations import (
     AllocationExplanation,
@@ -9,7 +11,26 @@ from .explanations import (
     ObservationsSummary,
     StrategyExplanation,
 )
-from .types import AllocationResult, Constraints, Observation, VariantId
+from .guardrails import apply_guardrails, cooldown_remaining_s
+from .instrumentation import Tracer
+from .posterior import PosteriorStats, summarize
+from .strategies.base import Strategy
+from .strategies.registry import get_strategy
+from .types import (
+    AllocationResult,
+    ComputeRequest,
+    Constraints,
+    Observation,
+    VariantId,
+    is_continuous,
+    observation_columns,
+)
+from .validation import (
+    ValidationError,
+    validate_observation_kind,
+    validate_observations,
+    validate_previous_weights,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,9 +39,29 @@ class Engine:
     Computes new traffic allocation weights for adaptive experimentation.
 
     This class is intentionally stateless and infrastructure-agnostic.
+
+    strategy names a registered strategy (see strategies.registry), and
+    strategy_params are passed to its constructor, e.g.
+    Engine(strategy="thompson", strategy_params={"prior_success": 2.0}).
+    Strategy instances are cached per (strategy, strategy_params).
+
+    tracer, if given, receives per-stage durations and counters (see
+    instrumentation.Tracer). With the default None no timing is taken.
+
+    explain=False is a lean mode for fleet recomputes and simulations: results carry
+    the same weights but explanation is None, and strategies skip building their
+    explanation details (Strategy.propose_weights).
+
+    posterior_stats, if given, adds Beta posterior means, credible intervals and
+    optionally P(best) to StrategyExplanation.details["posterior_stats"] for binary
+    observations (see posterior.PosteriorStats). Quantiles are cached across calls.
     """
 
     strategy: str = "heuristic"
+    strategy_params: Mapping[str, Any] | None = field(default=None, hash=False)
+    tracer: Tracer | None = field(default=None, hash=False, compare=False)
+    explain: bool = True
+    posterior_stats: PosteriorStats | None = None
 
     def compute(
         self,
@@ -35,28 +76,172 @@ class Engine:
         """
         Compute new weights based on observations, prior weights, and guardrails.
 
-        Note: Implementation intentionally deferred. Epic #3 will implement a minimal strategy.
+        If both last_updated_at_epoch_s and now_epoch_s are given and the experiment
+        is still inside constraints.cooldown_seconds, the previous weights are held
+        before any validation or strategy sampling happens (see check_cooldown).
+
+        An ObservationTable built with the constructor (or after validate()) was
+        checked once when it was built, so its rows are not checked again here.
         """
-        if constraints is None:
-            constraints = Constraints()
+        constraints = constraints if constraints is not None else Constraints()
+        held = self.check_cooldown(
+            previous_weights,
+            constraints=constraints,
+            last_updated_at_epoch_s=last_updated_at_epoch_s,
+            now_epoch_s=now_epoch_s,
+        )
+        if held is not None:
+            return held
 
-        # Validate inputs
-        from .guardrails import apply_guardrails
-        from .validation import validate_observations, validate_previous_weights
+        return self._compute(
+            self._strategy(),
+            observations=observations,
+            previous_weights=previous_weights,
+            constraints=constraints,
+            seed=seed,
+        )
 
+    def check_cooldown(
+        self,
+        previous_weights: Mapping[VariantId, float],
+        *,
+        constraints: Constraints | None = None,
+        last_updated_at_epoch_s: int | None,
+        now_epoch_s: int | None,
+    ) -> AllocationResult | None:
+        """
+        Return a hold result if the experiment is inside its cooldown, else None.
+
+        This needs only the previous weights, so callers can skip fetching
+        observations entirely for experiments that are cooling down. Observations
+        are not consulted, so the observation summary of a hold reports zero totals.
+        """
+        constraints = constraints if constraints is not None else Constraints()
+        tracer = self.tracer
+        t0 = time.perf_counter() if tracer is not None else 0.0
+        remaining = cooldown_remaining_s(
+            constraints,
+            last_updated_at_epoch_s=last_updated_at_epoch_s,
+            now_epoch_s=now_epoch_s,
+        )
+        if remaining <= 0:
+            return None
+
+        weights = dict(previous_weights)
+        if tracer is not None:
+            tracer.on_stage(
+                "cooldown", time.perf_counter() - t0, {"held": 1, "variants": len(weights)}
+            )
+        if not self.explain:
+            return AllocationResult(weights=weights, explanation=None)
+
+        explanation = AllocationExplanation(
+            strategy=StrategyExplanation(
+                name=self.strategy,
+                details={
+                    "skipped": "cooldown_active",
+                    "cooldown_seconds": constraints.cooldown_seconds,
+                    "cooldown_remaining_s": remaining,
+                    "last_updated_at_epoch_s": last_updated_at_epoch_s,
+                    "now_epoch_s": now_epoch_s,
+                },
+            ),
+            observations=ObservationsSummary(
+                num_variants=len(weights), total_trials=0, total_successes=0
+            ),
+            proposed_weights=dict(weights),
+            final_weights=dict(weights),
+            guardrails=GuardrailExplanation(
+                changed=False,
+                hold_reason="cooldown_active",
+                guardrails_applied=("cooldown_hold",),
+            ),
+        )
+        return AllocationResult(weights=weights, explanation=explanation)
+
+    def compute_many(
+        self,
+        requests: Iterable[ComputeRequest | tuple],
+    ) -> dict[str, AllocationResult]:
+        """
+        Compute new weights for a batch of experiments in one call.
+
+        Each request is a ComputeRequest (or a plain tuple in the same field order:
+        experiment_id, observations, previous_weights, constraints, seed, and
+        optionally last_updated_at_epoch_s, now_epoch_s for cooldown).
+
+        The strategy instance and default constraints are shared across the batch.
+        Results are keyed by experiment_id in input order, and each result is identical
+        to what compute() returns for the same inputs.
+        """
+        strategy = self._strategy()
+        default_constraints = Constraints()
+
+        results: dict[str, AllocationResult] = {}
+        for request in requests:
+            req = request if isinstance(request, ComputeRequest) else ComputeRequest(*request)
+            if req.experiment_id in results:
+                raise ValidationError(f"duplicate experiment_id in batch: {req.experiment_id!r}")
+
+            constraints = req.constraints if req.constraints is not None else default_constraints
+            held = self.check_cooldown(
+                req.previous_weights,
+                constraints=constraints,
+                last_updated_at_epoch_s=req.last_updated_at_epoch_s,
+                now_epoch_s=req.now_epoch_s,
+            )
+            if held is not None:
+                results[req.experiment_id] = held
+                continue
+
+            results[req.experiment_id] = self._compute(
+                strategy,
+                observations=req.observations,
+                previous_weights=req.previous_weights,
+                constraints=constraints,
+                seed=req.seed,
+            )
+
+        return results
+
+    def _strategy(self) -> Strategy:
+        return get_strategy(self.strategy, **(self.strategy_params or {}))
+
+    def _compute(
+        self,
+        strategy: Strategy,
+        *,
+        observations: Mapping[VariantId, Observation],
+        previous_weights: Mapping[VariantId, float],
+        constraints: Constraints,
+        seed: int | None,
+    ) -> AllocationResult:
+        tracer = self.tracer
+        t0 = time.perf_counter() if tracer is not None else 0.0
+
+        # Validate inputs
         validate_observations(observations)
         validate_previous_weights(
             previous_weights,
             observations=observations,
             epsilon=constraints.epsilon,
         )
+        validate_observation_kind(
+            observations,
+            kind=getattr(strategy, "observation_kind", "binary"),
+            strategy=self.strategy,
+        )
+        if tracer is not None:
+            t0 = self._trace(tracer, "validation", t0, {"variants": len(observations)})
 
         # Propose raw weights via selected strategy
-        from .strategies.registry import get_strategy
-
-        strategy = get_strategy(self.strategy)
-        strategy_result = strategy.propose(observations, seed=seed)
-        proposed = strategy_result.proposed_weights
+        if self.explain:
+            strategy_result = strategy.propose(observations, seed=seed)
+            proposed = strategy_result.proposed_weights
+        else:
+            proposed = strategy.propose_weights(observations, seed=seed)
+        if tracer is not None:
+            t0 = self._trace(tracer, "strategy", t0, {"variants": len(proposed)})
 
         # Apply guardrails
         final_weights, guardrail_expl = apply_guardrails(
@@ -65,18 +250,46 @@ class Engine:
             proposed_weights=proposed,
             constraints=constraints,
         )
+        if tracer is not None:
+            t0 = self._trace(
+                tracer,
+                "guardrails",
+                t0,
+                {
+                    "variants": len(final_weights),
+                    "held": int(guardrail_expl.get("hold_reason") is not None),
+                    "clamp_hits": len(guardrail_expl.get("max_step_clamps") or ()),
+                    "floor_hits": len(guardrail_expl.get("min_weight_floors") or ()),
+                },
+            )
+
+        if not self.explain:
+            return AllocationResult(weights=final_weights, explanation=None)
 
         # Build typed explanation
+        variant_ids, trials, successes = observation_columns(observations)
         obs_summary = ObservationsSummary(
             num_variants=len(observations),
-            total_trials=sum(o.trials for o in observations.values()),
-            total_successes=sum(o.successes for o in observations.values()),
+            total_trials=sum(trials),
+            total_successes=sum(successes),
         )
 
-        strategy_expl = StrategyExplanation(
-            name=self.strategy,
-            details=dict(strategy_result.explanation),
-        )
+        details = dict(strategy_result.explanation)
+        if self.posterior_stats is not None and not is_continuous(observations):
+            # Registered strategies need not subclass Strategy, so the hook is optional.
+            beta_posterior = getattr(strategy, "beta_posterior", None)
+            params = beta_posterior(observations) if beta_posterior is not None else None
+            if params is None:
+                prior = "uniform"
+                alpha = [1.0 + s for s in successes]
+                beta = [1.0 + (t - s) for t, s in zip(trials, successes, strict=True)]
+            else:
+                prior = "strategy"
+                alpha, beta = params
+            stats = summarize(variant_ids, alpha, beta, self.posterior_stats)
+            stats["prior"] = prior
+            details["posterior_stats"] = stats
+        strategy_expl = StrategyExplanation(name=self.strategy, details=details)
 
         guardrails_expl = GuardrailExplanation(
             changed=bool(guardrail_expl.get("changed", True)),
@@ -94,5 +307,14 @@ class Engine:
             final_weights=dict(final_weights),
             guardrails=guardrails_expl,
         )
+        if tracer is not None:
+            self._trace(tracer, "explanation", t0, {"variants": len(final_weights)})
 
         return AllocationResult(weights=final_weights, explanation=explanation)
+
+    @staticmethod
+    def _trace(tracer: Tracer, stage: str, t0: float, counters: Mapping[str, int]) -> float:
+        """Report the stage that started at t0 and return the next stage's start."""
+        t1 = time.perf_counter()
+        tracer.on_stage(stage, t1 - t0, counters)
+        return t1
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Mapping
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
+from . import _msgpack
 from .types import VariantId
 
 
+def _plain(value: Any) -> Any:
+    """Copy nested mappings/lists into plain dicts/lists (what asdict does, minus deepcopy)."""
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    # The encoder handles dict/list/tuple natively; other mappings are converted.
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 @dataclass(frozen=True, slots=True)
 class StrategyExplanation:
     """
@@ -15,6 +35,8 @@ class StrategyExplanation:
     details keys vary by strategy:
     - heuristic: {"alpha": float, "seed_used": bool, ...}
     - thompson: {"priors": {...}, "posterior": {...}, "samples": {...}, "seed": int | None}
+    - ucb1 / kl_ucb / bayes_ucb: {"means": {...}, "index": {...}, ...}
+    - any, with Engine(posterior_stats=...): {"posterior_stats": {"level": ..., "variants": {...}}}
     """
     name: str
     details: Mapping[str, Any]
@@ -24,10 +46,13 @@ class StrategyExplanation:
 class ObservationsSummary:
     """
     Summary statistics about the observations provided.
+
+    Totals are floats: decayed counts are fractional, and for continuous rewards
+    total_successes is the sum of rewards. Integer totals are kept as given.
     """
     num_variants: int
-    total_trials: int
-    total_successes: int
+    total_trials: float
+    total_successes: float
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,4 +79,71 @@ class AllocationExplanation:
     guardrails: GuardrailExplanation
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        """Return a plain nested dict; equal to dataclasses.asdict(self)."""
+        return _plain(self._tree())
+
+    def to_json(self) -> str:
+        """
+        Serialize to compact JSON in one encoder pass (no intermediate copies).
+
+        Raises ValueError for NaN or infinite floats, which standard JSON cannot hold.
+        """
+        return json.dumps(
+            self._tree(), separators=(",", ":"), default=_json_default, allow_nan=False
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize to msgpack (compact binary; readable by any msgpack library)."""
+        return _msgpack.packb(self._tree())
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> AllocationExplanation:
+        """Rebuild an explanation from to_dict() output (or decoded JSON/msgpack)."""
+        strategy = data["strategy"]
+        guardrails = data["guardrails"]
+        return cls(
+            strategy=StrategyExplanation(
+                name=strategy["name"], details=dict(strategy["details"])
+            ),
+            observations=ObservationsSummary(**data["observations"]),
+            proposed_weights=dict(data["proposed_weights"]),
+            final_weights=dict(data["final_weights"]),
+            guardrails=GuardrailExplanation(
+                changed=guardrails["changed"],
+                hold_reason=guardrails["hold_reason"],
+                guardrails_applied=tuple(guardrails["guardrails_applied"]),
+                max_step_clamps=guardrails.get("max_step_clamps"),
+                min_weight_floors=guardrails.get("min_weight_floors"),
+            ),
+        )
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> AllocationExplanation:
+        return cls.from_dict(json.loads(text))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> AllocationExplanation:
+        return cls.from_dict(_msgpack.unpackb(data))
+
+    def _tree(self) -> dict[str, Any]:
+        """Shallow dict view over the nested fields; mappings are shared, not copied."""
+        strategy = self.strategy
+        obs = self.observations
+        guardrails = self.guardrails
+        return {
+            "strategy": {"name": strategy.name, "details": strategy.details},
+            "observations": {
+                "num_variants": obs.num_variants,
+                "total_trials": obs.total_trials,
+                "total_successes": obs.total_successes,
+            },
+            "proposed_weights": self.proposed_weights,
+            "final_weights": self.final_weights,
+            "guardrails": {
+                "changed": guardrails.changed,
+                "hold_reason": guardrails.hold_reason,
+                "guardrails_applied": guardrails.guardrails_applied,
+                "max_step_clamps": guardrails.max_step_clamps,
+                "min_weight_floors": guardrails.min_weight_floors,
+            },
+        }
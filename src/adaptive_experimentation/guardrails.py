@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from typing import Any
 
-from .types import Constraints, Observation, VariantId, Weights
+from ._numpy import require_numpy
+from .types import Constraints, Observation, VariantId, Weights, observation_columns
 from .validation import ValidationError
 
 
@@ -13,6 +15,26 @@ def _normalize(weights: Mapping[VariantId, float], *, epsilon: float) -> Weights
     return {k: float(v) / total for k, v in weights.items()}
 
 
+def cooldown_remaining_s(
+    constraints: Constraints,
+    *,
+    last_updated_at_epoch_s: int | None,
+    now_epoch_s: int | None,
+) -> int:
+    """
+    Return seconds left in the cooldown window, or 0 when an update is allowed.
+
+    Cooldown is only enforced when both timestamps are provided. A clock that reads
+    earlier than the last update (skew) is treated as still cooling down.
+    """
+    if last_updated_at_epoch_s is None or now_epoch_s is None:
+        return 0
+    if constraints.cooldown_seconds <= 0:
+        return 0
+    elapsed = int(now_epoch_s) - int(last_updated_at_epoch_s)
+    return max(0, int(constraints.cooldown_seconds) - elapsed)
+
+
 def apply_guardrails(
     *,
     observations: Mapping[VariantId, Observation],
@@ -35,7 +57,10 @@ def apply_guardrails(
         )
 
     # Minimum evidence: hold steady if any variant lacks trials
-    insufficient = [vid for vid, obs in observations.items() if obs.trials < constraints.min_trials]
+    variant_ids, trials, _ = observation_columns(observations)
+    insufficient = [
+        vid for vid, t in zip(variant_ids, trials, strict=True) if t < constraints.min_trials
+    ]
     if insufficient:
         return (
             dict(previous_weights),
@@ -115,3 +140,179 @@ def apply_guardrails(
         explanation["min_weight_floors"] = floor_hits
 
     return normalized, explanation
+
+
+def apply_guardrails_array(
+    *,
+    variant_ids: Sequence[VariantId] | Sequence[Sequence[VariantId]],
+    trials: Any,
+    previous_weights: Any,
+    proposed_weights: Any,
+    constraints: Constraints,
+) -> tuple[Any, dict[str, object] | list[dict[str, object]]]:
+    """
+    Array version of apply_guardrails (requires NumPy).
+
+    trials, previous_weights and proposed_weights are aligned array-likes of shape
+    (n_variants,) or (n_experiments, n_variants). Columns follow variant_ids, which is
+    either one sequence shared by every row or one sequence per row. Each row of
+    previous_weights is validated like Engine.compute's (within [0, 1], summing to 1)
+    and proposed_weights must be finite and non-negative; violations raise
+    ValidationError.
+
+    Clamp, floor, redistribution and normalization run as whole-array operations,
+    so a fleet of experiments can be guarded in one call. Semantics and explanation
+    dicts match apply_guardrails (up to floating-point summation order).
+
+    Returns (final_weights, explanation_delta) for 1-D input, and
+    (final_weights, [explanation_delta per row]) for 2-D input.
+    """
+    np = require_numpy("apply_guardrails_array")
+
+    prev = np.asarray(previous_weights, dtype=np.float64)
+    single = prev.ndim == 1
+    prev = np.atleast_2d(prev)
+    raw = np.atleast_2d(np.asarray(proposed_weights, dtype=np.float64))
+    counts = np.atleast_2d(np.asarray(trials))
+    if raw.shape != prev.shape or counts.shape != prev.shape:
+        raise ValidationError(
+            "trials, previous_weights and proposed_weights must have the same shape; got "
+            f"{counts.shape}, {prev.shape}, {raw.shape}"
+        )
+
+    rows, n = prev.shape
+    if n == 0:
+        raise ValidationError("observations must be non-empty")
+
+    if len(variant_ids) > 0 and not isinstance(variant_ids[0], str):
+        row_ids = [tuple(ids) for ids in variant_ids]
+    else:
+        row_ids = [tuple(variant_ids)] * rows
+    if len(row_ids) != rows or any(len(ids) != n for ids in row_ids):
+        raise ValidationError("variant_ids must match the variant axis of the weight arrays")
+
+    # Same checks as validate_previous_weights, one pass over every row.
+    bad = ~((prev >= 0.0) & (prev <= 1.0))
+    if bad.any():
+        r, c = (int(i) for i in np.argwhere(bad)[0])
+        raise ValidationError(
+            f"row {r}: {row_ids[r][c]}: weight must be between 0 and 1; got {prev[r, c]}"
+        )
+    totals = prev.sum(axis=1)
+    off = np.abs(totals - 1.0) > max(constraints.epsilon, 1e-6)
+    if off.any():
+        r = int(np.argmax(off))
+        raise ValidationError(
+            f"row {r}: previous_weights must sum to 1 (±tol); got {float(totals[r])}"
+        )
+    if not (np.isfinite(raw) & (raw >= 0.0)).all():
+        raise ValidationError("proposed_weights must be finite and >= 0")
+
+    eps = constraints.epsilon
+    min_weight = constraints.min_weight
+
+    # Feasibility check for min_weight
+    if n * min_weight > 1.0 + eps:
+        raise ValidationError(
+            f"min_weight={min_weight} is infeasible for {n} variants "
+            f"(n * min_weight must be <= 1)"
+        )
+
+    # Minimum evidence: rows hold steady if any variant lacks trials
+    below = counts < constraints.min_trials
+    hold = below.any(axis=1)
+    active = ~hold
+
+    # Clamp per-variant step change
+    lo = np.maximum(0.0, prev - constraints.max_step)
+    hi = np.minimum(1.0, prev + constraints.max_step)
+    clamped = np.minimum(np.maximum(raw, lo), hi)
+    clamp_mask = (np.abs(clamped - raw) > eps) & active[:, None]
+
+    # Apply min_weight floor (hard floor with redistribution)
+    floor_mask = (clamped + eps < min_weight) & active[:, None]
+    floored = np.where(floor_mask, min_weight, clamped)
+    has_floor = floor_mask.any(axis=1)
+
+    remaining = 1.0 - np.where(floor_mask, floored, 0.0).sum(axis=1)
+    bad = has_floor & (remaining < -eps)
+    if bad.any():
+        raise ValidationError(
+            "min_weight floor exceeded total mass; check feasibility/rounding "
+            f"(rows {np.flatnonzero(bad).tolist()})"
+        )
+
+    free = ~floor_mask
+    n_free = free.sum(axis=1)
+    base = np.where(free, np.maximum(floored, 0.0), 0.0).sum(axis=1)
+    even = base <= eps
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per = np.where(n_free > 0, remaining / np.maximum(n_free, 1), 0.0)
+        scale = np.where(even, 0.0, remaining / np.where(even, 1.0, base))
+    redistributed = np.where(
+        free,
+        np.where(even[:, None], per[:, None], floored * scale[:, None]),
+        floored,
+    )
+
+    # No floors triggered; normal normalization is fine
+    total = floored.sum(axis=1)
+    bad = active & ~has_floor & (total <= eps)
+    if bad.any():
+        row = int(np.flatnonzero(bad)[0])
+        raise ValidationError(
+            f"cannot normalize weights with non-positive sum: {float(total[row])} (row {row})"
+        )
+    normalized = floored / np.where(total <= eps, 1.0, total)[:, None]
+
+    final = np.where(
+        hold[:, None],
+        prev,
+        np.where(has_floor[:, None], redistributed, normalized),
+    )
+
+    # Determine if changed materially
+    changed = (np.abs(final - prev) > max(eps, 1e-9)).any(axis=1)
+
+    explanations: list[dict[str, object]] = []
+    for r in range(rows):
+        ids = row_ids[r]
+        if hold[r]:
+            explanations.append(
+                {
+                    "changed": False,
+                    "hold_reason": "min_trials_not_met",
+                    "min_trials": constraints.min_trials,
+                    "variants_below_min_trials": sorted(
+                        ids[i] for i in np.flatnonzero(below[r]).tolist()
+                    ),
+                    "guardrails_applied": ["min_trials_hold"],
+                }
+            )
+            continue
+
+        explanation: dict[str, object] = {
+            "changed": bool(changed[r]),
+            "guardrails_applied": ["max_step_clamp", "min_weight_floor", "normalize"],
+        }
+        clamp_idx = np.flatnonzero(clamp_mask[r]).tolist()
+        if clamp_idx:
+            explanation["max_step_clamps"] = {
+                ids[i]: {
+                    "raw": float(raw[r, i]),
+                    "clamped": float(clamped[r, i]),
+                    "lo": float(lo[r, i]),
+                    "hi": float(hi[r, i]),
+                }
+                for i in clamp_idx
+            }
+        floor_idx = np.flatnonzero(floor_mask[r]).tolist()
+        if floor_idx:
+            explanation["min_weight_floors"] = {
+                ids[i]: {"before": float(clamped[r, i]), "after": min_weight} for i in floor_idx
+            }
+        explanations.append(explanation)
+
+    if single:
+        return final[0], explanations[0]
+    return final, explanations
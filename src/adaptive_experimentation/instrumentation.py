@@ -0,0 +1,81 @@
+"""Optional per-stage instrumentation for Engine and the control loop runners.
+
+A tracer is any object with an on_stage(stage, duration_s, counters) method. Engine
+reports its compute stages (validation, strategy, guardrails, explanation, and
+cooldown for holds); run_once additionally reports store/source I/O stages
+(read_weights, read_observations, write_weights). Without a tracer none of this runs.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
+
+# Stage names reported by Engine.
+ENGINE_STAGES = ("cooldown", "validation", "strategy", "guardrails", "explanation")
+# Stage names reported by the control loop runners around store/source calls.
+IO_STAGES = ("read_weights", "read_observations", "write_weights")
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """Receives the duration and counters of each instrumented stage.
+
+    counters holds small integer facts about the stage, e.g. variants processed,
+    max_step clamp hits and min_weight floor hits. Tracers used with run_fleet are
+    called from worker threads and must be thread-safe.
+    """
+
+    def on_stage(self, stage: str, duration_s: float, counters: Mapping[str, int]) -> None:
+        ...
+
+
+@dataclass(frozen=True)
+class StageLatency:
+    """Latency of one stage aggregated across calls."""
+
+    count: int
+    total_s: float
+    max_s: float
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.count if self.count else 0.0
+
+
+class StageRecorder:
+    """Thread-safe tracer that aggregates latency and sums counters per stage."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: dict[str, list[float]] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def on_stage(self, stage: str, duration_s: float, counters: Mapping[str, int]) -> None:
+        with self._lock:
+            acc = self._latency.setdefault(stage, [0, 0.0, 0.0])
+            acc[0] += 1
+            acc[1] += duration_s
+            acc[2] = max(acc[2], duration_s)
+            totals = self._counters.setdefault(stage, {})
+            for name, value in counters.items():
+                totals[name] = totals.get(name, 0) + value
+
+    def latency(self) -> dict[str, StageLatency]:
+        """Return aggregated latency per stage, in first-seen order."""
+        with self._lock:
+            return {
+                stage: StageLatency(count=int(n), total_s=total, max_s=peak)
+                for stage, (n, total, peak) in self._latency.items()
+            }
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        """Return summed counters per stage."""
+        with self._lock:
+            return {stage: dict(totals) for stage, totals in self._counters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency.clear()
+            self._counters.clear()
@@ -0,0 +1,174 @@
+"""Ring-buffer accumulation of per-bucket observations for non-stationary traffic.
+
+WindowedAccumulator keeps the last num_buckets per-bucket counts per experiment
+(e.g. one incremental warehouse pull every five minutes) and maintains running
+totals, so sliding-window and exponentially-decayed totals are answered in
+O(variants) per query without re-querying the full window.
+"""
+from __future__ import annotations
+
+import threading
+from array import array
+from collections.abc import Iterable, Mapping
+
+from adaptive_experimentation.types import (
+    Observation,
+    ObservationTable,
+    VariantId,
+    observation_columns,
+)
+
+
+def _zeros(typecode: str, n: int) -> array:
+    return array(typecode, bytes(array(typecode).itemsize * n))
+
+
+class _Ring:
+    __slots__ = (
+        "variant_ids",
+        "positions",
+        "trials",
+        "successes",
+        "cursor",
+        "pushes",
+        "sum_trials",
+        "sum_successes",
+        "decayed_trials",
+        "decayed_successes",
+    )
+
+    def __init__(self, num_buckets: int) -> None:
+        self.variant_ids: tuple[VariantId, ...] = ()
+        self.positions: dict[VariantId, int] = {}
+        self.trials = [_zeros("q", 0) for _ in range(num_buckets)]
+        self.successes = [_zeros("q", 0) for _ in range(num_buckets)]
+        self.cursor = 0  # slot the next push writes to (i.e. the oldest bucket)
+        self.pushes = 0
+        self.sum_trials = _zeros("q", 0)
+        self.sum_successes = _zeros("q", 0)
+        self.decayed_trials = _zeros("d", 0)
+        self.decayed_successes = _zeros("d", 0)
+
+    def add_variants(self, variant_ids: Iterable[VariantId]) -> None:
+        new = [vid for vid in variant_ids if vid not in self.positions]
+        if not new:
+            return
+        for vid in new:
+            self.positions[vid] = len(self.positions)
+        self.variant_ids = self.variant_ids + tuple(new)
+        for arr in (*self.trials, *self.successes, self.sum_trials, self.sum_successes):
+            arr.extend(_zeros("q", len(new)))
+        self.decayed_trials.extend(_zeros("d", len(new)))
+        self.decayed_successes.extend(_zeros("d", len(new)))
+
+
+class WindowedAccumulator:
+    """ObservationSource over the last num_buckets pushed buckets.
+
+    Call push(experiment_id, observations) once per closed bucket. Each push is
+    O(variants): the evicted bucket is subtracted from the running sliding totals,
+    and the decayed totals are updated as
+        decayed = gamma * decayed + newest - gamma**num_buckets * evicted
+    with gamma = 0.5 ** (1 / half_life_buckets), so the newest bucket has weight 1
+    and a bucket half_life_buckets older has weight 0.5. Decayed totals are
+    recomputed exactly every num_buckets pushes to keep floating-point drift bounded.
+
+    read_observations ignores its window arguments: the window is the ring itself.
+    It returns decayed totals as a fractional (float64) ObservationTable when
+    half_life_buckets is set, and the sliding-window int64 totals otherwise. Memory is
+    O(num_buckets * variants).
+    """
+
+    def __init__(self, *, num_buckets: int, half_life_buckets: float | None = None) -> None:
+        if num_buckets < 1:
+            raise ValueError("num_buckets must be >= 1")
+        if half_life_buckets is not None and half_life_buckets <= 0.0:
+            raise ValueError("half_life_buckets must be > 0")
+        self.num_buckets = int(num_buckets)
+        self.half_life_buckets = half_life_buckets
+        self.gamma = 1.0 if half_life_buckets is None else 0.5 ** (1.0 / half_life_buckets)
+        self._gamma_n = self.gamma**self.num_buckets
+        self._rings: dict[str, _Ring] = {}
+        self._lock = threading.Lock()
+
+    def push(self, experiment_id: str, observations: Mapping[VariantId, Observation]) -> None:
+        """Append the newest bucket of counts, evicting the oldest once the ring is full."""
+        variant_ids, trials, successes = observation_columns(observations)
+
+        with self._lock:
+            ring = self._rings.get(experiment_id)
+            if ring is None:
+                ring = self._rings[experiment_id] = _Ring(self.num_buckets)
+            ring.add_variants(variant_ids)
+
+            slot = ring.cursor
+            old_t, old_s = ring.trials[slot], ring.successes[slot]
+            new_t = _zeros("q", len(ring.variant_ids))
+            new_s = _zeros("q", len(ring.variant_ids))
+            for vid, t, s in zip(variant_ids, trials, successes, strict=True):
+                i = ring.positions[vid]
+                new_t[i] = int(t)
+                new_s[i] = int(s)
+
+            gamma, gamma_n = self.gamma, self._gamma_n
+            st, ss = ring.sum_trials, ring.sum_successes
+            dt, ds = ring.decayed_trials, ring.decayed_successes
+            for i in range(len(ring.variant_ids)):
+                st[i] += new_t[i] - old_t[i]
+                ss[i] += new_s[i] - old_s[i]
+                dt[i] = gamma * dt[i] + new_t[i] - gamma_n * old_t[i]
+                ds[i] = gamma * ds[i] + new_s[i] - gamma_n * old_s[i]
+
+            ring.trials[slot] = new_t
+            ring.successes[slot] = new_s
+            ring.cursor = (slot + 1) % self.num_buckets
+            ring.pushes += 1
+            if ring.pushes % self.num_buckets == 0:
+                self._recompute_decayed(ring)
+
+    def sliding(self, experiment_id: str) -> ObservationTable:
+        """Integer totals over the last num_buckets buckets."""
+        with self._lock:
+            ring = self._ring(experiment_id)
+            return ObservationTable.wrap(
+                ring.variant_ids, array("q", ring.sum_trials), array("q", ring.sum_successes)
+            )
+
+    def decayed(self, experiment_id: str) -> ObservationTable:
+        """Exponentially-discounted totals over the retained buckets (a fractional table)."""
+        with self._lock:
+            ring = self._ring(experiment_id)
+            trials = [max(0.0, t) for t in ring.decayed_trials]
+            successes = [
+                min(max(0.0, s), t) for s, t in zip(ring.decayed_successes, trials, strict=True)
+            ]
+            return ObservationTable(ring.variant_ids, trials, successes, fractional=True)
+
+    def read_observations(
+        self,
+        experiment_id: str,
+        window_start_epoch_s: int,
+        window_end_epoch_s: int,
+    ) -> ObservationTable:
+        if self.half_life_buckets is not None:
+            return self.decayed(experiment_id)
+        return self.sliding(experiment_id)
+
+    def _ring(self, experiment_id: str) -> _Ring:
+        ring = self._rings.get(experiment_id)
+        if ring is None:
+            raise KeyError(f"unknown experiment_id: {experiment_id!r}")
+        return ring
+
+    def _recompute_decayed(self, ring: _Ring) -> None:
+        n = len(ring.variant_ids)
+        dt, ds = _zeros("d", n), _zeros("d", n)
+        weight = 1.0
+        for age in range(self.num_buckets):
+            slot = (ring.cursor - 1 - age) % self.num_buckets
+            bt, bs = ring.trials[slot], ring.successes[slot]
+            for i in range(n):
+                dt[i] += weight * bt[i]
+                ds[i] += weight * bs[i]
+            weight *= self.gamma
+        ring.decayed_trials, ring.decayed_successes = dt, ds
@@ -0,0 +1,168 @@
+"""Asyncio control loop: async run_once and a concurrency-limited fleet driver.
+
+These mirror control_loop.run_once and fleet.run_fleet for AsyncAllocationStore /
+AsyncObservationSource implementations, so one event loop can drive thousands of
+experiments with overlapping I/O. The engine computation itself is CPU-bound and
+runs inline on the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from adaptive_experimentation.types import Constraints
+
+from .control_loop import ControlLoopRunResult, CycleCancelledError, _Cycle
+from .fleet import FleetFailure, FleetRunReport, _aggregate_latency, _unique_ids
+
+if TYPE_CHECKING:
+    from adaptive_experimentation.instrumentation import Tracer
+
+    from .protocols import AsyncAllocationStore, AsyncObservationSource
+
+
+async def _read_last_updated_at(store: AsyncAllocationStore, experiment_id: str) -> int | None:
+    """Return the store's last-update timestamp, if the store exposes one."""
+    read_last_updated_at = getattr(store, "read_last_updated_at", None)
+    if read_last_updated_at is None:
+        return None
+    return await read_last_updated_at(experiment_id)
+
+
+async def run_once_async(
+    *,
+    experiment_id: str,
+    window_start_epoch_s: int,
+    window_end_epoch_s: int,
+    store: AsyncAllocationStore,
+    source: AsyncObservationSource,
+    strategy: str = "thompson",
+    constraints: Constraints | None = None,
+    seed: int | None = None,
+    now_epoch_s: int | None = None,
+    strategy_params: Mapping[str, Any] | None = None,
+    tracer: Tracer | None = None,
+    root_seed: int | None = None,
+    cancel: threading.Event | None = None,
+) -> ControlLoopRunResult:
+    """Async version of run_once; same steps, checks, seeds, result and tracer stages."""
+    cycle = _Cycle(
+        experiment_id=experiment_id,
+        window_start_epoch_s=window_start_epoch_s,
+        window_end_epoch_s=window_end_epoch_s,
+        strategy=strategy,
+        constraints=constraints,
+        seed=seed,
+        now_epoch_s=now_epoch_s,
+        strategy_params=strategy_params,
+        tracer=tracer,
+        root_seed=root_seed,
+        cancel=cancel,
+    )
+    held = cycle.weights_read(
+        await store.read_weights(experiment_id),
+        await _read_last_updated_at(store, experiment_id),
+    )
+    if held is not None:
+        return held
+
+    update = cycle.observations_read(
+        await source.read_observations(experiment_id, window_start_epoch_s, window_end_epoch_s)
+    )
+    if update is not None:
+        await store.write_weights(experiment_id, update.weights, update.explanation)
+        cycle.weights_written()
+    return cycle.result()
+
+
+async def run_fleet_async(
+    experiment_ids: Iterable[str],
+    *,
+    window_start_epoch_s: int,
+    window_end_epoch_s: int,
+    store: AsyncAllocationStore,
+    source: AsyncObservationSource,
+    strategy: str = "thompson",
+    constraints: Constraints | None = None,
+    seed: int | None = None,
+    now_epoch_s: int | None = None,
+    strategy_params: Mapping[str, Any] | None = None,
+    max_concurrency: int = 64,
+    timeout_s: float | None = None,
+    tracer: Tracer | None = None,
+    root_seed: int | None = None,
+) -> FleetRunReport:
+    """Run one run_once_async cycle per experiment, at most max_concurrency at a time.
+
+    Failures are isolated per experiment, as in run_fleet. timeout_s is measured from
+    when an experiment's cycle starts; unlike threads, a timed-out cycle is cancelled.
+    Its cancel flag is also set at the deadline, so a cycle whose compute overran it
+    does not start its write; a write already sent to the store may still be applied.
+    """
+    ids = _unique_ids(experiment_ids)
+    if seed is not None and root_seed is not None:
+        raise ValueError("pass either seed or root_seed, not both")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    if timeout_s is not None and timeout_s <= 0.0:
+        raise ValueError("timeout_s must be > 0")
+
+    constraints = constraints or Constraints()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def cycle(experiment_id: str) -> ControlLoopRunResult:
+        async with semaphore:
+            cancel = threading.Event()
+            run = run_once_async(
+                experiment_id=experiment_id,
+                window_start_epoch_s=window_start_epoch_s,
+                window_end_epoch_s=window_end_epoch_s,
+                store=store,
+                source=source,
+                strategy=strategy,
+                constraints=constraints,
+                seed=seed,
+                now_epoch_s=now_epoch_s,
+                strategy_params=strategy_params,
+                tracer=tracer,
+                root_seed=root_seed,
+                cancel=cancel,
+            )
+            if timeout_s is None:
+                return await run
+            # A timer thread, not loop.call_later: the flag must be set even while
+            # an overrunning compute blocks the event loop.
+            deadline = threading.Timer(timeout_s, cancel.set)
+            deadline.daemon = True
+            deadline.start()
+            try:
+                return await asyncio.wait_for(run, timeout_s)
+            finally:
+                deadline.cancel()
+
+    wall_start = time.perf_counter()
+    outcomes = await asyncio.gather(*(cycle(eid) for eid in ids), return_exceptions=True)
+
+    results: dict[str, ControlLoopRunResult] = {}
+    failures: dict[str, FleetFailure] = {}
+    for eid, outcome in zip(ids, outcomes, strict=True):
+        if isinstance(outcome, ControlLoopRunResult):
+            results[eid] = outcome
+        elif isinstance(outcome, (asyncio.TimeoutError, CycleCancelledError)):
+            failures[eid] = FleetFailure(
+                experiment_id=eid,
+                error=TimeoutError(f"{eid}: cycle exceeded {timeout_s}s"),
+                timed_out=True,
+            )
+        else:
+            failures[eid] = FleetFailure(experiment_id=eid, error=outcome)
+
+    return FleetRunReport(
+        results=results,
+        failures=failures,
+        stage_latency_s=_aggregate_latency(r.stage_latency_s for r in results.values()),
+        wall_time_s=time.perf_counter() - wall_start,
+    )
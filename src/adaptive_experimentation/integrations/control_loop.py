@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from adaptive_experimentation.engine import Engine
+from adaptive_experimentation.seeding import experiment_seed
 from adaptive_experimentation.types import AllocationResult, Constraints
 
 if TYPE_CHECKING:
+    import threading
     from collections.abc import Mapping
 
+    from adaptive_experimentation.instrumentation import Tracer
     from adaptive_experimentation.types import Observation
 
     from .protocols import AllocationStore, ObservationSource
@@ -24,6 +28,22 @@ class ControlLoopRunResult:
     previous_weights: dict[str, float]
     allocation: AllocationResult
     wrote_update: bool
+    # Seconds spent per stage: read_weights, read_observations, compute, write_weights.
+    # Stages that did not run (e.g. during a cooldown hold) are absent.
+    stage_latency_s: dict[str, float] = field(default_factory=dict)
+
+
+# Weights are only written back when they moved by more than this.
+_WRITE_TOLERANCE = 1e-12
+
+
+class CycleCancelledError(Exception):
+    """Raised when a cycle's cancel flag is set before its weights were written."""
+
+
+def _check_cancel(cancel: threading.Event | None, experiment_id: str) -> None:
+    if cancel is not None and cancel.is_set():
+        raise CycleCancelledError(f"{experiment_id}: cycle cancelled before writing weights")
 
 
 def _max_abs_diff(a: Mapping[str, float], b: Mapping[str, float]) -> float:
@@ -31,25 +51,136 @@ def _max_abs_diff(a: Mapping[str, float], b: Mapping[str, float]) -> float:
     return max(abs(a[k] - b[k]) for k in a)
 
 
-def _assert_variant_key_match(
-    *,
-    observations: Mapping[str, Observation],
-    previous_weights: Mapping[str, float],
-) -> None:
-    """Fail fast if variant IDs don't match between inputs.
+def _read_last_updated_at(store: AllocationStore, experiment_id: str) -> int | None:
+    """Return the store's last-update timestamp, if the store exposes one."""
+    read_last_updated_at = getattr(store, "read_last_updated_at", None)
+    if read_last_updated_at is None:
+        return None
+    return read_last_updated_at(experiment_id)
+
+
+def _resolve_seed(
+    seed: int | None,
+    root_seed: int | None,
+    experiment_id: str,
+    window_start_epoch_s: int,
+    window_end_epoch_s: int,
+) -> int | None:
+    """Return seed, or the per-experiment seed derived from root_seed."""
+    if root_seed is None:
+        return seed
+    if seed is not None:
+        raise ValueError("pass either seed or root_seed, not both")
+    return experiment_seed(root_seed, experiment_id, window_start_epoch_s, window_end_epoch_s)
+
 
-    This is intentionally strict to avoid accidental traffic drops or silent
-    behavior changes when variants are missing.
+class _Cycle:
+    """The I/O-free steps of one control loop cycle, in order.
+
+    run_once and run_once_async make the store/source calls and hand their results
+    to these steps, so seeds, cooldown holds, key checks, the write decision,
+    timings and tracer stages are identical for both.
     """
-    obs_keys = set(observations.keys())
-    prev_keys = set(previous_weights.keys())
-
-    if obs_keys != prev_keys:
-        missing_in_obs = sorted(prev_keys - obs_keys)
-        extra_in_obs = sorted(obs_keys - prev_keys)
-        raise ValueError(
-            "Variant ID mismatch between observations and previous_weights. "
-            f"missing_in_observations={missing_in_obs} extra_in_observations={extra_in_obs}"
+
+    def __init__(
+        self,
+        *,
+        experiment_id: str,
+        window_start_epoch_s: int,
+        window_end_epoch_s: int,
+        strategy: str,
+        constraints: Constraints | None,
+        seed: int | None,
+        now_epoch_s: int | None,
+        strategy_params: Mapping[str, Any] | None,
+        tracer: Tracer | None,
+        root_seed: int | None,
+        cancel: threading.Event | None,
+    ) -> None:
+        self.experiment_id = experiment_id
+        self.window_start_epoch_s = window_start_epoch_s
+        self.window_end_epoch_s = window_end_epoch_s
+        self.seed = _resolve_seed(
+            seed, root_seed, experiment_id, window_start_epoch_s, window_end_epoch_s
+        )
+        self.constraints = constraints or Constraints()
+        self.now_epoch_s = now_epoch_s
+        self.tracer = tracer
+        self.cancel = cancel
+        self.engine = Engine(strategy=strategy, strategy_params=strategy_params, tracer=tracer)
+        self.timings: dict[str, float] = {}
+        self.prev: dict[str, float] = {}
+        self.last_updated_at: int | None = None
+        self.allocation: AllocationResult | None = None
+        self.wrote = False
+        # Start of the stage currently in flight.
+        self._t = time.perf_counter()
+
+    def _stage(self, stage: str, variants: int) -> None:
+        now = time.perf_counter()
+        self.timings[stage] = now - self._t
+        if self.tracer is not None:
+            self.tracer.on_stage(stage, self.timings[stage], {"variants": variants})
+        self._t = now
+
+    def weights_read(
+        self, prev: Mapping[str, float], last_updated_at: int | None
+    ) -> ControlLoopRunResult | None:
+        """Record the weights read; return the final result if the cooldown holds."""
+        self.prev = dict(prev)
+        self.last_updated_at = last_updated_at
+        self._stage("read_weights", len(self.prev))
+
+        if last_updated_at is not None and self.now_epoch_s is None:
+            self.now_epoch_s = int(time.time())
+        held = self.engine.check_cooldown(
+            self.prev,
+            constraints=self.constraints,
+            last_updated_at_epoch_s=last_updated_at,
+            now_epoch_s=self.now_epoch_s,
+        )
+        if held is None:
+            self._t = time.perf_counter()
+            return None
+        self.allocation = held
+        return self.result()
+
+    def observations_read(self, obs: Mapping[str, Observation]) -> AllocationResult | None:
+        """Compute new weights; return them if they must be written, else None."""
+        self._stage("read_observations", len(obs))
+
+        result = self.engine.compute(
+            observations=obs,
+            previous_weights=self.prev,
+            constraints=self.constraints,
+            last_updated_at_epoch_s=self.last_updated_at,
+            now_epoch_s=self.now_epoch_s,
+            seed=self.seed,
+        )
+        now = time.perf_counter()
+        self.timings["compute"] = now - self._t
+        self._t = now
+        self.allocation = result
+
+        if _max_abs_diff(result.weights, self.prev) <= _WRITE_TOLERANCE:
+            return None
+        _check_cancel(self.cancel, self.experiment_id)
+        return result
+
+    def weights_written(self) -> None:
+        self.wrote = True
+        self._stage("write_weights", len(self.prev))
+
+    def result(self) -> ControlLoopRunResult:
+        assert self.allocation is not None
+        return ControlLoopRunResult(
+            experiment_id=self.experiment_id,
+            window_start_epoch_s=self.window_start_epoch_s,
+            window_end_epoch_s=self.window_end_epoch_s,
+            previous_weights=self.prev,
+            allocation=self.allocation,
+            wrote_update=self.wrote,
+            stage_latency_s=self.timings,
         )
 
 
@@ -63,45 +194,57 @@ def run_once(
     strategy: str = "thompson",
     constraints: Constraints | None = None,
     seed: int | None = None,
+    now_epoch_s: int | None = None,
+    strategy_params: Mapping[str, Any] | None = None,
+    tracer: Tracer | None = None,
+    root_seed: int | None = None,
+    cancel: threading.Event | None = None,
 ) -> ControlLoopRunResult:
     """Run one safe allocation update cycle.
 
     Steps:
       1) Read current weights from AllocationStore
-      2) Read aggregated observations from ObservationSource for the time window
-      3) Compute next weights using the Engine + strategy
-      4) Write weights back only if they changed (within tolerance)
+      2) If the store reports a last-update time, hold while inside the cooldown
+      3) Read aggregated observations from ObservationSource for the time window
+      4) Compute next weights using the Engine + strategy
+      5) Write weights back only if they changed (within tolerance)
 
     Notes:
       - Strictly requires that observation variant IDs match previous weights.
       - Keeps the library infrastructure-agnostic: stores/sources are injected.
+      - Cooldown is enforced only for stores implementing TimestampedAllocationStore;
+        now_epoch_s defaults to the current wall-clock time.
+      - tracer receives the Engine's compute stages plus read_weights,
+        read_observations and write_weights latency (see instrumentation.Tracer).
+      - root_seed (instead of seed) derives the strategy seed from the experiment id
+        and window (seeding.experiment_seed), so experiments and windows draw
+        independently yet reproducibly.
+      - cancel is checked right before write_weights; when it is set, nothing is
+        written and CycleCancelledError is raised (run_fleet sets it on timeout).
     """
-    prev = dict(store.read_weights(experiment_id))
-    obs = source.read_observations(experiment_id, window_start_epoch_s, window_end_epoch_s)
-
-    _assert_variant_key_match(observations=obs, previous_weights=prev)
-
-    engine = Engine(strategy=strategy)
-    result = engine.compute(
-        observations=obs,
-        previous_weights=prev,
-        constraints=constraints or Constraints(),
-        last_updated_at_epoch_s=None,
-        now_epoch_s=None,
-        seed=seed,
-    )
-
-    tol = 1e-12
-    wrote = False
-    if _max_abs_diff(result.weights, prev) > tol:
-        store.write_weights(experiment_id, result.weights, result.explanation)
-        wrote = True
-
-    return ControlLoopRunResult(
+    cycle = _Cycle(
         experiment_id=experiment_id,
         window_start_epoch_s=window_start_epoch_s,
         window_end_epoch_s=window_end_epoch_s,
-        previous_weights=prev,
-        allocation=result,
-        wrote_update=wrote,
+        strategy=strategy,
+        constraints=constraints,
+        seed=seed,
+        now_epoch_s=now_epoch_s,
+        strategy_params=strategy_params,
+        tracer=tracer,
+        root_seed=root_seed,
+        cancel=cancel,
+    )
+    held = cycle.weights_read(
+        store.read_weights(experiment_id), _read_last_updated_at(store, experiment_id)
+    )
+    if held is not None:
+        return held
+
+    update = cycle.observations_read(
+        source.read_observations(experiment_id, window_start_epoch_s, window_end_epoch_s)
     )
+    if update is not None:
+        store.write_weights(experiment_id, update.weights, update.explanation)
+        cycle.weights_written()
+    return cycle.result()
@@ -0,0 +1,445 @@
+"""Control loop runners for many experiments.
+
+Stores and sources are usually network-bound. run_fleet runs run_once cycles on a
+bounded thread pool to overlap their I/O; run_batch uses bulk store/source calls
+(one round trip per stage) when they are available. Each experiment is isolated:
+a failure or timeout is recorded in the report and never aborts the rest of the
+batch.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from adaptive_experimentation.engine import Engine
+from adaptive_experimentation.instrumentation import StageLatency
+from adaptive_experimentation.types import Constraints
+
+from .control_loop import (
+    _WRITE_TOLERANCE,
+    ControlLoopRunResult,
+    _max_abs_diff,
+    _resolve_seed,
+    run_once,
+)
+
+if TYPE_CHECKING:
+    from adaptive_experimentation.instrumentation import Tracer
+
+    from .protocols import AllocationStore, ObservationSource
+
+
+@dataclass(frozen=True)
+class FleetFailure:
+    """An experiment whose cycle raised or exceeded its timeout."""
+
+    experiment_id: str
+    error: BaseException
+    timed_out: bool = False
+
+
+@dataclass(frozen=True)
+class FleetRunReport:
+    """Aggregated outcome of one fleet run."""
+
+    results: dict[str, ControlLoopRunResult]
+    failures: dict[str, FleetFailure]
+    stage_latency_s: dict[str, StageLatency]
+    wall_time_s: float
+
+    @property
+    def updated(self) -> tuple[str, ...]:
+        """Experiment ids whose weights were written."""
+        return tuple(eid for eid, r in self.results.items() if r.wrote_update)
+
+    @property
+    def timed_out(self) -> tuple[str, ...]:
+        return tuple(eid for eid, f in self.failures.items() if f.timed_out)
+
+
+def _aggregate_latency(samples: Iterable[Mapping[str, float]]) -> dict[str, StageLatency]:
+    stats: dict[str, list[float]] = {}
+    for sample in samples:
+        for stage, seconds in sample.items():
+            acc = stats.setdefault(stage, [0, 0.0, 0.0])
+            acc[0] += 1
+            acc[1] += seconds
+            acc[2] = max(acc[2], seconds)
+    return {
+        stage: StageLatency(count=int(n), total_s=total, max_s=peak)
+        for stage, (n, total, peak) in stats.items()
+    }
+
+
+def run_fleet(
+    experiment_ids: Iterable[str],
+    *,
+    window_start_epoch_s: int,
+    window_end_epoch_s: int,
+    store: AllocationStore,
+    source: ObservationSource,
+    strategy: str = "thompson",
+    constraints: Constraints | None = None,
+    seed: int | None = None,
+    now_epoch_s: int | None = None,
+    strategy_params: Mapping[str, Any] | None = None,
+    max_workers: int = 8,
+    timeout_s: float | None = None,
+    tracer: Tracer | None = None,
+    root_seed: int | None = None,
+) -> FleetRunReport:
+    """Run one run_once cycle per experiment on a bounded thread pool.
+
+    Notes:
+      - store and source are shared across worker threads and must be thread-safe.
+      - timeout_s is measured from when an experiment's cycle starts. Threads cannot
+        be interrupted, so a timed-out cycle keeps running in the background, but its
+        cancel flag is set at the deadline and run_once skips the write once it sees
+        it. A write already in progress at the deadline may still be applied.
+      - If every worker is stuck on a timed-out cycle, experiments still queued are
+        reported as timed out instead of waiting indefinitely.
+      - tracer and root_seed are passed to every run_once call; the tracer
+        is called from worker threads. With root_seed, results do not depend on
+        scheduling or max_workers.
+    """
+    ids = _unique_ids(experiment_ids)
+    if seed is not None and root_seed is not None:
+        raise ValueError("pass either seed or root_seed, not both")
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    if timeout_s is not None and timeout_s <= 0.0:
+        raise ValueError("timeout_s must be > 0")
+
+    constraints = constraints or Constraints()
+    started: dict[str, float] = {}
+    cancels = {eid: threading.Event() for eid in ids}
+    results: dict[str, ControlLoopRunResult] = {}
+    failures: dict[str, FleetFailure] = {}
+
+    def cycle(experiment_id: str) -> ControlLoopRunResult:
+        started[experiment_id] = time.perf_counter()
+        return run_once(
+            experiment_id=experiment_id,
+            window_start_epoch_s=window_start_epoch_s,
+            window_end_epoch_s=window_end_epoch_s,
+            store=store,
+            source=source,
+            strategy=strategy,
+            constraints=constraints,
+            seed=seed,
+            now_epoch_s=now_epoch_s,
+            strategy_params=strategy_params,
+            tracer=tracer,
+            root_seed=root_seed,
+            cancel=cancels[experiment_id],
+        )
+
+    wall_start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fleet")
+    try:
+        pending: dict[Future[ControlLoopRunResult], str] = {
+            executor.submit(cycle, eid): eid for eid in ids
+        }
+        abandoned: set[Future[ControlLoopRunResult]] = set()
+
+        while pending:
+            wait_s = None
+            if timeout_s is not None:
+                deadlines = [started[e] + timeout_s for e in pending.values() if e in started]
+                wait_s = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else timeout_s
+
+            done, _ = wait(pending, timeout=wait_s, return_when=FIRST_COMPLETED)
+            for fut in done:
+                eid = pending.pop(fut)
+                error = fut.exception()
+                if error is None:
+                    results[eid] = fut.result()
+                else:
+                    failures[eid] = FleetFailure(experiment_id=eid, error=error)
+
+            if timeout_s is None:
+                continue
+
+            now = time.perf_counter()
+            for fut, eid in list(pending.items()):
+                # A cycle that finished after wait() returned is collected next pass.
+                if eid in started and now - started[eid] >= timeout_s and not fut.done():
+                    cancels[eid].set()
+                    del pending[fut]
+                    abandoned.add(fut)
+                    failures[eid] = FleetFailure(
+                        experiment_id=eid,
+                        error=TimeoutError(f"{eid}: cycle exceeded {timeout_s}s"),
+                        timed_out=True,
+                    )
+
+            abandoned = {fut for fut in abandoned if not fut.done()}
+            if pending and len(abandoned) >= max_workers:
+                for fut, eid in pending.items():
+                    cancels[eid].set()
+                    fut.cancel()
+                    failures[eid] = FleetFailure(
+                        experiment_id=eid,
+                        error=TimeoutError(f"{eid}: no free worker; all are stuck on timeouts"),
+                        timed_out=True,
+                    )
+                pending.clear()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    ordered = {eid: results[eid] for eid in ids if eid in results}
+    return FleetRunReport(
+        results=ordered,
+        failures={eid: failures[eid] for eid in ids if eid in failures},
+        stage_latency_s=_aggregate_latency(r.stage_latency_s for r in ordered.values()),
+        wall_time_s=time.perf_counter() - wall_start,
+    )
+
+
+def _unique_ids(experiment_ids: Iterable[str]) -> list[str]:
+    ids = list(experiment_ids)
+    if len(set(ids)) != len(ids):
+        raise ValueError("experiment_ids must be unique")
+    return ids
+
+
+def _record(
+    samples: list[dict[str, float]],
+    tracer: Tracer | None,
+    stage: str,
+    seconds: float,
+    *,
+    experiments: int,
+) -> None:
+    samples.append({stage: seconds})
+    if tracer is not None:
+        tracer.on_stage(stage, seconds, {"experiments": experiments})
+
+
+def _bulk_or_each(
+    ids: list[str],
+    *,
+    bulk: Callable[[list[str]], Mapping[str, Any]] | None,
+    each: Callable[[str], Any],
+    stage: str,
+    samples: list[dict[str, float]],
+    failures: dict[str, FleetFailure],
+    tracer: Tracer | None = None,
+) -> dict[str, Any]:
+    """Call bulk(ids) once when available, else each(eid) per experiment.
+
+    Per-experiment errors are recorded in failures. A failing bulk call is recorded
+    as a failure of every experiment in the batch, since none of them can proceed
+    without it.
+    """
+    found: dict[str, Any] = {}
+    if not ids:
+        return found
+
+    if bulk is not None:
+        t0 = time.perf_counter()
+        try:
+            out = bulk(ids)
+        except Exception as error:
+            for eid in ids:
+                failures[eid] = FleetFailure(experiment_id=eid, error=error)
+            return found
+        finally:
+            _record(samples, tracer, stage, time.perf_counter() - t0, experiments=len(ids))
+        for eid in ids:
+            if eid in out:
+                found[eid] = out[eid]
+            else:
+                failures[eid] = FleetFailure(
+                    experiment_id=eid, error=KeyError(f"{eid}: missing from bulk {stage}")
+                )
+        return found
+
+    for eid in ids:
+        t0 = time.perf_counter()
+        try:
+            found[eid] = each(eid)
+        except Exception as error:
+            failures[eid] = FleetFailure(experiment_id=eid, error=error)
+        _record(samples, tracer, stage, time.perf_counter() - t0, experiments=1)
+    return found
+
+
+def run_batch(
+    experiment_ids: Iterable[str],
+    *,
+    window_start_epoch_s: int,
+    window_end_epoch_s: int,
+    store: AllocationStore,
+    source: ObservationSource,
+    strategy: str = "thompson",
+    constraints: Constraints | None = None,
+    seed: int | None = None,
+    now_epoch_s: int | None = None,
+    strategy_params: Mapping[str, Any] | None = None,
+    tracer: Tracer | None = None,
+    root_seed: int | None = None,
+) -> FleetRunReport:
+    """Run one update cycle for many experiments with bulk store/source calls.
+
+    Each stage uses the bulk method when the store/source implements it
+    (read_weights_many, read_last_updated_at_many, read_observations_many,
+    write_weights_many; see BulkAllocationStore / BulkObservationSource) and falls back
+    to per-experiment calls otherwise. Checks and write decisions match run_once.
+
+    Notes:
+      - Runs on the calling thread; stage latencies count one sample per call made.
+      - Per-experiment failures are isolated. A failing bulk call affects every
+        experiment in it: its error is recorded as a failure of each of them, and
+        run_batch carries on with the remaining stages for the rest.
+      - tracer receives the Engine's compute stages, and one store/source stage
+        per call made with an "experiments" counter.
+      - root_seed behaves as in run_once.
+    """
+    ids = _unique_ids(experiment_ids)
+    seeds = {
+        eid: _resolve_seed(seed, root_seed, eid, window_start_epoch_s, window_end_epoch_s)
+        for eid in ids
+    }
+    constraints = constraints or Constraints()
+    engine = Engine(strategy=strategy, strategy_params=strategy_params, tracer=tracer)
+
+    wall_start = time.perf_counter()
+    samples: list[dict[str, float]] = []
+    failures: dict[str, FleetFailure] = {}
+
+    prev_by_id = _bulk_or_each(
+        ids,
+        bulk=getattr(store, "read_weights_many", None),
+        each=store.read_weights,
+        stage="read_weights",
+        samples=samples,
+        failures=failures,
+        tracer=tracer,
+    )
+    prev_by_id = {eid: dict(w) for eid, w in prev_by_id.items()}
+
+    last_updated: dict[str, Any] = {}
+    if hasattr(store, "read_last_updated_at"):
+        last_updated = _bulk_or_each(
+            [eid for eid in ids if eid in prev_by_id],
+            bulk=getattr(store, "read_last_updated_at_many", None),
+            each=store.read_last_updated_at,
+            stage="read_last_updated_at",
+            samples=samples,
+            failures=failures,
+            tracer=tracer,
+        )
+        if now_epoch_s is None:
+            now_epoch_s = int(time.time())
+
+    results: dict[str, ControlLoopRunResult] = {}
+
+    def result_for(eid: str, allocation, *, wrote: bool, compute_s: float | None = None):
+        return ControlLoopRunResult(
+            experiment_id=eid,
+            window_start_epoch_s=window_start_epoch_s,
+            window_end_epoch_s=window_end_epoch_s,
+            previous_weights=prev_by_id[eid],
+            allocation=allocation,
+            wrote_update=wrote,
+            stage_latency_s={} if compute_s is None else {"compute": compute_s},
+        )
+
+    active: list[str] = []
+    for eid in ids:
+        if eid not in prev_by_id or eid in failures:
+            continue
+        held = engine.check_cooldown(
+            prev_by_id[eid],
+            constraints=constraints,
+            last_updated_at_epoch_s=last_updated.get(eid),
+            now_epoch_s=now_epoch_s,
+        )
+        if held is not None:
+            results[eid] = result_for(eid, held, wrote=False)
+        else:
+            active.append(eid)
+
+    bulk_read_observations = getattr(source, "read_observations_many", None)
+    obs_by_id = _bulk_or_each(
+        active,
+        bulk=None
+        if bulk_read_observations is None
+        else lambda batch: bulk_read_observations(batch, window_start_epoch_s, window_end_epoch_s),
+        each=lambda eid: source.read_observations(eid, window_start_epoch_s, window_end_epoch_s),
+        stage="read_observations",
+        samples=samples,
+        failures=failures,
+        tracer=tracer,
+    )
+
+    computed: dict[str, tuple[Any, float]] = {}
+    for eid in active:
+        if eid not in obs_by_id:
+            continue
+        t0 = time.perf_counter()
+        try:
+            allocation = engine.compute(
+                observations=obs_by_id[eid],
+                previous_weights=prev_by_id[eid],
+                constraints=constraints,
+                last_updated_at_epoch_s=last_updated.get(eid),
+                now_epoch_s=now_epoch_s,
+                seed=seeds[eid],
+            )
+        except Exception as error:
+            failures[eid] = FleetFailure(experiment_id=eid, error=error)
+            continue
+        elapsed = time.perf_counter() - t0
+        samples.append({"compute": elapsed})
+        computed[eid] = (allocation, elapsed)
+
+    to_write = [
+        eid
+        for eid, (allocation, _) in computed.items()
+        if _max_abs_diff(allocation.weights, prev_by_id[eid]) > _WRITE_TOLERANCE
+    ]
+    written: set[str] = set()
+    write_many = getattr(store, "write_weights_many", None)
+    if to_write and write_many is not None:
+        t0 = time.perf_counter()
+        try:
+            write_many(
+                {eid: computed[eid][0].weights for eid in to_write},
+                {eid: computed[eid][0].explanation for eid in to_write},
+            )
+        except Exception as error:
+            for eid in to_write:
+                failures[eid] = FleetFailure(experiment_id=eid, error=error)
+        else:
+            written.update(to_write)
+        _record(
+            samples, tracer, "write_weights", time.perf_counter() - t0, experiments=len(to_write)
+        )
+    else:
+        for eid in to_write:
+            allocation = computed[eid][0]
+            t0 = time.perf_counter()
+            try:
+                store.write_weights(eid, allocation.weights, allocation.explanation)
+            except Exception as error:
+                failures[eid] = FleetFailure(experiment_id=eid, error=error)
+            else:
+                written.add(eid)
+            _record(samples, tracer, "write_weights", time.perf_counter() - t0, experiments=1)
+
+    for eid, (allocation, elapsed) in computed.items():
+        if eid not in failures:
+            results[eid] = result_for(eid, allocation, wrote=eid in written, compute_s=elapsed)
+
+    return FleetRunReport(
+        results={eid: results[eid] for eid in ids if eid in results},
+        failures={eid: failures[eid] for eid in ids if eid in failures},
+        stage_latency_s=_aggregate_latency(samples),
+        wall_time_s=time.perf_counter() - wall_start,
+    )
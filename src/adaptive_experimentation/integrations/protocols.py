@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Protocol
 
 from adaptive_experimentation.explanations import AllocationExplanation
@@ -28,6 +28,19 @@ class AllocationStore(Protocol):
         ...
 
 
+class TimestampedAllocationStore(AllocationStore, Protocol):
+    """An AllocationStore that also reports when weights were last written.
+
+    When a store implements this, the control loop enforces
+    Constraints.cooldown_seconds and skips the observation read entirely for
+    experiments that are still cooling down.
+    """
+
+    def read_last_updated_at(self, experiment_id: str) -> int | None:
+        """Return epoch seconds of the last weights write, or None if never written."""
+        ...
+
+
 class ObservationSource(Protocol):
     """Where aggregated observations (trials/successes) come from.
 
@@ -43,3 +56,83 @@ class ObservationSource(Protocol):
     ) -> Mapping[str, Observation]:
         """Return observations per variant for the requested window."""
         ...
+
+
+class BulkAllocationStore(AllocationStore, Protocol):
+    """An AllocationStore with batch endpoints (one round trip per batch).
+
+    run_batch detects each method independently and falls back to the
+    per-experiment methods for any that are missing.
+    """
+
+    def read_weights_many(self, experiment_ids: Sequence[str]) -> Mapping[str, Mapping[str, float]]:
+        """Return current weights keyed by experiment_id."""
+        ...
+
+    def write_weights_many(
+        self,
+        weights: Mapping[str, Mapping[str, float]],
+        explanations: Mapping[str, AllocationExplanation],
+    ) -> None:
+        """Persist new weights (and explanations) for every experiment_id given."""
+        ...
+
+    def read_last_updated_at_many(
+        self, experiment_ids: Sequence[str]
+    ) -> Mapping[str, int | None]:
+        """Return epoch seconds of the last weights write keyed by experiment_id.
+
+        Only used for timestamped stores (see TimestampedAllocationStore).
+        """
+        ...
+
+
+class BulkObservationSource(ObservationSource, Protocol):
+    """An ObservationSource with a batch endpoint."""
+
+    def read_observations_many(
+        self,
+        experiment_ids: Sequence[str],
+        window_start_epoch_s: int,
+        window_end_epoch_s: int,
+    ) -> Mapping[str, Mapping[str, Observation]]:
+        """Return observations per variant, keyed by experiment_id, for the window."""
+        ...
+
+
+class AsyncAllocationStore(Protocol):
+    """Asyncio-native AllocationStore (e.g. backed by an async HTTP client)."""
+
+    async def read_weights(self, experiment_id: str) -> Mapping[str, float]:
+        """Return current weights for the given experiment_id."""
+        ...
+
+    async def write_weights(
+        self,
+        experiment_id: str,
+        weights: Mapping[str, float],
+        explanation: AllocationExplanation,
+    ) -> None:
+        """Persist new weights for experiment_id along with an explanation."""
+        ...
+
+
+class AsyncTimestampedAllocationStore(AsyncAllocationStore, Protocol):
+    """An AsyncAllocationStore that also reports when weights were last written."""
+
+    async def read_last_updated_at(self, experiment_id: str) -> int | None:
+        """Return epoch seconds of the last weights write, or None if never written."""
+        ...
+
+
+class AsyncObservationSource(Protocol):
+    """Asyncio-native ObservationSource."""
+
+    async def read_observations(
+        self,
+        experiment_id: str,
+        window_start_epoch_s: int,
+        window_end_epoch_s: int,
+    ) -> Mapping[str, Observation]:
+        """Return observations per variant for the requested window."""
+        ...
@@ -0,0 +1,211 @@
+"""In-memory streaming aggregation for the control loop.
+
+StreamingAggregator turns a stream of (variant, outcome) events into windowed
+trials/successes counts and serves them as an ObservationSource. Counters are
+int64 arrays per time bucket, so ingesting a batch costs O(distinct variants in
+the batch) array updates rather than an object allocation per event.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+from adaptive_experimentation.types import ObservationTable, VariantId
+
+
+class _Bucket:
+    __slots__ = ("index", "trials", "successes", "shared")
+
+    def __init__(self, index: int, n: int) -> None:
+        self.index = index
+        self.trials = array("q", bytes(8 * n))
+        self.successes = array("q", bytes(8 * n))
+        # True once the arrays back a zero-copy snapshot; they are copied before
+        # the next write instead of being mutated in place.
+        self.shared = False
+
+    def make_writable(self) -> None:
+        if self.shared:
+            self.trials = array("q", self.trials)
+            self.successes = array("q", self.successes)
+            self.shared = False
+
+
+class _ExperimentCounters:
+    __slots__ = ("variant_ids", "positions", "ring")
+
+    def __init__(self, variant_ids: Iterable[VariantId], capacity: int) -> None:
+        self.variant_ids: tuple[VariantId, ...] = ()
+        self.positions: dict[VariantId, int] = {}
+        self.ring: list[_Bucket | None] = [None] * capacity
+        self.add_variants(variant_ids)
+
+    def add_variants(self, variant_ids: Iterable[VariantId]) -> None:
+        new = [vid for vid in dict.fromkeys(variant_ids) if vid not in self.positions]
+        if not new:
+            return
+        for vid in new:
+            self.positions[vid] = len(self.positions)
+        self.variant_ids = self.variant_ids + tuple(new)
+        zeros = array("q", bytes(8 * len(new)))
+        for bucket in self.ring:
+            if bucket is not None:
+                bucket.make_writable()
+                bucket.trials.extend(zeros)
+                bucket.successes.extend(zeros)
+
+
+class StreamingAggregator:
+    """ObservationSource that aggregates event batches into windowed counts.
+
+    Windows:
+      - tumbling (slide_s=None): one bucket per window_s interval.
+      - sliding (slide_s set): buckets of slide_s seconds; a window spans
+        window_s / slide_s consecutive buckets.
+
+    read_observations(experiment_id, start, end) sums the buckets whose start time
+    falls in [start, end), so window bounds are effectively rounded to bucket
+    boundaries. A query covering exactly one bucket is served zero-copy: the
+    returned ObservationTable shares the bucket's arrays, and later writes to
+    that bucket copy them first so the snapshot never changes.
+
+    Only the most recent retention_buckets buckets are kept (default: one full
+    window plus the bucket being filled). Events older than that are dropped and
+    counted in dropped_events. Safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_s: int,
+        slide_s: int | None = None,
+        retention_buckets: int | None = None,
+    ) -> None:
+        if window_s <= 0:
+            raise ValueError("window_s must be > 0")
+        if slide_s is not None and (slide_s <= 0 or window_s % slide_s != 0):
+            raise ValueError("slide_s must be > 0 and divide window_s")
+        self.window_s = int(window_s)
+        self.bucket_s = int(slide_s) if slide_s is not None else self.window_s
+        default_retention = self.window_s // self.bucket_s + 1
+        self.retention_buckets = int(retention_buckets or default_retention)
+        if self.retention_buckets < 1:
+            raise ValueError("retention_buckets must be >= 1")
+
+        self.dropped_events = 0
+        self._experiments: dict[str, _ExperimentCounters] = {}
+        self._latest_bucket: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, experiment_id: str, variant_ids: Iterable[VariantId]) -> None:
+        """Declare variants up front so they are reported (with zero counts) in order."""
+        with self._lock:
+            self._counters(experiment_id).add_variants(variant_ids)
+
+    def ingest(
+        self,
+        experiment_id: str,
+        variant_ids: Sequence[VariantId],
+        successes: Sequence[int],
+        *,
+        event_time_epoch_s: float | None = None,
+    ) -> None:
+        """Count a batch of events: one trial per entry, with its success flag/count.
+
+        All events in the batch are attributed to the bucket containing
+        event_time_epoch_s (default: now). Unknown variants are registered on the fly.
+        """
+        if len(variant_ids) != len(successes):
+            raise ValueError("variant_ids and successes must have the same length")
+        if not variant_ids:
+            return
+        if event_time_epoch_s is None:
+            event_time_epoch_s = time.time()
+        index = int(event_time_epoch_s // self.bucket_s)
+
+        trial_counts = Counter(variant_ids)
+        success_counts: Counter[VariantId] = Counter()
+        for vid, s in zip(variant_ids, successes, strict=True):
+            if s:
+                success_counts[vid] += int(s)
+
+        with self._lock:
+            counters = self._counters(experiment_id)
+            bucket = self._bucket_for_write(experiment_id, counters, index)
+            if bucket is None:
+                self.dropped_events += len(variant_ids)
+                return
+
+            counters.add_variants(trial_counts)
+            bucket.make_writable()
+            positions = counters.positions
+            for vid, n in trial_counts.items():
+                bucket.trials[positions[vid]] += n
+            for vid, n in success_counts.items():
+                bucket.successes[positions[vid]] += n
+
+    def read_observations(
+        self,
+        experiment_id: str,
+        window_start_epoch_s: int,
+        window_end_epoch_s: int,
+    ) -> ObservationTable:
+        """Return counts for buckets starting in [window_start, window_end)."""
+        lo = math.ceil(window_start_epoch_s / self.bucket_s)
+        hi = math.ceil(window_end_epoch_s / self.bucket_s)
+
+        with self._lock:
+            counters = self._experiments.get(experiment_id)
+            if counters is None:
+                raise KeyError(f"unknown experiment_id: {experiment_id!r}")
+
+            n = len(counters.variant_ids)
+            buckets = [b for b in counters.ring if b is not None and lo <= b.index < hi]
+            if len(buckets) == 1:
+                bucket = buckets[0]
+                bucket.shared = True
+                return ObservationTable.wrap(counters.variant_ids, bucket.trials, bucket.successes)
+
+            trials = array("q", bytes(8 * n))
+            successes = array("q", bytes(8 * n))
+            for bucket in buckets:
+                for i in range(n):
+                    trials[i] += bucket.trials[i]
+                    successes[i] += bucket.successes[i]
+            return ObservationTable.wrap(counters.variant_ids, trials, successes)
+
+    def window_bounds(self, now_epoch_s: float | None = None) -> tuple[int, int]:
+        """Return (start, end) of the latest complete window before now_epoch_s."""
+        if now_epoch_s is None:
+            now_epoch_s = time.time()
+        end = int(now_epoch_s // self.bucket_s) * self.bucket_s
+        return end - self.window_s, end
+
+    def _counters(self, experiment_id: str) -> _ExperimentCounters:
+        counters = self._experiments.get(experiment_id)
+        if counters is None:
+            counters = _ExperimentCounters((), self.retention_buckets)
+            self._experiments[experiment_id] = counters
+        return counters
+
+    def _bucket_for_write(
+        self,
+        experiment_id: str,
+        counters: _ExperimentCounters,
+        index: int,
+    ) -> _Bucket | None:
+        latest = max(index, self._latest_bucket.get(experiment_id, index))
+        if index <= latest - self.retention_buckets:
+            return None  # older than the retained range
+        self._latest_bucket[experiment_id] = latest
+
+        slot = index % self.retention_buckets
+        bucket = counters.ring[slot]
+        if bucket is None or bucket.index != index:
+            bucket = _Bucket(index, len(counters.variant_ids))
+            counters.ring[slot] = bucket
+        return bucket
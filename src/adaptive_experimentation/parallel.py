@@ -0,0 +1,166 @@
+"""Process-pool fan-out for large batches of Engine computations.
+
+Engine.compute is CPU-bound pure Python, so threads do not help. compute_parallel
+partitions a batch of ComputeRequests into chunks, ships each chunk to a worker
+process in a compact columnar form (arrays instead of per-variant objects), runs
+Engine.compute_many there and reassembles the results in input order.
+
+Results are identical to Engine.compute_many on the same requests: every request
+carries its own seed, so they do not depend on chunking or worker count.
+"""
+from __future__ import annotations
+
+import math
+import os
+from array import array
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from .engine import Engine
+from .posterior import PosteriorStats
+from .types import (
+    AllocationResult,
+    ComputeRequest,
+    ObservationTable,
+    VariantId,
+    is_continuous,
+    observation_columns,
+)
+from .validation import ValidationError
+
+# Target number of chunks per worker: enough to balance uneven chunks, few enough
+# to keep per-chunk overhead small.
+_CHUNKS_PER_WORKER = 4
+
+
+def _column(values: Iterable[float]) -> array:
+    if isinstance(values, array):
+        return values
+    values = list(values)
+    try:
+        return array("q", values)
+    except TypeError:
+        # Fractional (e.g. decayed) counts.
+        return array("d", values)
+
+
+def _pack(req: ComputeRequest) -> tuple[Any, ...]:
+    """Encode one request as ids plus flat arrays (compact to pickle)."""
+    weight_ids = tuple(req.previous_weights)
+    if is_continuous(req.observations):
+        # Sufficient statistics are already compact; ship them as they are.
+        observations: tuple[Any, ...] = (None, dict(req.observations), None)
+        variant_ids = tuple(req.observations)
+    else:
+        variant_ids, trials, successes = observation_columns(req.observations)
+        variant_ids = tuple(variant_ids)
+        observations = (variant_ids, _column(trials), _column(successes))
+    return (
+        req.experiment_id,
+        *observations,
+        # Usually the same ids in the same order; only ship them when they differ.
+        None if weight_ids == variant_ids else weight_ids,
+        array("d", req.previous_weights.values()),
+        req.constraints,
+        req.seed,
+        req.last_updated_at_epoch_s,
+        req.now_epoch_s,
+    )
+
+
+def _unpack(packed: tuple[Any, ...]) -> ComputeRequest:
+    eid, variant_ids, trials, successes, weight_ids, weights, *rest = packed
+    if variant_ids is None:
+        observations = trials
+        variant_ids = tuple(observations)
+    else:
+        observations = ObservationTable.wrap(variant_ids, trials, successes)
+    keys = variant_ids if weight_ids is None else weight_ids
+    return ComputeRequest(eid, observations, dict(zip(keys, weights, strict=True)), *rest)
+
+
+def _compute_chunk(
+    engine_args: tuple[str, Mapping[str, Any] | None, bool, PosteriorStats | None],
+    chunk: list[tuple[Any, ...]],
+) -> list[tuple[str, tuple[VariantId, ...], array, Any]]:
+    strategy, strategy_params, explain, posterior_stats = engine_args
+    engine = Engine(
+        strategy=strategy,
+        strategy_params=strategy_params,
+        explain=explain,
+        posterior_stats=posterior_stats,
+    )
+    results = engine.compute_many(_unpack(p) for p in chunk)
+    return [
+        (eid, tuple(r.weights), array("d", r.weights.values()), r.explanation)
+        for eid, r in results.items()
+    ]
+
+
+def compute_parallel(
+    engine: Engine,
+    requests: Iterable[ComputeRequest | tuple],
+    *,
+    max_workers: int | None = None,
+    chunk_size: int | None = None,
+    executor: Executor | None = None,
+) -> dict[str, AllocationResult]:
+    """
+    Compute a batch of requests across worker processes.
+
+    Args:
+      engine: the Engine to run in each worker (it must not have a tracer; tracers
+        cannot observe other processes).
+      requests: ComputeRequests or tuples, as for Engine.compute_many.
+      max_workers: pool size when no executor is given (default: CPU count).
+      chunk_size: requests per task (default: about four chunks per worker).
+      executor: an existing (e.g. long-lived ProcessPoolExecutor) executor to reuse;
+        it is not shut down.
+
+    Returns results keyed by experiment_id in input order. Errors raised for any
+    request (e.g. ValidationError) propagate, as with compute_many.
+    """
+    if engine.tracer is not None:
+        raise ValueError("compute_parallel does not support engines with a tracer")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    reqs = [r if isinstance(r, ComputeRequest) else ComputeRequest(*r) for r in requests]
+    seen: set[str] = set()
+    for req in reqs:
+        if req.experiment_id in seen:
+            raise ValidationError(f"duplicate experiment_id in batch: {req.experiment_id!r}")
+        seen.add(req.experiment_id)
+    if not reqs:
+        return {}
+
+    workers = max_workers or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        return engine.compute_many(reqs)
+
+    size = chunk_size or max(1, math.ceil(len(reqs) / (workers * _CHUNKS_PER_WORKER)))
+    packed = [_pack(r) for r in reqs]
+    chunks = [packed[i : i + size] for i in range(0, len(packed), size)]
+
+    engine_args = (
+        engine.strategy, engine.strategy_params, engine.explain, engine.posterior_stats
+    )
+
+    def collect(pool: Executor) -> dict[str, AllocationResult]:
+        futures = [pool.submit(_compute_chunk, engine_args, chunk) for chunk in chunks]
+        results: dict[str, AllocationResult] = {}
+        for fut in futures:
+            for eid, keys, weights, explanation in fut.result():
+                results[eid] = AllocationResult(
+                    weights=dict(zip(keys, weights, strict=True)), explanation=explanation
+                )
+        return results
+
+    if executor is not None:
+        return collect(executor)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return collect(pool)
+
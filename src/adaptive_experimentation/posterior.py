@@ -0,0 +1,147 @@
+"""Posterior statistics for Beta-Bernoulli models: means, credible intervals, P(best).
+
+Quantiles cost an iterative incomplete-beta inversion each, and the same posteriors
+come back tick after tick (held experiments, experiments without new traffic), so
+results are kept in LRU caches keyed on (alpha, beta, level).
+
+Engine(posterior_stats=PosteriorStats(...)) attaches these statistics to
+StrategyExplanation.details["posterior_stats"]; with the default None nothing is
+computed.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from ._numpy import optional_numpy
+from ._special import betaincinv
+from .types import VariantId
+
+# Entries per cache; a fleet of experiments x variants fits comfortably.
+CACHE_SIZE = 65_536
+
+
+@dataclass(frozen=True, slots=True)
+class PosteriorStats:
+    """
+    Which posterior statistics to attach to explanations.
+
+    level: credible interval mass (equal-tailed), e.g. 0.95.
+    prob_best: also estimate P(variant is best) from num_samples joint posterior draws
+      with a fixed seed, so repeated calls are reproducible (and cached).
+    """
+
+    level: float = 0.95
+    prob_best: bool = False
+    num_samples: int = 10_000
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.level < 1.0:
+            raise ValueError("level must be in (0, 1)")
+        if self.num_samples < 1:
+            raise ValueError("num_samples must be >= 1")
+
+
+def beta_mean(alpha: float, beta: float) -> float:
+    return alpha / (alpha + beta)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def beta_quantile(alpha: float, beta: float, q: float) -> float:
+    """q-quantile of Beta(alpha, beta) (cached)."""
+    return betaincinv(alpha, beta, q)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def credible_interval(alpha: float, beta: float, level: float = 0.95) -> tuple[float, float]:
+    """Equal-tailed credible interval of Beta(alpha, beta) holding level mass (cached)."""
+    if not 0.0 < level < 1.0:
+        raise ValueError("level must be in (0, 1)")
+    tail = (1.0 - level) / 2.0
+    return betaincinv(alpha, beta, tail), betaincinv(alpha, beta, 1.0 - tail)
+
+
+def prob_best(
+    alpha: Sequence[float],
+    beta: Sequence[float],
+    *,
+    num_samples: int = 10_000,
+    seed: int = 0,
+) -> list[float]:
+    """
+    Monte Carlo estimate of P(variant has the highest rate) for each Beta posterior.
+
+    Uses NumPy when installed and random.Random otherwise; the two use different
+    generators, so estimates differ slightly between environments. Cached on the
+    full set of posterior parameters.
+    """
+    return list(_prob_best(tuple(map(float, alpha)), tuple(map(float, beta)), num_samples, seed))
+
+
+@lru_cache(maxsize=CACHE_SIZE // 16)
+def _prob_best(
+    alpha: tuple[float, ...], beta: tuple[float, ...], num_samples: int, seed: int
+) -> tuple[float, ...]:
+    if len(alpha) != len(beta):
+        raise ValueError("alpha and beta must have the same length")
+    np = optional_numpy()
+    if np is not None:
+        draws = np.random.default_rng(seed).beta(alpha, beta, size=(num_samples, len(alpha)))
+        wins = np.bincount(draws.argmax(axis=1), minlength=len(alpha)).tolist()
+    else:
+        import random
+
+        rng = random.Random(seed)
+        params = list(zip(alpha, beta, strict=True))
+        wins = [0] * len(params)
+        for _ in range(num_samples):
+            row = [rng.betavariate(a, b) for a, b in params]
+            wins[row.index(max(row))] += 1
+    return tuple(w / num_samples for w in wins)
+
+
+def summarize(
+    variant_ids: Sequence[VariantId],
+    alpha: Sequence[float],
+    beta: Sequence[float],
+    stats: PosteriorStats,
+) -> dict[str, Any]:
+    """
+    Posterior statistics per variant, in the shape attached to explanations:
+
+      {"level": 0.95, "variants": {vid: {"alpha", "beta", "mean", "lower", "upper"
+                                         [, "prob_best"]}}}
+    """
+    variants: dict[VariantId, dict[str, float]] = {}
+    for vid, a, b in zip(variant_ids, alpha, beta, strict=True):
+        lower, upper = credible_interval(float(a), float(b), stats.level)
+        variants[vid] = {
+            "alpha": float(a),
+            "beta": float(b),
+            "mean": beta_mean(a, b),
+            "lower": lower,
+            "upper": upper,
+        }
+    if stats.prob_best:
+        probs = prob_best(alpha, beta, num_samples=stats.num_samples, seed=stats.seed)
+        for vid, p in zip(variant_ids, probs, strict=True):
+            variants[vid]["prob_best"] = p
+    return {"level": stats.level, "variants": variants}
+
+
+def cache_info() -> dict[str, Any]:
+    """Hit/miss statistics of the quantile, interval and P(best) caches."""
+    return {
+        "beta_quantile": beta_quantile.cache_info(),
+        "credible_interval": credible_interval.cache_info(),
+        "prob_best": _prob_best.cache_info(),
+    }
+
+
+def clear_cache() -> None:
+    beta_quantile.cache_clear()
+    credible_interval.cache_clear()
+    _prob_best.cache_clear()
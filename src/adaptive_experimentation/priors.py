@@ -0,0 +1,190 @@
+"""Empirical-Bayes Beta priors shared across a family of experiments.
+
+ThompsonStrategy defaults to a flat Beta(1, 1) prior, so every new experiment starts
+from "anything between 0% and 100% is equally likely". Sibling experiments (same
+surface, same metric) usually convert at similar rates; fitting a Beta prior to
+their history centers new experiments on that rate, so early posteriors are far
+less noisy.
+
+    prior = fit_beta_prior_from(sibling_observations)
+    engine = Engine(strategy="thompson", strategy_params=prior.strategy_params())
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+from .types import Observation, VariantId, observation_columns
+
+# Lower bound for fitted alpha/beta, which must stay > 0.
+_MIN_PARAM = 1e-2
+
+
+@dataclass(frozen=True, slots=True)
+class BetaPrior:
+    """Beta(prior_success, prior_failure) prior, in ThompsonStrategy's parameterization."""
+
+    prior_success: float
+    prior_failure: float
+    # Number of arms the prior was fitted on (0 for a fallback prior).
+    fitted_on: int = 0
+
+    def __post_init__(self) -> None:
+        if self.prior_success <= 0.0 or self.prior_failure <= 0.0:
+            raise ValueError("priors must be > 0")
+
+    @property
+    def mean(self) -> float:
+        return self.prior_success / (self.prior_success + self.prior_failure)
+
+    @property
+    def strength(self) -> float:
+        """Pseudo-trials the prior is worth (alpha + beta)."""
+        return self.prior_success + self.prior_failure
+
+    def strategy_params(self) -> dict[str, float]:
+        """Keyword params for ThompsonStrategy / Engine(strategy_params=...)."""
+        return {"prior_success": self.prior_success, "prior_failure": self.prior_failure}
+
+
+UNIFORM_PRIOR = BetaPrior(1.0, 1.0)
+
+
+def fit_beta_prior(
+    trials: Sequence[float],
+    successes: Sequence[float],
+    *,
+    min_trials: float = 1.0,
+    min_arms: int = 10,
+    max_strength: float = 100.0,
+    fallback: BetaPrior = UNIFORM_PRIOR,
+) -> BetaPrior:
+    """
+    Fit a Beta prior to per-arm (trials, successes) columns by the method of moments.
+
+    Each arm (one variant of one sibling experiment) is treated as a draw of its true
+    rate from the prior. The spread of observed rates is corrected for binomial
+    sampling noise before matching moments:
+
+      m        = mean of observed rates
+      between  = var(observed rates) - m(1 - m) * mean(1 / trials)
+      strength = m(1 - m) / between - 1    (capped at max_strength)
+
+    Arms below min_trials are ignored. The variance estimate is unreliable with few
+    arms, so fewer than min_arms usable arms return fallback, as do no successes or
+    no failures at all, and between <= 0 (no spread beyond sampling noise, so the
+    strength is not identifiable from the data). between >= m(1 - m) makes the
+    strength <= 0 (more spread than any Beta with mean m allows), which also returns
+    fallback.
+    """
+    if max_strength <= 0.0:
+        raise ValueError("max_strength must be > 0")
+    if min_arms < 2:
+        raise ValueError("min_arms must be >= 2")
+    if len(trials) != len(successes):
+        raise ValueError("trials and successes must have the same length")
+
+    rates: list[float] = []
+    inv_trials: list[float] = []
+    for t, s in zip(trials, successes, strict=True):
+        if t >= min_trials and t > 0:
+            rates.append(s / t)
+            inv_trials.append(1.0 / t)
+
+    k = len(rates)
+    if k < min_arms:
+        return fallback
+
+    m = math.fsum(rates) / k
+    if m <= 0.0 or m >= 1.0:
+        return fallback
+
+    var_obs = math.fsum((r - m) ** 2 for r in rates) / (k - 1)
+    between = var_obs - m * (1.0 - m) * (math.fsum(inv_trials) / k)
+    if between <= 0.0:
+        return fallback
+    strength = min(max_strength, m * (1.0 - m) / between - 1.0)
+    if strength <= 0.0:
+        # Overdispersed: no Beta with mean m has this much spread.
+        return fallback
+
+    return BetaPrior(
+        prior_success=max(_MIN_PARAM, m * strength),
+        prior_failure=max(_MIN_PARAM, (1.0 - m) * strength),
+        fitted_on=k,
+    )
+
+
+def fit_beta_prior_from(
+    histories: Iterable[Mapping[VariantId, Observation]],
+    **kwargs: float | BetaPrior,
+) -> BetaPrior:
+    """Fit a prior to every variant of every sibling experiment's observations."""
+    trials: list[float] = []
+    successes: list[float] = []
+    for observations in histories:
+        _, t, s = observation_columns(observations)
+        trials.extend(t)
+        successes.extend(s)
+    return fit_beta_prior(trials, successes, **kwargs)
+
+
+class PriorCache:
+    """
+    Thread-safe cache of fitted priors keyed by experiment family.
+
+    Fitting is cheap but reading sibling history usually is not, so get_or_fit only
+    calls the history loader when the family has no entry or the entry is older than
+    max_age_s.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_age_s is not None and max_age_s <= 0.0:
+            raise ValueError("max_age_s must be > 0")
+        self._max_age_s = max_age_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[BetaPrior, float]] = {}
+
+    def get(self, family: str) -> BetaPrior | None:
+        with self._lock:
+            entry = self._entries.get(family)
+        if entry is None or self._expired(entry[1]):
+            return None
+        return entry[0]
+
+    def put(self, family: str, prior: BetaPrior) -> None:
+        with self._lock:
+            self._entries[family] = (prior, self._clock())
+
+    def get_or_fit(
+        self,
+        family: str,
+        load_history: Callable[[], Iterable[Mapping[VariantId, Observation]]],
+        **fit_kwargs: float | BetaPrior,
+    ) -> BetaPrior:
+        cached = self.get(family)
+        if cached is not None:
+            return cached
+        prior = fit_beta_prior_from(load_history(), **fit_kwargs)
+        self.put(family, prior)
+        return prior
+
+    def invalidate(self, family: str | None = None) -> None:
+        """Drop one family's prior, or all of them."""
+        with self._lock:
+            if family is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(family, None)
+
+    def _expired(self, fitted_at: float) -> bool:
+        return self._max_age_s is not None and self._clock() - fitted_at >= self._max_age_s
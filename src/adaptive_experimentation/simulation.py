@@ -0,0 +1,221 @@
+"""Offline simulation for evaluating strategies and Constraints presets.
+
+Each run replays num_windows control loop ticks against known conversion rates.
+Traffic for a window is split across variants with one multinomial draw and
+conversions are drawn with one binomial draw per window, so the cost is per
+window, not per event. Runs for many scenarios and seeds are spread across a
+process pool.
+
+Requires NumPy (`pip install adaptive-experimentation[numpy]`).
+"""
+from __future__ import annotations
+
+import math
+import statistics
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from ._numpy import require_numpy
+from .engine import Engine
+from .instrumentation import StageRecorder
+from .seeding import derive_seed
+from .types import Constraints, ObservationTable, VariantId
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A simulated experiment: true conversion rates plus the policy under test.
+
+    cumulative=False feeds each window's observations to the engine on their own (as
+    the examples do); cumulative=True feeds running totals since window 0.
+    """
+
+    name: str
+    true_rates: Mapping[VariantId, float]
+    traffic_per_window: int = 10_000
+    num_windows: int = 30
+    strategy: str = "thompson"
+    strategy_params: Mapping[str, Any] | None = None
+    constraints: Constraints = field(default_factory=Constraints)
+    cumulative: bool = False
+
+    def __post_init__(self) -> None:
+        if len(self.true_rates) < 2:
+            raise ValueError("true_rates must have at least 2 variants")
+        if any(not 0.0 <= r <= 1.0 for r in self.true_rates.values()):
+            raise ValueError("true_rates must be in [0, 1]")
+        if self.traffic_per_window < 1:
+            raise ValueError("traffic_per_window must be >= 1")
+        if self.num_windows < 1:
+            raise ValueError("num_windows must be >= 1")
+
+
+@dataclass(frozen=True)
+class SimulationRun:
+    """Outcome of one scenario replayed with one seed."""
+
+    scenario: str
+    seed: int
+    # Expected conversions lost versus always serving the best variant, per window.
+    regret_per_window: tuple[float, ...]
+    # First window from which the best variant keeps the largest weight until the
+    # end, or None if it does not hold the largest weight at the end.
+    convergence_window: int | None
+    min_trials_holds: int
+    clamp_hits: int
+    floor_hits: int
+    final_weights: dict[VariantId, float]
+
+    @property
+    def cumulative_regret(self) -> float:
+        return math.fsum(self.regret_per_window)
+
+
+@dataclass(frozen=True)
+class ScenarioSummary:
+    """Statistics of one scenario across seeds."""
+
+    scenario: str
+    runs: int
+    mean_regret: float
+    stdev_regret: float
+    converged_fraction: float
+    mean_convergence_window: float | None
+    mean_min_trials_holds: float
+    mean_clamp_hits: float
+    mean_floor_hits: float
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    runs: tuple[SimulationRun, ...]
+
+    def summary(self) -> dict[str, ScenarioSummary]:
+        """Per-scenario statistics, in first-seen scenario order."""
+        by_scenario: dict[str, list[SimulationRun]] = {}
+        for run in self.runs:
+            by_scenario.setdefault(run.scenario, []).append(run)
+
+        out: dict[str, ScenarioSummary] = {}
+        for name, runs in by_scenario.items():
+            regrets = [r.cumulative_regret for r in runs]
+            converged = [r.convergence_window for r in runs if r.convergence_window is not None]
+            out[name] = ScenarioSummary(
+                scenario=name,
+                runs=len(runs),
+                mean_regret=statistics.fmean(regrets),
+                stdev_regret=statistics.stdev(regrets) if len(regrets) > 1 else 0.0,
+                converged_fraction=len(converged) / len(runs),
+                mean_convergence_window=statistics.fmean(converged) if converged else None,
+                mean_min_trials_holds=statistics.fmean(r.min_trials_holds for r in runs),
+                mean_clamp_hits=statistics.fmean(r.clamp_hits for r in runs),
+                mean_floor_hits=statistics.fmean(r.floor_hits for r in runs),
+            )
+        return out
+
+
+def run_scenario(scenario: Scenario, seed: int) -> SimulationRun:
+    """
+    Replay one scenario with one seed; deterministic for a given (scenario, seed).
+
+    Traffic draws use a generator seeded with seed; strategy seeds are derived per
+    window with seeding.derive_seed, so they do not depend on how many traffic
+    draws came before.
+    """
+    np = require_numpy("simulation")
+
+    variant_ids = tuple(scenario.true_rates)
+    n = len(variant_ids)
+    rates = np.fromiter(scenario.true_rates.values(), dtype=np.float64, count=n)
+    best = int(rates.argmax())
+
+    rng = np.random.default_rng(seed)
+    recorder = StageRecorder()
+    engine = Engine(
+        strategy=scenario.strategy,
+        strategy_params=scenario.strategy_params,
+        tracer=recorder,
+        explain=False,
+    )
+
+    weights = {vid: 1.0 / n for vid in variant_ids}
+    trials_total = np.zeros(n, dtype=np.int64)
+    successes_total = np.zeros(n, dtype=np.int64)
+    regret: list[float] = []
+    best_is_top: list[bool] = []
+
+    for window in range(scenario.num_windows):
+        served = np.fromiter(weights.values(), dtype=np.float64, count=n)
+        trials = rng.multinomial(scenario.traffic_per_window, served / served.sum())
+        successes = rng.binomial(trials, rates)
+        regret.append(float(trials @ (rates[best] - rates)))
+
+        if scenario.cumulative:
+            trials_total += trials
+            successes_total += successes
+            trials, successes = trials_total, successes_total
+
+        result = engine.compute(
+            observations=ObservationTable(variant_ids, trials.tolist(), successes.tolist()),
+            previous_weights=weights,
+            constraints=scenario.constraints,
+            seed=derive_seed(seed, "strategy", window),
+        )
+        weights = dict(result.weights)
+        best_is_top.append(max(weights, key=weights.__getitem__) == variant_ids[best])
+
+    convergence_window = None
+    for w in range(len(best_is_top) - 1, -1, -1):
+        if not best_is_top[w]:
+            break
+        convergence_window = w
+
+    guardrails = recorder.counters().get("guardrails", {})
+    return SimulationRun(
+        scenario=scenario.name,
+        seed=seed,
+        regret_per_window=tuple(regret),
+        convergence_window=convergence_window,
+        min_trials_holds=guardrails.get("held", 0),
+        clamp_hits=guardrails.get("clamp_hits", 0),
+        floor_hits=guardrails.get("floor_hits", 0),
+        final_weights=weights,
+    )
+
+
+def _run_pair(args: tuple[Scenario, int]) -> SimulationRun:
+    return run_scenario(*args)
+
+
+def simulate(
+    scenarios: Iterable[Scenario],
+    seeds: Iterable[int],
+    *,
+    max_workers: int | None = None,
+) -> SimulationReport:
+    """
+    Run every scenario with every seed and collect the runs.
+
+    Runs are spread across a process pool of max_workers processes (default: one per
+    CPU); max_workers=1 runs them in the calling process. Results do not depend on
+    the number of workers and are ordered by scenario, then seed.
+    """
+    require_numpy("simulation")
+    scenarios = list(scenarios)
+    seeds = list(seeds)
+    names = [s.name for s in scenarios]
+    if len(set(names)) != len(names):
+        raise ValueError("scenario names must be unique")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    pairs = [(scenario, seed) for scenario in scenarios for seed in seeds]
+    if max_workers == 1 or len(pairs) <= 1:
+        return SimulationReport(runs=tuple(_run_pair(p) for p in pairs))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        runs = tuple(pool.map(_run_pair, pairs, chunksize=max(1, len(pairs) // 64)))
+    return SimulationReport(runs=runs)
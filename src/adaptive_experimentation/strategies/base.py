@@ -14,6 +14,9 @@ class StrategyResult:
 
 class Strategy:
     name: str
+    # "binary" (Observation: trials/successes) or "continuous" (ContinuousObservation).
+    # Engine rejects observations of the other kind before calling the strategy.
+    observation_kind: str = "binary"
 
     def propose(
         self,
@@ -22,3 +25,27 @@ class Strategy:
         seed: int | None = None,
     ) -> StrategyResult:
         raise NotImplementedError
+
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        """Return only the proposed weights (used by Engine(explain=False)).
+
+        Must equal propose(...).proposed_weights for the same inputs. Override it to
+        skip building the explanation.
+        """
+        return self.propose(observations, seed=seed).proposed_weights
+
+    def beta_posterior(
+        self,
+        observations: Mapping[VariantId, Observation],
+    ) -> tuple[list[float], list[float]] | None:
+        """Return the (alpha, beta) columns of the Beta posteriors this strategy uses.
+
+        None (the default) means the strategy has no Beta posterior; Engine then
+        reports posterior_stats under a uniform prior, labeled prior="uniform".
+        """
+        return None
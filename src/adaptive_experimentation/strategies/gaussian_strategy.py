@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+
+from .._numpy import require_numpy
+from ..types import ContinuousObservation, VariantId, Weights
+from .base import Strategy, StrategyResult
+from .thompson_strategy import _resolve_backend, _rng
+
+
+def _posterior(
+    o: ContinuousObservation,
+    *,
+    prior_mean: float,
+    prior_strength: float,
+    prior_variance: float,
+) -> tuple[float, float]:
+    """Return (mean, stddev) of the Normal posterior over a variant's mean reward.
+
+    The prior counts as prior_strength pseudo-observations with mean prior_mean and
+    variance prior_variance; the reward variance is the pooled prior/sample estimate.
+    """
+    n = o.trials + prior_strength
+    mean = (prior_strength * prior_mean + o.reward_sum) / n
+    ss = max(0.0, o.reward_sum_sq - (o.reward_sum * o.reward_sum / o.trials if o.trials else 0.0))
+    variance = (prior_strength * prior_variance + ss) / n
+    return mean, math.sqrt(variance / n)
+
+
+def _check_continuous(observations: Mapping[VariantId, object], name: str) -> None:
+    for vid, o in observations.items():
+        if not isinstance(o, ContinuousObservation):
+            raise TypeError(f"{name} requires ContinuousObservation values; {vid!r} is not")
+
+
+class GaussianThompsonStrategy(Strategy):
+    """
+    Thompson Sampling for continuous rewards (e.g. revenue per visit).
+
+    Each variant's mean reward gets a Normal posterior from its sufficient
+    statistics (see ContinuousObservation):
+
+      n        = prior_strength + trials
+      mean     = (prior_strength * prior_mean + reward_sum) / n
+      variance = (prior_strength * prior_variance + sum of squared deviations) / n
+      posterior ~ Normal(mean, variance / n)
+
+    Because draws can be negative, weights are not proportional to one draw per
+    variant. Instead num_samples joint draws estimate P(variant has the highest mean),
+    and those probabilities are proposed as weights.
+    """
+
+    name = "gaussian_thompson"
+    observation_kind = "continuous"
+
+    def __init__(
+        self,
+        *,
+        prior_mean: float = 0.0,
+        prior_strength: float = 1.0,
+        prior_variance: float = 1.0,
+        num_samples: int = 1000,
+        backend: str = "stdlib",
+    ):
+        if prior_strength <= 0.0:
+            raise ValueError("prior_strength must be > 0")
+        if prior_variance <= 0.0:
+            raise ValueError("prior_variance must be > 0")
+        if num_samples < 1:
+            raise ValueError("num_samples must be >= 1")
+        self.prior_mean = float(prior_mean)
+        self.prior_strength = float(prior_strength)
+        self.prior_variance = float(prior_variance)
+        self.num_samples = int(num_samples)
+        self.backend = _resolve_backend(backend)
+
+    def propose(
+        self,
+        observations: Mapping[VariantId, ContinuousObservation],
+        *,
+        seed: int | None = None,
+    ) -> StrategyResult:
+        posterior = self._posterior(observations)
+        proposed = self._prob_best(posterior, seed=seed)
+        explanation: dict[str, object] = {
+            "strategy": self.name,
+            "priors": {
+                "prior_mean": self.prior_mean,
+                "prior_strength": self.prior_strength,
+                "prior_variance": self.prior_variance,
+            },
+            "posterior": {vid: {"mean": m, "stddev": sd} for vid, (m, sd) in posterior.items()},
+            "prob_best": dict(proposed),
+            "num_samples": self.num_samples,
+            "seed": seed,
+            "backend": self.backend,
+        }
+        return StrategyResult(proposed_weights=proposed, explanation=explanation)
+
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, ContinuousObservation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        return self._prob_best(self._posterior(observations), seed=seed)
+
+    def _posterior(
+        self, observations: Mapping[VariantId, ContinuousObservation]
+    ) -> dict[VariantId, tuple[float, float]]:
+        _check_continuous(observations, type(self).__name__)
+        return {
+            vid: _posterior(
+                o,
+                prior_mean=self.prior_mean,
+                prior_strength=self.prior_strength,
+                prior_variance=self.prior_variance,
+            )
+            for vid, o in observations.items()
+        }
+
+    def _prob_best(
+        self, posterior: Mapping[VariantId, tuple[float, float]], *, seed: int | None
+    ) -> Weights:
+        means = [m for m, _ in posterior.values()]
+        stddevs = [sd for _, sd in posterior.values()]
+
+        if self.backend == "numpy":
+            np = require_numpy("GaussianThompsonStrategy(backend='numpy')")
+            draws = np.random.default_rng(seed).normal(
+                means, stddevs, size=(self.num_samples, len(means))
+            )
+            wins = np.bincount(draws.argmax(axis=1), minlength=len(means)).tolist()
+        else:
+            rng = _rng(seed)
+            wins = [0] * len(means)
+            params = list(zip(means, stddevs, strict=True))
+            for _ in range(self.num_samples):
+                row = [rng.gauss(m, sd) for m, sd in params]
+                wins[row.index(max(row))] += 1
+
+        return {vid: w / self.num_samples for vid, w in zip(posterior, wins, strict=True)}
+
+
+class GaussianHeuristicStrategy(Strategy):
+    """
+    Deterministic counterpart of GaussianThompsonStrategy.
+
+    raw_score = max(0, (reward_sum + alpha * prior_mean) / (trials + alpha))
+
+    Weights are proportional to the smoothed mean reward; variants whose smoothed
+    mean is not positive get no raw weight (guardrail floors still apply). If no
+    variant has a positive score, weights are uniform.
+    """
+
+    name = "gaussian_heuristic"
+    observation_kind = "continuous"
+
+    def __init__(self, *, alpha: float = 1.0, prior_mean: float = 0.0):
+        if alpha <= 0.0:
+            raise ValueError("alpha must be > 0")
+        self.alpha = float(alpha)
+        self.prior_mean = float(prior_mean)
+
+    def propose(
+        self,
+        observations: Mapping[VariantId, ContinuousObservation],
+        *,
+        seed: int | None = None,
+    ) -> StrategyResult:
+        return StrategyResult(
+            proposed_weights=self.propose_weights(observations, seed=seed),
+            explanation={
+                "strategy": self.name,
+                "alpha": self.alpha,
+                "prior_mean": self.prior_mean,
+                "seed_used": seed is not None,
+            },
+        )
+
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, ContinuousObservation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        _check_continuous(observations, type(self).__name__)
+        scores = {
+            vid: max(0.0, (o.reward_sum + self.alpha * self.prior_mean) / (o.trials + self.alpha))
+            for vid, o in observations.items()
+        }
+        total = sum(scores.values())
+        if total <= 0.0:
+            n = len(scores)
+            return {vid: 1.0 / n for vid in scores}
+        return {vid: score / total for vid, score in scores.items()}
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
-from ..types import Observation, VariantId, Weights
+from ..types import Observation, VariantId, Weights, observation_columns
 
 
 def propose_weights(
@@ -17,8 +17,8 @@ def propose_weights(
     """
     scores: dict[VariantId, float] = {}
 
-    for vid, obs in observations.items():
-        score = (obs.successes + alpha) / (obs.trials + 2.0 * alpha)
+    for vid, trials, successes in zip(*observation_columns(observations), strict=True):
+        score = (successes + alpha) / (trials + 2.0 * alpha)
         scores[vid] = float(score)
 
     total = sum(scores.values())
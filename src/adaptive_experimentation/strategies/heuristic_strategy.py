@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
-from ..types import Observation, VariantId
+from ..types import Observation, VariantId, Weights
 from .base import Strategy, StrategyResult
 from .heuristic import propose_weights
 
@@ -10,14 +10,31 @@ from .heuristic import propose_weights
 class HeuristicStrategy(Strategy):
     name = "heuristic"
 
+    def __init__(self, *, alpha: float = 1.0):
+        if alpha <= 0.0:
+            raise ValueError("alpha must be > 0")
+        self.alpha = float(alpha)
+
     def propose(
         self,
         observations: Mapping[VariantId, Observation],
         *,
         seed: int | None = None,
     ) -> StrategyResult:
-        weights = propose_weights(observations)
+        weights = propose_weights(observations, alpha=self.alpha)
         return StrategyResult(
             proposed_weights=weights,
-            explanation={"strategy": self.name, "alpha": 1.0, "seed_used": seed is not None},
+            explanation={
+                "strategy": self.name,
+                "alpha": self.alpha,
+                "seed_used": seed is not None,
+            },
         )
+
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        return propose_weights(observations, alpha=self.alpha)
@@ -1,13 +1,135 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
 from .base import Strategy
+from .gaussian_strategy import GaussianHeuristicStrategy, GaussianThompsonStrategy
 from .heuristic_strategy import HeuristicStrategy
 from .thompson_strategy import ThompsonStrategy
+from .top_two_strategy import TopTwoThompsonStrategy
+from .ucb_strategy import BayesUCBStrategy, KLUCBStrategy, UCB1Strategy
+
+# Third-party packages can expose strategies through this entry point group:
+#
+#   [project.entry-points."adaptive_experimentation.strategies"]
+#   my_strategy = "my_package.strategies:MyStrategy"
+ENTRY_POINT_GROUP = "adaptive_experimentation.strategies"
+
+StrategyFactory = Callable[..., Strategy]
+F = TypeVar("F", bound=StrategyFactory)
+
+# Most recently used instances are kept; per-experiment params (e.g. fitted priors)
+# would otherwise grow the cache without bound.
+MAX_CACHED_INSTANCES = 256
+
+_factories: dict[str, StrategyFactory] = {}
+_instances: OrderedDict[Hashable, Strategy] = OrderedDict()
+_lock = threading.Lock()
+
+
+def register_strategy(
+    name: str,
+    factory: StrategyFactory | None = None,
+    *,
+    replace: bool = False,
+) -> Any:
+    """
+    Register a strategy factory (usually the Strategy class) under name.
+
+    Usable directly, register_strategy("mine", MyStrategy), or as a class decorator,
+    @register_strategy("mine"). Registering an existing name raises ValueError unless
+    replace=True; replacing drops cached instances for that name.
+    """
+
+    def decorator(f: F) -> F:
+        with _lock:
+            existing = _factories.get(name)
+            if existing is not None and existing is not f and not replace:
+                raise ValueError(f"strategy already registered: {name!r}")
+            _factories[name] = f
+            for key in [k for k in _instances if k[0] == name]:
+                del _instances[key]
+        return f
+
+    if factory is not None:
+        return decorator(factory)
+    return decorator
+
+
+def available_strategies() -> tuple[str, ...]:
+    """Return registered strategy names (including installed entry points)."""
+    from importlib.metadata import entry_points
+
+    names = set(_factories)
+    names.update(ep.name for ep in entry_points(group=ENTRY_POINT_GROUP))
+    return tuple(sorted(names))
+
+
+def clear_strategy_cache() -> None:
+    """Drop all cached strategy instances."""
+    with _lock:
+        _instances.clear()
+
+
+def _load_entry_point(name: str) -> StrategyFactory | None:
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        if ep.name == name:
+            factory = ep.load()
+            with _lock:
+                return _factories.setdefault(name, factory)
+    return None
+
+
+def _cache_key(name: str, params: dict[str, Any]) -> Hashable | None:
+    key = (name, tuple(sorted(params.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_strategy(name: str, **params: Any) -> Strategy:
+    """
+    Return a strategy instance for name, configured with params.
+
+    Instances are cached per (name, params) and shared, so strategies must not keep
+    per-call state. Parameters that are not hashable bypass the cache. The cache
+    holds the MAX_CACHED_INSTANCES most recently used instances.
+    """
+    key = _cache_key(name, params)
+    if key is not None:
+        with _lock:
+            cached = _instances.get(key)
+            if cached is not None:
+                _instances.move_to_end(key)
+                return cached
+
+    factory = _factories.get(name) or _load_entry_point(name)
+    if factory is None:
+        raise ValueError(f"unknown strategy: {name!r}")
+
+    strategy = factory(**params)
+    if key is None:
+        return strategy
+    with _lock:
+        strategy = _instances.setdefault(key, strategy)
+        _instances.move_to_end(key)
+        while len(_instances) > MAX_CACHED_INSTANCES:
+            _instances.popitem(last=False)
+    return strategy
 
 
-def get_strategy(name: str) -> Strategy:
-    if name == "heuristic":
-        return HeuristicStrategy()
-    if name == "thompson":
-        return ThompsonStrategy()
-    raise ValueError(f"unknown strategy: {name!r}")
+register_strategy("heuristic", HeuristicStrategy)
+register_strategy("thompson", ThompsonStrategy)
+register_strategy("gaussian_heuristic", GaussianHeuristicStrategy)
+register_strategy("gaussian_thompson", GaussianThompsonStrategy)
+register_strategy("ucb1", UCB1Strategy)
+register_strategy("kl_ucb", KLUCBStrategy)
+register_strategy("bayes_ucb", BayesUCBStrategy)
+register_strategy("top_two_thompson", TopTwoThompsonStrategy)
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import math
+import time
+from collections.abc import Mapping, Sequence
 
-from ..types import Observation, VariantId, Weights
+from .._numpy import optional_numpy, require_numpy
+from ..types import Observation, VariantId, Weights, observation_columns
 from .base import Strategy, StrategyResult
 
+BACKENDS = ("stdlib", "numpy", "auto")
+MODES = ("sample", "prob_best")
+
+# Rows drawn per batch in prob_best mode when a time budget is set.
+_PROB_BEST_CHUNK_ROWS = 256
+
 
 def _rng(seed: int | None):
     # Keep dependencies minimal: use stdlib random.
@@ -18,6 +27,25 @@ def _beta_sample(rng, alpha: float, beta: float) -> float:
     return float(rng.betavariate(alpha, beta))
 
 
+def _resolve_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend: {backend!r}; expected one of {BACKENDS}")
+    if backend == "auto":
+        return "numpy" if optional_numpy() is not None else "stdlib"
+    if backend == "numpy":
+        require_numpy("ThompsonStrategy(backend='numpy')")
+    return backend
+
+
+def _proportional(samples: Mapping[VariantId, float]) -> Weights:
+    total = sum(samples.values())
+    if total <= 0.0:
+        # Extremely unlikely, but keep safe fallback.
+        n = len(samples)
+        return {vid: 1.0 / n for vid in samples}
+    return {vid: s / total for vid, s in samples.items()}
+
+
 class ThompsonStrategy(Strategy):
     """
     Thompson Sampling for binary outcomes using a Beta-Bernoulli model.
@@ -26,15 +54,52 @@ class ThompsonStrategy(Strategy):
       alpha = prior_success + successes
       beta  = prior_failure  + (trials - successes)
 
-    Proposed weights are proportional to one posterior draw per variant.
+    Fractional (e.g. exponentially-decayed) trials/successes are accepted as-is,
+    which shrinks the effective sample size of older evidence.
+
+    Modes:
+      - "sample" (default): proposed weights are proportional to one posterior
+        draw per variant.
+      - "prob_best": draws num_samples posterior samples per variant (a
+        num_samples x n_variants matrix), estimates P(variant is best) and proposes
+        those probabilities as weights. This is far less noisy window to window.
+        If time_budget_s is set, sampling stops early once the budget is spent
+        (so results then also depend on machine speed).
+
+    Backends:
+      - "stdlib" (default): random.Random.betavariate draws in a Python loop.
+      - "numpy": all draws made in one vectorized Generator.beta call.
+      - "auto": "numpy" when NumPy is installed, otherwise "stdlib".
+
+    Both backends are deterministic for a given seed, but they use different
+    generators, so the same seed yields different draws across backends.
     """
     name = "thompson"
 
-    def __init__(self, *, prior_success: float = 1.0, prior_failure: float = 1.0):
+    def __init__(
+        self,
+        *,
+        prior_success: float = 1.0,
+        prior_failure: float = 1.0,
+        backend: str = "stdlib",
+        mode: str = "sample",
+        num_samples: int = 1000,
+        time_budget_s: float | None = None,
+    ):
         if prior_success <= 0.0 or prior_failure <= 0.0:
             raise ValueError("priors must be > 0")
+        if mode not in MODES:
+            raise ValueError(f"unknown mode: {mode!r}; expected one of {MODES}")
+        if num_samples < 1:
+            raise ValueError("num_samples must be >= 1")
+        if time_budget_s is not None and time_budget_s <= 0.0:
+            raise ValueError("time_budget_s must be > 0")
         self.prior_success = float(prior_success)
         self.prior_failure = float(prior_failure)
+        self.backend = _resolve_backend(backend)
+        self.mode = mode
+        self.num_samples = int(num_samples)
+        self.time_budget_s = None if time_budget_s is None else float(time_budget_s)
 
     def propose(
         self,
@@ -42,33 +107,133 @@ class ThompsonStrategy(Strategy):
         *,
         seed: int | None = None,
     ) -> StrategyResult:
-        rng = _rng(seed)
-
-        posterior: dict[VariantId, dict[str, float]] = {}
-        samples: dict[VariantId, float] = {}
-
-        for vid, obs in observations.items():
-            failures = obs.trials - obs.successes
-            alpha = self.prior_success + obs.successes
-            beta = self.prior_failure + failures
-
-            posterior[vid] = {"alpha": float(alpha), "beta": float(beta)}
-            samples[vid] = _beta_sample(rng, float(alpha), float(beta))
-
-        total = sum(samples.values())
-        if total <= 0.0:
-            # Extremely unlikely, but keep safe fallback.
-            n = len(samples)
-            proposed: Weights = {vid: 1.0 / n for vid in samples}
-        else:
-            proposed = {vid: s / total for vid, s in samples.items()}
-
-        explanation: dict[str, object] = {
+        variant_ids, alpha, beta = self._posterior_params(observations)
+        posterior = {
+            vid: {"alpha": a, "beta": b}
+            for vid, a, b in zip(variant_ids, alpha, beta, strict=True)
+        }
+        priors = {"prior_success": self.prior_success, "prior_failure": self.prior_failure}
+
+        if self.mode == "prob_best":
+            wins, used = self._count_wins(alpha, beta, seed=seed)
+            prob_best = {vid: w / used for vid, w in zip(variant_ids, wins, strict=True)}
+            mc_stderr = {vid: math.sqrt(p * (1.0 - p) / used) for vid, p in prob_best.items()}
+            explanation: dict[str, object] = {
+                "strategy": self.name,
+                "mode": self.mode,
+                "priors": priors,
+                "posterior": posterior,
+                "prob_best": prob_best,
+                "mc_stderr": mc_stderr,
+                "num_samples": self.num_samples,
+                "samples_used": used,
+                "time_budget_s": self.time_budget_s,
+                "seed": seed,
+                "backend": self.backend,
+            }
+            return StrategyResult(proposed_weights=dict(prob_best), explanation=explanation)
+
+        samples = dict(zip(variant_ids, self._draw(alpha, beta, seed=seed), strict=True))
+        explanation = {
             "strategy": self.name,
-            "priors": {"prior_success": self.prior_success, "prior_failure": self.prior_failure},
+            "priors": priors,
             "posterior": posterior,
             "samples": samples,
             "seed": seed,
+            "backend": self.backend,
         }
+        return StrategyResult(proposed_weights=_proportional(samples), explanation=explanation)
 
-        return StrategyResult(proposed_weights=proposed, explanation=explanation)
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        variant_ids, alpha, beta = self._posterior_params(observations)
+        if self.mode == "prob_best":
+            wins, used = self._count_wins(alpha, beta, seed=seed)
+            return {vid: w / used for vid, w in zip(variant_ids, wins, strict=True)}
+        draws = self._draw(alpha, beta, seed=seed)
+        return _proportional(dict(zip(variant_ids, draws, strict=True)))
+
+    def beta_posterior(
+        self,
+        observations: Mapping[VariantId, Observation],
+    ) -> tuple[list[float], list[float]]:
+        _, alpha, beta = self._posterior_params(observations)
+        return alpha, beta
+
+    def _posterior_params(
+        self,
+        observations: Mapping[VariantId, Observation],
+    ) -> tuple[Sequence[VariantId], list[float], list[float]]:
+        """Return (variant_ids, alpha, beta) columns of the Beta posteriors."""
+        variant_ids, trials, successes = observation_columns(observations)
+        alpha = [float(self.prior_success + s) for s in successes]
+        beta = [float(self.prior_failure + (t - s)) for t, s in zip(trials, successes, strict=True)]
+        return variant_ids, alpha, beta
+
+    def _draw(self, alpha: list[float], beta: list[float], *, seed: int | None) -> list[float]:
+        """One posterior draw per variant."""
+        if self.backend == "numpy":
+            np = require_numpy("ThompsonStrategy(backend='numpy')")
+            return np.random.default_rng(seed).beta(alpha, beta).tolist()
+        rng = _rng(seed)
+        return [_beta_sample(rng, a, b) for a, b in zip(alpha, beta, strict=True)]
+
+    def _count_wins(
+        self, alpha: list[float], beta: list[float], *, seed: int | None
+    ) -> tuple[list[int], int]:
+        if self.backend == "numpy":
+            return self._count_wins_numpy(alpha, beta, seed=seed)
+        return self._count_wins_stdlib(alpha, beta, seed=seed)
+
+    def _deadline(self) -> float | None:
+        if self.time_budget_s is None:
+            return None
+        return time.perf_counter() + self.time_budget_s
+
+    def _count_wins_stdlib(
+        self, alpha: list[float], beta: list[float], *, seed: int | None
+    ) -> tuple[list[int], int]:
+        rng = _rng(seed)
+        params = list(zip(alpha, beta, strict=True))
+        wins = [0] * len(params)
+        deadline = self._deadline()
+
+        used = 0
+        while used < self.num_samples:
+            row = [_beta_sample(rng, a, b) for a, b in params]
+            wins[row.index(max(row))] += 1
+            used += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        return wins, used
+
+    def _count_wins_numpy(
+        self, alpha: list[float], beta: list[float], *, seed: int | None
+    ) -> tuple[list[int], int]:
+        np = require_numpy("ThompsonStrategy(backend='numpy')")
+
+        n = len(alpha)
+        alpha = np.asarray(alpha, dtype=np.float64)
+        beta = np.asarray(beta, dtype=np.float64)
+
+        rng = np.random.default_rng(seed)
+        wins = np.zeros(n, dtype=np.int64)
+        deadline = self._deadline()
+        # Without a budget, draw the whole (num_samples x n) matrix in one call.
+        chunk = self.num_samples if deadline is None else _PROB_BEST_CHUNK_ROWS
+
+        used = 0
+        while used < self.num_samples:
+            rows = min(chunk, self.num_samples - used)
+            draws = rng.beta(alpha, beta, size=(rows, n))
+            wins += np.bincount(draws.argmax(axis=1), minlength=n)
+            used += rows
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        return wins.tolist(), used
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+
+from ..types import Observation, VariantId, Weights
+from .base import StrategyResult
+from .thompson_strategy import ThompsonStrategy
+
+
+def _top_two(prob_best: Sequence[float], leader_prob: float) -> list[float]:
+    """
+    Allocation of top-two Thompson sampling given P(best) per variant.
+
+    The leader I is drawn with P(best); with probability 1 - leader_prob the challenger,
+    a fresh draw conditioned on J != I, is served instead:
+
+      psi_j = leader_prob * p_j + (1 - leader_prob) * p_j * sum_{i != j} p_i / (1 - p_i)
+    """
+    n = len(prob_best)
+    if n == 1:
+        return [1.0]
+    certain = [i for i, p in enumerate(prob_best) if p >= 1.0]
+    if certain:
+        # Every draw has the same leader; challengers are then equally likely.
+        leader = certain[0]
+        rest = (1.0 - leader_prob) / (n - 1)
+        return [leader_prob if i == leader else rest for i in range(n)]
+
+    odds = [p / (1.0 - p) for p in prob_best]
+    total_odds = math.fsum(odds)
+    return [
+        p * (leader_prob + (1.0 - leader_prob) * (total_odds - o))
+        for p, o in zip(prob_best, odds, strict=True)
+    ]
+
+
+class TopTwoThompsonStrategy(ThompsonStrategy):
+    """
+    Top-two Thompson Sampling (Russo) for best-arm identification.
+
+    Plain Thompson Sampling concentrates traffic on the apparent winner, which slows
+    down confirming it against the runner-up. Top-two Thompson serves the posterior
+    leader with probability leader_prob and otherwise its strongest challenger, so
+    the runner-up keeps enough traffic to be ruled in or out.
+
+    P(best) is estimated as in ThompsonStrategy(mode="prob_best"); the top-two
+    allocation is then computed from it in closed form rather than by resampling.
+    """
+
+    name = "top_two_thompson"
+
+    def __init__(
+        self,
+        *,
+        leader_prob: float = 0.5,
+        prior_success: float = 1.0,
+        prior_failure: float = 1.0,
+        backend: str = "stdlib",
+        num_samples: int = 1000,
+        time_budget_s: float | None = None,
+    ):
+        if not 0.0 < leader_prob <= 1.0:
+            raise ValueError("leader_prob must be in (0, 1]")
+        super().__init__(
+            prior_success=prior_success,
+            prior_failure=prior_failure,
+            backend=backend,
+            mode="prob_best",
+            num_samples=num_samples,
+            time_budget_s=time_budget_s,
+        )
+        self.leader_prob = float(leader_prob)
+
+    def propose(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> StrategyResult:
+        result = super().propose(observations, seed=seed)
+        prob_best = result.proposed_weights
+        weights = dict(
+            zip(prob_best, _top_two(list(prob_best.values()), self.leader_prob), strict=True)
+        )
+        explanation = {
+            **result.explanation,
+            "strategy": self.name,
+            "leader_prob": self.leader_prob,
+        }
+        return StrategyResult(proposed_weights=weights, explanation=explanation)
+
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        prob_best = super().propose_weights(observations, seed=seed)
+        return dict(
+            zip(prob_best, _top_two(list(prob_best.values()), self.leader_prob), strict=True)
+        )
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+
+from .._numpy import require_numpy
+from .._special import betaincinv_array
+from ..posterior import beta_quantile
+from ..types import Observation, VariantId, Weights, observation_columns
+from .base import Strategy, StrategyResult
+from .thompson_strategy import _resolve_backend
+
+# Bisection steps for the vectorized KL-UCB bound; 2**-48 is below float noise on [0, 1].
+_KL_UCB_ITERATIONS = 48
+_KL_NEWTON_ITERATIONS = 100
+_KL_TOL = 1e-13
+_KL_CLIP = 1e-15
+
+
+def _top_weights(variant_ids: Sequence[VariantId], index: Sequence[float]) -> Weights:
+    """All proposed weight on the highest index; ties are split evenly."""
+    best = max(index)
+    top = [vid for vid, u in zip(variant_ids, index, strict=True) if u == best]
+    share = 1.0 / len(top)
+    return {vid: (share if u == best else 0.0) for vid, u in zip(variant_ids, index, strict=True)}
+
+
+def _means(trials: Sequence[float], successes: Sequence[float]) -> list[float]:
+    return [s / t if t > 0 else 0.0 for t, s in zip(trials, successes, strict=True)]
+
+
+class _IndexStrategy(Strategy):
+    """
+    Base for deterministic index policies.
+
+    Each variant gets an optimistic index computed in closed form from its counts;
+    the variant with the highest index receives all proposed weight (ties split
+    evenly). Guardrails then limit how fast weight moves and keep floors on the
+    other variants. Untried variants get an infinite index, reported as None in the
+    explanation so it stays valid JSON.
+    """
+
+    def propose(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> StrategyResult:
+        variant_ids, trials, successes = observation_columns(observations)
+        index = self._index(trials, successes)
+        explanation: dict[str, object] = {
+            "strategy": self.name,
+            **self._params(trials),
+            "means": dict(zip(variant_ids, _means(trials, successes), strict=True)),
+            "index": {
+                vid: (u if math.isfinite(u) else None)
+                for vid, u in zip(variant_ids, index, strict=True)
+            },
+            "seed_used": seed is not None,
+        }
+        return StrategyResult(
+            proposed_weights=_top_weights(variant_ids, index), explanation=explanation
+        )
+
+    def propose_weights(
+        self,
+        observations: Mapping[VariantId, Observation],
+        *,
+        seed: int | None = None,
+    ) -> Weights:
+        variant_ids, trials, successes = observation_columns(observations)
+        return _top_weights(variant_ids, self._index(trials, successes))
+
+    def _index(self, trials: Sequence[float], successes: Sequence[float]) -> list[float]:
+        raise NotImplementedError
+
+    def _params(self, trials: Sequence[float]) -> dict[str, object]:
+        raise NotImplementedError
+
+
+class UCB1Strategy(_IndexStrategy):
+    """
+    UCB1 (Auer et al.):
+
+      index = mean + exploration * sqrt(2 ln N / trials)
+
+    where N is the total number of trials across variants.
+    """
+
+    name = "ucb1"
+
+    def __init__(self, *, exploration: float = 1.0, backend: str = "stdlib"):
+        if exploration < 0.0:
+            raise ValueError("exploration must be >= 0")
+        self.exploration = float(exploration)
+        self.backend = _resolve_backend(backend)
+
+    def _params(self, trials: Sequence[float]) -> dict[str, object]:
+        return {"exploration": self.exploration, "backend": self.backend}
+
+    def _index(self, trials: Sequence[float], successes: Sequence[float]) -> list[float]:
+        log_total = math.log(max(1.0, float(sum(trials))))
+        if self.backend == "numpy":
+            np = require_numpy("UCB1Strategy(backend='numpy')")
+            t = np.asarray(trials, dtype=np.float64)
+            s = np.asarray(successes, dtype=np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                index = s / t + self.exploration * np.sqrt(2.0 * log_total / t)
+            return np.where(t > 0, index, math.inf).tolist()
+        return [
+            s / t + self.exploration * math.sqrt(2.0 * log_total / t) if t > 0 else math.inf
+            for t, s in zip(trials, successes, strict=True)
+        ]
+
+
+def _kl_bernoulli(p: float, q: float) -> float:
+    p = min(max(p, _KL_CLIP), 1.0 - _KL_CLIP)
+    q = min(max(q, _KL_CLIP), 1.0 - _KL_CLIP)
+    return p * math.log(p / q) + (1.0 - p) * math.log((1.0 - p) / (1.0 - q))
+
+
+def _kl_ucb_bound(mean: float, target: float) -> float:
+    """Largest q in [mean, 1] with kl(mean, q) <= target, by Newton's method.
+
+    Iterates on y = -ln(1 - q), in which kl(mean, q) is convex and increasing (and
+    nearly linear close to q = 1), so Newton steps started right of the root decrease
+    monotonically onto it. Pinsker's inequality, kl(mean, q) >= 2 (q - mean)^2, puts
+    q = mean + sqrt(target / 2) right of the root.
+    """
+    q = min(1.0 - _KL_CLIP, mean + math.sqrt(target / 2.0))
+    y = -math.log1p(-q)
+    for _ in range(_KL_NEWTON_ITERATIONS):
+        excess = _kl_bernoulli(mean, q) - target
+        if excess <= 0.0:
+            return q
+        # d kl / dy = (q - mean) / q
+        step = excess * q / (q - mean)
+        y -= step
+        q = -math.expm1(-y)
+        if step <= _KL_TOL * y:
+            break
+    return q
+
+
+class KLUCBStrategy(_IndexStrategy):
+    """
+    KL-UCB for Bernoulli rewards (Garivier & Cappe):
+
+      index = max { q in [mean, 1] : trials * kl(mean, q) <= ln N + c ln ln N }
+
+    where kl is the Bernoulli KL divergence and N the total number of trials. The
+    stdlib backend solves for the bound with Newton's method per variant; the numpy
+    backend bisects for all variants at once.
+    """
+
+    name = "kl_ucb"
+
+    def __init__(self, *, c: float = 0.0, backend: str = "stdlib"):
+        if c < 0.0:
+            raise ValueError("c must be >= 0")
+        self.c = float(c)
+        self.backend = _resolve_backend(backend)
+
+    def _params(self, trials: Sequence[float]) -> dict[str, object]:
+        return {"c": self.c, "backend": self.backend}
+
+    def _budget(self, total: float) -> float:
+        if total <= 1.0:
+            return 0.0
+        log_total = math.log(total)
+        return log_total + self.c * math.log(max(log_total, 1.0))
+
+    def _index(self, trials: Sequence[float], successes: Sequence[float]) -> list[float]:
+        budget = self._budget(float(sum(trials)))
+        if self.backend == "numpy":
+            return self._index_numpy(trials, successes, budget)
+
+        return [
+            _kl_ucb_bound(mu, budget / t) if t > 0 else math.inf
+            for mu, t in zip(_means(trials, successes), trials, strict=True)
+        ]
+
+    def _index_numpy(
+        self, trials: Sequence[float], successes: Sequence[float], budget: float
+    ) -> list[float]:
+        np = require_numpy("KLUCBStrategy(backend='numpy')")
+        t = np.asarray(trials, dtype=np.float64)
+        s = np.asarray(successes, dtype=np.float64)
+        tried = t > 0
+        mu = np.where(tried, s / np.where(tried, t, 1.0), 0.0)
+        target = np.where(tried, budget / np.where(tried, t, 1.0), np.inf)
+
+        p = np.clip(mu, _KL_CLIP, 1.0 - _KL_CLIP)
+        lo, hi = mu.copy(), np.ones_like(mu)
+        for _ in range(_KL_UCB_ITERATIONS):
+            mid = 0.5 * (lo + hi)
+            q = np.clip(mid, _KL_CLIP, 1.0 - _KL_CLIP)
+            kl = p * np.log(p / q) + (1.0 - p) * np.log((1.0 - p) / (1.0 - q))
+            over = kl > target
+            hi = np.where(over, mid, hi)
+            lo = np.where(over, lo, mid)
+        return np.where(tried, lo, np.inf).tolist()
+
+
+class BayesUCBStrategy(_IndexStrategy):
+    """
+    Bayes-UCB for Bernoulli rewards (Kaufmann et al.):
+
+      index = quantile of Beta(prior_success + successes, prior_failure + failures)
+              at level 1 - 1 / (N (ln N)^c)
+
+    where N is the total number of trials (at least 2). Quantiles are computed with
+    the regularized incomplete beta function, no sampling involved. The stdlib
+    backend inverts it per variant and caches the result (posterior.beta_quantile),
+    so held experiments do not recompute them; the numpy backend inverts it for all
+    variants at once, uncached, which is faster when counts change every call.
+    """
+
+    name = "bayes_ucb"
+
+    def __init__(
+        self,
+        *,
+        prior_success: float = 1.0,
+        prior_failure: float = 1.0,
+        c: float = 0.0,
+        backend: str = "stdlib",
+    ):
+        if prior_success <= 0.0 or prior_failure <= 0.0:
+            raise ValueError("priors must be > 0")
+        if c < 0.0:
+            raise ValueError("c must be >= 0")
+        self.prior_success = float(prior_success)
+        self.prior_failure = float(prior_failure)
+        self.c = float(c)
+        self.backend = _resolve_backend(backend)
+
+    def _params(self, trials: Sequence[float]) -> dict[str, object]:
+        return {
+            "priors": {"prior_success": self.prior_success, "prior_failure": self.prior_failure},
+            "c": self.c,
+            "level": self.level(sum(trials)),
+            "backend": self.backend,
+        }
+
+    def beta_posterior(
+        self,
+        observations: Mapping[VariantId, Observation],
+    ) -> tuple[list[float], list[float]]:
+        _, trials, successes = observation_columns(observations)
+        alpha = [self.prior_success + s for s in successes]
+        beta = [self.prior_failure + (t - s) for t, s in zip(trials, successes, strict=True)]
+        return alpha, beta
+
+    def level(self, total_trials: float) -> float:
+        """Quantile level used when the variants have total_trials trials in all."""
+        horizon = max(2.0, float(total_trials))
+        return 1.0 - 1.0 / (horizon * math.log(horizon) ** self.c)
+
+    def _index(self, trials: Sequence[float], successes: Sequence[float]) -> list[float]:
+        level = self.level(sum(trials))
+        if self.backend == "numpy":
+            np = require_numpy("BayesUCBStrategy(backend='numpy')")
+            t = np.asarray(trials, dtype=np.float64)
+            s = np.asarray(successes, dtype=np.float64)
+            return betaincinv_array(
+                self.prior_success + s, self.prior_failure + (t - s), level
+            ).tolist()
+        return [
+            beta_quantile(self.prior_success + s, self.prior_failure + (t - s), level)
+            for t, s in zip(trials, successes, strict=True)
+        ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from .explanations import AllocationExplanation
@@ -17,10 +18,217 @@ class Observation:
     Aggregated binary-outcome observation for a variant.
     trials: number of opportunities (e.g., impressions)
     successes: number of positive outcomes (e.g., clicks)
+
+    Counts are usually integers, but may be fractional when they come from a decayed
+    source (see integrations.accumulator.WindowedAccumulator); the built-in
+    strategies and guardrails accept both.
+    """
+
+    trials: float
+    successes: float
+
+
+@dataclass(frozen=True, slots=True)
+class ContinuousObservation:
+    """
+    Aggregated continuous-reward observation for a variant (e.g. revenue per visit).
+    trials: number of opportunities (e.g., visits)
+    reward_sum: sum of rewards
+    reward_sum_sq: sum of squared rewards
+
+    These sufficient statistics are O(1) in memory and merge by addition, so raw
+    reward lists never need to be kept or shipped. Rewards may be negative.
+
+    successes aliases reward_sum, so observation summaries and trials-based
+    guardrails treat continuous and binary observations alike.
     """
 
     trials: int
-    successes: int
+    reward_sum: float
+    reward_sum_sq: float
+
+    @property
+    def successes(self) -> float:
+        return self.reward_sum
+
+    @property
+    def mean(self) -> float:
+        return self.reward_sum / self.trials if self.trials else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Unbiased sample variance of the rewards (0.0 for fewer than 2 trials)."""
+        if self.trials < 2:
+            return 0.0
+        ss = self.reward_sum_sq - self.reward_sum * self.reward_sum / self.trials
+        return max(0.0, ss / (self.trials - 1))
+
+    @classmethod
+    def from_rewards(cls, rewards: Iterable[float]) -> ContinuousObservation:
+        """Aggregate rewards in one pass without storing them."""
+        n = 0
+        total = 0.0
+        total_sq = 0.0
+        for r in rewards:
+            n += 1
+            total += r
+            total_sq += r * r
+        return cls(trials=n, reward_sum=total, reward_sum_sq=total_sq)
+
+    def add(self, reward: float) -> ContinuousObservation:
+        return ContinuousObservation(
+            trials=self.trials + 1,
+            reward_sum=self.reward_sum + reward,
+            reward_sum_sq=self.reward_sum_sq + reward * reward,
+        )
+
+    def merge(self, other: ContinuousObservation) -> ContinuousObservation:
+        return ContinuousObservation(
+            trials=self.trials + other.trials,
+            reward_sum=self.reward_sum + other.reward_sum,
+            reward_sum_sq=self.reward_sum_sq + other.reward_sum_sq,
+        )
+
+
+class ObservationTable(Mapping[VariantId, Observation]):
+    """
+    Columnar observations: variant ids held once, plus contiguous trials/successes
+    arrays (stdlib array): int64 (typecode "q") by default, or float64 ("d") with
+    fractional=True for fractional, e.g. decayed, counts.
+
+    It is a read-only Mapping[VariantId, Observation], so it can be passed anywhere
+    observations are accepted. The engine, strategies and guardrails read the
+    columns directly instead of building one Observation per variant; item
+    access builds Observation objects on demand only.
+
+    The constructor validates every row (ValidationError on bad counts) and marks
+    the table validated, so the engine does not check it again on each compute.
+    """
+
+    __slots__ = ("variant_ids", "trials", "successes", "validated", "_index")
+
+    def __init__(
+        self,
+        variant_ids: Iterable[VariantId],
+        trials: Iterable[float],
+        successes: Iterable[float],
+        *,
+        fractional: bool = False,
+    ) -> None:
+        typecode = "d" if fractional else "q"
+        self.variant_ids: tuple[VariantId, ...] = tuple(variant_ids)
+        self.trials = array(typecode, trials)
+        self.successes = array(typecode, successes)
+        self._index: dict[VariantId, int] | None = None
+
+        n = len(self.variant_ids)
+        if len(self.trials) != n or len(self.successes) != n:
+            raise ValueError(
+                f"column lengths differ: variant_ids={n}, trials={len(self.trials)}, "
+                f"successes={len(self.successes)}"
+            )
+        if len(set(self.variant_ids)) != n:
+            raise ValueError("variant_ids must be unique")
+        self.validated = False
+        self.validate()
+
+    @classmethod
+    def from_mapping(cls, observations: Mapping[VariantId, Observation]) -> ObservationTable:
+        if isinstance(observations, ObservationTable):
+            return observations
+        values = observations.values()
+        return cls(
+            observations.keys(),
+            (o.trials for o in values),
+            (o.successes for o in values),
+            fractional=not all(
+                isinstance(o.trials, int) and isinstance(o.successes, int) for o in values
+            ),
+        )
+
+    @classmethod
+    def wrap(
+        cls,
+        variant_ids: tuple[VariantId, ...],
+        trials: array,
+        successes: array,
+    ) -> ObservationTable:
+        """
+        Build a table around existing arrays without copying or checking them.
+
+        Both columns must have the same typecode, "q" (int64) or "d" (float64, for
+        fractional counts). The caller guarantees the columns are aligned and unique,
+        and must not mutate the arrays while the table is in use. The table is not
+        validated: the engine checks it on every compute unless validate() is called
+        first.
+        """
+        table = cls.__new__(cls)
+        table.variant_ids = variant_ids
+        table.trials = trials
+        table.successes = successes
+        table.validated = False
+        table._index = None
+        return table
+
+    def validate(self) -> ObservationTable:
+        """
+        Check every row (see validate_observations) and mark the table validated.
+
+        Raises ValidationError on the first invalid row. Validated tables skip the
+        per-row checks in Engine.compute, so their columns must not change afterwards.
+        """
+        from .validation import validate_observation_rows
+
+        validate_observation_rows(self.variant_ids, self.trials, self.successes)
+        self.validated = True
+        return self
+
+    @property
+    def fractional(self) -> bool:
+        """True when the columns hold float64 (possibly fractional) counts."""
+        return self.trials.typecode == "d"
+
+    def _positions(self) -> dict[VariantId, int]:
+        if self._index is None:
+            self._index = {vid: i for i, vid in enumerate(self.variant_ids)}
+        return self._index
+
+    def __getitem__(self, vid: VariantId) -> Observation:
+        i = self._positions()[vid]
+        return Observation(trials=self.trials[i], successes=self.successes[i])
+
+    def __contains__(self, vid: object) -> bool:
+        return vid in self._positions()
+
+    def __iter__(self) -> Iterator[VariantId]:
+        return iter(self.variant_ids)
+
+    def __len__(self) -> int:
+        return len(self.variant_ids)
+
+    def __repr__(self) -> str:
+        return f"ObservationTable({dict(self.items())!r})"
+
+
+def observation_columns(
+    observations: Mapping[VariantId, Observation],
+) -> tuple[Sequence[VariantId], Sequence[float], Sequence[float]]:
+    """Return (variant_ids, trials, successes) columns, without copying for tables."""
+    if isinstance(observations, ObservationTable):
+        return observations.variant_ids, observations.trials, observations.successes
+    values = observations.values()
+    return (
+        tuple(observations),
+        [o.trials for o in values],
+        [o.successes for o in values],
+    )
+
+
+def is_continuous(observations: Mapping[VariantId, object]) -> bool:
+    """True if observations hold ContinuousObservation values (judged by the first)."""
+    if isinstance(observations, ObservationTable) or not observations:
+        return False
+    return isinstance(next(iter(observations.values())), ContinuousObservation)
 
 
 @dataclass(frozen=True, slots=True)
@@ -86,4 +294,21 @@ class Constraints:
 @dataclass(frozen=True, slots=True)
 class AllocationResult:
     weights: Mapping[VariantId, float]
-    explanation: AllocationExplanation
+    # None when computed in lean mode (Engine(explain=False)).
+    explanation: AllocationExplanation | None
+
+
+class ComputeRequest(NamedTuple):
+    """
+    One experiment's inputs for Engine.compute_many.
+
+    Plain tuples in the same field order are accepted as well.
+    """
+
+    experiment_id: str
+    observations: Mapping[VariantId, Observation]
+    previous_weights: Mapping[VariantId, float]
+    constraints: Constraints | None = None
+    seed: int | None = None
+    last_updated_at_epoch_s: int | None = None
+    now_epoch_s: int | None = None
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
-from .types import Observation, VariantId
+from .types import (
+    ContinuousObservation,
+    Observation,
+    ObservationTable,
+    VariantId,
+    is_continuous,
+    observation_columns,
+)
 
 
 class ValidationError(ValueError):
@@ -13,23 +20,88 @@ def validate_observations(observations: Mapping[VariantId, Observation]) -> None
     if not observations:
         raise ValidationError("observations must be non-empty")
 
-    for vid, obs in observations.items():
+    if isinstance(observations, ObservationTable) and observations.validated:
+        # Rows were checked when the table was built (see ObservationTable.validate).
+        return
+
+    if is_continuous(observations):
+        validate_continuous_observations(observations)
+        return
+
+    if not isinstance(observations, ObservationTable):
+        for vid, o in observations.items():
+            if isinstance(o, ContinuousObservation):
+                raise ValidationError(
+                    f"{vid}: cannot mix ContinuousObservation with "
+                    f"{type(next(iter(observations.values()))).__name__}"
+                )
+
+    validate_observation_rows(*observation_columns(observations))
+
+
+def validate_observation_rows(
+    variant_ids: Sequence[VariantId],
+    trials: Sequence[float],
+    successes: Sequence[float],
+) -> None:
+    for vid, t, s in zip(variant_ids, trials, successes, strict=True):
         if not isinstance(vid, str) or not vid.strip():
             raise ValidationError(f"variant id must be a non-empty string; got {vid!r}")
 
-        if obs.trials < 0:
-            raise ValidationError(f"{vid}: trials must be >= 0; got {obs.trials}")
+        if t < 0:
+            raise ValidationError(f"{vid}: trials must be >= 0; got {t}")
 
-        if obs.successes < 0:
-            raise ValidationError(f"{vid}: successes must be >= 0; got {obs.successes}")
+        if s < 0:
+            raise ValidationError(f"{vid}: successes must be >= 0; got {s}")
 
-        if obs.successes > obs.trials:
+        if s > t:
             raise ValidationError(
-                f"{vid}: successes must be <= trials; got "
-                f"successes={obs.successes}, trials={obs.trials}"
+                f"{vid}: successes must be <= trials; got successes={s}, trials={t}"
             )
 
 
+def validate_continuous_observations(
+    observations: Mapping[VariantId, ContinuousObservation],
+) -> None:
+    if not observations:
+        raise ValidationError("observations must be non-empty")
+
+    for vid, o in observations.items():
+        if not isinstance(vid, str) or not vid.strip():
+            raise ValidationError(f"variant id must be a non-empty string; got {vid!r}")
+
+        if not isinstance(o, ContinuousObservation):
+            raise ValidationError(
+                f"{vid}: cannot mix ContinuousObservation with {type(o).__name__}"
+            )
+
+        if o.trials < 0:
+            raise ValidationError(f"{vid}: trials must be >= 0; got {o.trials}")
+
+        if o.trials == 0 and (o.reward_sum != 0.0 or o.reward_sum_sq != 0.0):
+            raise ValidationError(f"{vid}: reward sums must be 0 when trials is 0")
+
+        # Cauchy-Schwarz: sum(r^2) * n >= sum(r)^2 for any real rewards.
+        if o.reward_sum_sq * o.trials < o.reward_sum * o.reward_sum * (1.0 - 1e-9):
+            raise ValidationError(
+                f"{vid}: reward_sum_sq is inconsistent with reward_sum and trials"
+            )
+
+
+def validate_observation_kind(
+    observations: Mapping[VariantId, Observation],
+    *,
+    kind: str,
+    strategy: str,
+) -> None:
+    """Reject observations the strategy cannot model (see Strategy.observation_kind)."""
+    actual = "continuous" if is_continuous(observations) else "binary"
+    if actual != kind:
+        raise ValidationError(
+            f"strategy {strategy!r} expects {kind} observations; got {actual} observations"
+        )
+
+
 def validate_previous_weights(
     previous_weights: Mapping[VariantId, float],
     *,
@@ -39,18 +111,15 @@ def validate_previous_weights(
     if not previous_weights:
         raise ValidationError("previous_weights must be non-empty")
 
+    # Strict on purpose: a variant missing from either side would silently drop traffic.
     obs_keys = set(observations.keys())
     w_keys = set(previous_weights.keys())
     if obs_keys != w_keys:
-        missing = sorted(obs_keys - w_keys)
-        extra = sorted(w_keys - obs_keys)
-        msg = []
-        if missing:
-            msg.append(f"missing weights for variants: {missing}")
-        if extra:
-            msg.append(f"extra weights for unknown variants: {extra}")
+        missing_in_obs = sorted(w_keys - obs_keys)
+        extra_in_obs = sorted(obs_keys - w_keys)
         raise ValidationError(
-            "previous_weights keys must match observations keys; " + "; ".join(msg)
+            "Variant ID mismatch between observations and previous_weights. "
+            f"missing_in_observations={missing_in_obs} extra_in_observations={extra_in_obs}"
         )
 
     total = 0.0
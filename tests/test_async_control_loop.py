@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from adaptive_experimentation.integrations.async_control_loop import (
+    run_fleet_async,
+    run_once_async,
+)
+from adaptive_experimentation.integrations.control_loop import CycleCancelledError, run_once
+from adaptive_experimentation.types import Constraints, Observation
+
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.2, min_weight=0.0)
+_OBS = {"A": Observation(2000, 100), "B": Observation(2000, 300)}
+
+
+@dataclass
+class _AsyncStore:
+    weights: dict[str, dict[str, float]]
+    writes: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    async def read_weights(self, experiment_id: str) -> dict[str, float]:
+        await asyncio.sleep(0)
+        return dict(self.weights[experiment_id])
+
+    async def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        await asyncio.sleep(0)
+        self.writes[experiment_id] = dict(weights)
+
+
+@dataclass
+class _AsyncSource:
+    delay_s: float = 0.0
+    fail: frozenset[str] = frozenset()
+    slow: frozenset[str] = frozenset()
+    blocking: frozenset[str] = frozenset()
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    async def read_observations(self, experiment_id: str, start: int, end: int):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(10.0 if experiment_id in self.slow else self.delay_s)
+            if experiment_id in self.blocking:
+                # Overruns the deadline without yielding to the event loop.
+                time.sleep(0.3)
+            if experiment_id in self.fail:
+                raise RuntimeError("warehouse unavailable")
+            return dict(_OBS)
+        finally:
+            self.in_flight -= 1
+
+
+class _SyncStore:
+    def __init__(self) -> None:
+        self.weights = {"A": 0.5, "B": 0.5}
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(self.weights)
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        self.weights = dict(weights)
+
+
+class _SyncSource:
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        return dict(_OBS)
+
+
+def _store(ids) -> _AsyncStore:
+    return _AsyncStore(weights={eid: {"A": 0.5, "B": 0.5} for eid in ids})
+
+
+def test_run_once_async_matches_sync_run_once() -> None:
+    kwargs = dict(
+        experiment_id="exp1",
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        strategy="thompson",
+        constraints=_CONSTRAINTS,
+        seed=4,
+    )
+
+    store = _store(["exp1"])
+    async_result = asyncio.run(run_once_async(store=store, source=_AsyncSource(), **kwargs))
+    sync_result = run_once(store=_SyncStore(), source=_SyncSource(), **kwargs)
+
+    assert async_result.wrote_update is True
+    assert async_result.allocation == sync_result.allocation
+    assert store.writes["exp1"] == dict(sync_result.allocation.weights)
+
+
+def test_run_fleet_async_limits_concurrency_and_isolates_failures() -> None:
+    ids = [f"exp{i}" for i in range(20)]
+    source = _AsyncSource(delay_s=0.01, fail=frozenset({"exp3"}))
+
+    report = asyncio.run(
+        run_fleet_async(
+            ids,
+            window_start_epoch_s=0,
+            window_end_epoch_s=60,
+            store=_store(ids),
+            source=source,
+            strategy="heuristic",
+            constraints=_CONSTRAINTS,
+            max_concurrency=5,
+        )
+    )
+
+    assert source.peak_in_flight == 5
+    assert len(report.results) == 19
+    assert isinstance(report.failures["exp3"].error, RuntimeError)
+    assert report.stage_latency_s["read_observations"].count == 19
+
+
+def test_run_fleet_async_cancels_timed_out_cycles() -> None:
+    ids = ["slow", "fast"]
+
+    report = asyncio.run(
+        run_fleet_async(
+            ids,
+            window_start_epoch_s=0,
+            window_end_epoch_s=60,
+            store=_store(ids),
+            source=_AsyncSource(slow=frozenset({"slow"})),
+            strategy="heuristic",
+            constraints=_CONSTRAINTS,
+            timeout_s=0.1,
+        )
+    )
+
+    assert list(report.results) == ["fast"]
+    assert report.timed_out == ("slow",)
+    assert report.wall_time_s < 5.0
+
+
+def test_run_fleet_async_skips_write_after_deadline_while_loop_is_blocked() -> None:
+    # One at a time, so the blocked loop does not also delay "fast".
+    ids = ["fast", "blocked"]
+    store = _store(ids)
+
+    report = asyncio.run(
+        run_fleet_async(
+            ids,
+            window_start_epoch_s=0,
+            window_end_epoch_s=60,
+            store=store,
+            source=_AsyncSource(blocking=frozenset({"blocked"})),
+            strategy="heuristic",
+            constraints=_CONSTRAINTS,
+            max_concurrency=1,
+            timeout_s=0.1,
+        )
+    )
+
+    assert report.timed_out == ("blocked",)
+    assert set(store.writes) == {"fast"}
+
+
+def test_run_once_skips_write_when_cancelled() -> None:
+    store = _SyncStore()
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(CycleCancelledError):
+        run_once(
+            experiment_id="exp",
+            window_start_epoch_s=0,
+            window_end_epoch_s=60,
+            store=store,
+            source=_SyncSource(),
+            strategy="heuristic",
+            constraints=_CONSTRAINTS,
+            cancel=cancel,
+        )
+    assert store.weights == {"A": 0.5, "B": 0.5}
+
+
+def test_run_fleet_async_rejects_bad_concurrency() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(
+            run_fleet_async(
+                ["a"],
+                window_start_epoch_s=0,
+                window_end_epoch_s=60,
+                store=_store(["a"]),
+                source=_AsyncSource(),
+                max_concurrency=0,
+            )
+        )
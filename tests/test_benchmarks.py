@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+_BENCH = Path(__file__).resolve().parents[1] / "benchmarks" / "bench.py"
+
+
+def _load_bench(monkeypatch):
+    spec = importlib.util.spec_from_file_location("bench", _BENCH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "bench", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmark_suite_writes_json_and_compares_to_baseline(tmp_path, monkeypatch) -> None:
+    bench = _load_bench(monkeypatch)
+    out = tmp_path / "bench.json"
+    args = ["--filter", "n=2]", "--repeat", "1", "--min-time", "0.001"]
+
+    assert bench.main([*args, "--output", str(out)]) == 0
+
+    report = json.loads(out.read_text())
+    assert set(report["results"]) == {
+        "engine.compute[heuristic,n=2]",
+        "engine.compute[thompson,n=2]",
+    }
+    assert report["results"]["engine.compute[heuristic,n=2]"]["min_s"] > 0
+
+    # A baseline that is 1000x faster must be reported as a regression.
+    for timing in report["results"].values():
+        timing["min_s"] /= 1000
+    out.write_text(json.dumps(report))
+    assert bench.main([*args, "--baseline", str(out)]) == 1
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from adaptive_experimentation.integrations.fleet import run_batch
+from adaptive_experimentation.types import Constraints, Observation
+
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.2, min_weight=0.0)
+_MOVING = {"A": Observation(2000, 100), "B": Observation(2000, 300)}
+_HOLDING = {"A": Observation(10, 1), "B": Observation(10, 2)}
+
+
+@dataclass
+class _Store:
+    weights: dict[str, dict[str, float]]
+    calls: list[str] = field(default_factory=list)
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        self.calls.append("read_weights")
+        return dict(self.weights[experiment_id])
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        self.calls.append("write_weights")
+        self.weights[experiment_id] = dict(weights)
+
+
+@dataclass
+class _BulkStore(_Store):
+    def read_weights_many(self, experiment_ids):
+        self.calls.append("read_weights_many")
+        return {eid: dict(self.weights[eid]) for eid in experiment_ids if eid in self.weights}
+
+    def write_weights_many(self, weights, explanations) -> None:
+        self.calls.append("write_weights_many")
+        assert weights.keys() == explanations.keys()
+        for eid, w in weights.items():
+            self.weights[eid] = dict(w)
+
+
+@dataclass
+class _Source:
+    observations: dict[str, dict[str, Observation]]
+    calls: list[str] = field(default_factory=list)
+
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        self.calls.append("read_observations")
+        return dict(self.observations[experiment_id])
+
+
+@dataclass
+class _BulkSource(_Source):
+    def read_observations_many(self, experiment_ids, start: int, end: int):
+        self.calls.append("read_observations_many")
+        return {eid: dict(self.observations[eid]) for eid in experiment_ids}
+
+
+def _fixtures(store_cls, source_cls):
+    ids = ["moving", "holding", "mismatch"]
+    store = store_cls(weights={eid: {"A": 0.5, "B": 0.5} for eid in ids})
+    source = source_cls(
+        observations={
+            "moving": _MOVING,
+            "holding": _HOLDING,
+            "mismatch": {"A": Observation(2000, 100)},
+        }
+    )
+    return ids, store, source
+
+
+def _run(ids, store, source):
+    return run_batch(
+        ids,
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        store=store,
+        source=source,
+        strategy="heuristic",
+        constraints=_CONSTRAINTS,
+    )
+
+
+def test_run_batch_uses_bulk_methods_when_available() -> None:
+    ids, store, source = _fixtures(_BulkStore, _BulkSource)
+
+    report = _run(ids, store, source)
+
+    assert store.calls == ["read_weights_many", "write_weights_many"]
+    assert source.calls == ["read_observations_many"]
+    assert report.updated == ("moving",)
+    assert list(report.results) == ["moving", "holding"]
+    assert "Variant ID mismatch" in str(report.failures["mismatch"].error)
+    assert report.stage_latency_s["read_weights"].count == 1
+
+
+def test_run_batch_falls_back_to_per_experiment_calls() -> None:
+    ids, store, source = _fixtures(_Store, _Source)
+
+    report = _run(ids, store, source)
+
+    assert store.calls == ["read_weights"] * 3 + ["write_weights"]
+    assert source.calls == ["read_observations"] * 3
+    assert report.updated == ("moving",)
+    assert report.stage_latency_s["read_weights"].count == 3
+
+
+def test_run_batch_matches_bulk_and_fallback_results() -> None:
+    ids, bulk_store, bulk_source = _fixtures(_BulkStore, _BulkSource)
+    _, store, source = _fixtures(_Store, _Source)
+
+    bulk = _run(ids, bulk_store, bulk_source)
+    each = _run(ids, store, source)
+
+    assert bulk_store.weights == store.weights
+    for eid in bulk.results:
+        assert bulk.results[eid].allocation == each.results[eid].allocation
+
+
+def test_run_batch_reports_experiments_missing_from_bulk_reads() -> None:
+    ids, store, source = _fixtures(_BulkStore, _BulkSource)
+
+    report = _run(ids + ["unknown"], store, source)
+
+    assert isinstance(report.failures["unknown"].error, KeyError)
+    assert "moving" in report.results
+
+
+@dataclass
+class _FailingBulkSource(_Source):
+    def read_observations_many(self, experiment_ids, start: int, end: int):
+        raise ConnectionError("warehouse unavailable")
+
+
+@dataclass
+class _TimestampedBulkStore(_BulkStore):
+    def read_last_updated_at(self, experiment_id: str) -> int | None:
+        return None
+
+    def read_last_updated_at_many(self, experiment_ids):
+        raise TimeoutError("store timed out")
+
+
+def test_run_batch_records_failing_bulk_reads_per_experiment() -> None:
+    ids, store, _ = _fixtures(_BulkStore, _Source)
+    source = _FailingBulkSource(observations={})
+
+    report = _run(ids, store, source)
+
+    assert report.results == {}
+    assert list(report.failures) == ids
+    assert all(isinstance(f.error, ConnectionError) for f in report.failures.values())
+    assert report.stage_latency_s["read_observations"].count == 1
+    assert "write_weights_many" not in store.calls
+
+    ids, store, source = _fixtures(_TimestampedBulkStore, _BulkSource)
+    report = _run(ids, store, source)
+    assert list(report.failures) == ids
+    assert all(isinstance(f.error, TimeoutError) for f in report.failures.values())
+    assert source.calls == []
@@ -0,0 +1,141 @@
+import pytest
+
+from adaptive_experimentation import Constraints
+from adaptive_experimentation.contextual import LinearContextualBandit
+from adaptive_experimentation.validation import ValidationError
+
+np = pytest.importorskip("numpy")
+
+_UNIFORM = {"A": 0.5, "B": 0.5}
+_SEGMENTS = {"mobile": [1.0, 1.0, 0.0], "desktop": [1.0, 0.0, 1.0]}
+
+
+def _trained(policy="thompson", events=2000, seed=0):
+    # A converts better on mobile, B on desktop.
+    rng = np.random.default_rng(seed)
+    bandit = LinearContextualBandit(["A", "B"], 3, policy=policy, exploration=0.5)
+    rates = {("A", "mobile"): 0.30, ("B", "mobile"): 0.10,
+             ("A", "desktop"): 0.10, ("B", "desktop"): 0.30}
+    vids, contexts, rewards = [], [], []
+    for _ in range(events):
+        segment = "mobile" if rng.random() < 0.5 else "desktop"
+        vid = "A" if rng.random() < 0.5 else "B"
+        vids.append(vid)
+        contexts.append(_SEGMENTS[segment])
+        rewards.append(float(rng.random() < rates[(vid, segment)]))
+    bandit.update_many(vids, contexts, rewards)
+    return bandit
+
+
+def test_rank_one_updates_match_direct_inverse() -> None:
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(50, 4))
+    r = rng.normal(size=50)
+    bandit = LinearContextualBandit(["A"], 4, ridge=2.0)
+    bandit.update_many(["A"] * 50, x, r)
+
+    a = 2.0 * np.eye(4) + x.T @ x
+    expected = np.linalg.solve(a, x.T @ r)
+    np.testing.assert_allclose(bandit.coefficients()[0], expected, rtol=1e-9, atol=1e-12)
+
+
+def test_update_and_update_many_agree() -> None:
+    one = LinearContextualBandit(["A", "B"], 3)
+    many = LinearContextualBandit(["A", "B"], 3)
+    events = [("A", [1.0, 0.5, 0.0], 1.0), ("B", [1.0, 0.0, 2.0], 0.0), ("A", [1.0, 1.0, 1.0], 1.0)]
+    for vid, x, r in events:
+        one.update(vid, x, r)
+    many.update_many(*zip(*events, strict=True))
+    np.testing.assert_allclose(one.coefficients(), many.coefficients())
+    assert one.trials() == many.trials() == {"A": 2, "B": 1}
+
+
+@pytest.mark.parametrize("policy", ["thompson", "ucb"])
+def test_learns_a_different_best_variant_per_segment(policy) -> None:
+    bandit = _trained(policy)
+    proposed = bandit.propose_weights(list(_SEGMENTS.values()), seed=3)
+    assert proposed.shape == (2, 2)
+    np.testing.assert_allclose(proposed.sum(axis=1), 1.0)
+    assert proposed[0, 0] > 0.9  # mobile -> A
+    assert proposed[1, 1] > 0.9  # desktop -> B
+
+
+def test_compute_applies_guardrails_per_segment() -> None:
+    bandit = _trained()
+    constraints = Constraints(max_step=0.1, min_weight=0.05, min_trials=0)
+    results = bandit.compute(
+        _SEGMENTS, {s: _UNIFORM for s in _SEGMENTS}, constraints, seed=7
+    )
+    assert list(results) == ["mobile", "desktop"]
+    assert results["mobile"].weights == pytest.approx({"A": 0.6, "B": 0.4})
+    assert results["desktop"].weights == pytest.approx({"A": 0.4, "B": 0.6})
+
+    expl = results["mobile"].explanation
+    assert expl.strategy.name == "linear_thompson"
+    assert expl.strategy.details["seed"] == 7
+    assert set(expl.strategy.details["expected_reward"]) == {"A", "B"}
+    assert expl.guardrails.max_step_clamps
+    assert expl.observations.total_trials == 2000
+
+
+def test_compute_is_reproducible_and_lean_mode_skips_explanations() -> None:
+    bandit = _trained()
+    prev = {s: _UNIFORM for s in _SEGMENTS}
+    constraints = Constraints(min_trials=0)
+    a = bandit.compute(_SEGMENTS, prev, constraints, seed=11)
+    b = bandit.compute(_SEGMENTS, prev, constraints, seed=11, explain=False)
+    assert {s: r.weights for s, r in a.items()} == {s: r.weights for s, r in b.items()}
+    assert all(r.explanation is None for r in b.values())
+
+
+def test_compute_reads_the_model_under_one_lock_acquisition() -> None:
+    bandit = _trained(events=200)
+
+    class _CountingLock:
+        def __init__(self, lock):
+            self.lock, self.acquired = lock, 0
+
+        def __enter__(self):
+            self.acquired += 1
+            return self.lock.__enter__()
+
+        def __exit__(self, *exc):
+            return self.lock.__exit__(*exc)
+
+    lock = bandit._lock = _CountingLock(bandit._lock)
+    result = bandit.compute(_SEGMENTS, {s: _UNIFORM for s in _SEGMENTS}, Constraints(), seed=1)
+    assert lock.acquired == 1
+    assert result["mobile"].explanation.observations.total_trials == 200
+
+
+def test_min_trials_holds_every_segment() -> None:
+    bandit = LinearContextualBandit(["A", "B"], 3)
+    bandit.update("A", [1.0, 1.0, 0.0], 1.0)
+    results = bandit.compute(
+        _SEGMENTS, {s: _UNIFORM for s in _SEGMENTS}, Constraints(min_trials=10)
+    )
+    for result in results.values():
+        assert result.weights == _UNIFORM
+        assert result.explanation.guardrails.hold_reason == "min_trials_not_met"
+
+
+def test_rejects_bad_inputs() -> None:
+    bandit = LinearContextualBandit(["A", "B"], 3)
+    with pytest.raises(ValidationError, match="3 features"):
+        bandit.update("A", [1.0, 0.0], 1.0)
+    with pytest.raises(ValidationError, match="unknown variant"):
+        bandit.update("C", [1.0, 0.0, 0.0], 1.0)
+    with pytest.raises(ValidationError, match="finite"):
+        bandit.update("A", [1.0, 0.0, 0.0], float("nan"))
+    with pytest.raises(ValidationError, match="missing"):
+        bandit.compute(_SEGMENTS, {"mobile": _UNIFORM}, Constraints())
+    with pytest.raises(ValidationError, match="'desktop': previous_weights must sum to 1"):
+        bandit.compute(
+            _SEGMENTS, {"mobile": _UNIFORM, "desktop": {"A": 0.9, "B": 0.9}}, Constraints()
+        )
+    with pytest.raises(ValidationError, match="'mobile': A: weight must be between 0 and 1"):
+        bandit.compute(
+            _SEGMENTS, {"mobile": {"A": -0.5, "B": 1.5}, "desktop": _UNIFORM}, Constraints()
+        )
+    with pytest.raises(ValueError, match="policy"):
+        LinearContextualBandit(["A"], 3, policy="greedy")
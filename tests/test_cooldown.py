@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from adaptive_experimentation import ComputeRequest, Constraints, Engine, Observation
+from adaptive_experimentation.guardrails import cooldown_remaining_s
+from adaptive_experimentation.integrations.control_loop import run_once
+
+_OBS = {
+    "A": Observation(trials=2000, successes=100),
+    "B": Observation(trials=2000, successes=300),
+}
+_PREV = {"A": 0.5, "B": 0.5}
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.2, min_weight=0.0, cooldown_seconds=600)
+
+
+def test_cooldown_remaining_requires_both_timestamps() -> None:
+    c = Constraints(cooldown_seconds=600)
+
+    assert cooldown_remaining_s(c, last_updated_at_epoch_s=None, now_epoch_s=1000) == 0
+    assert cooldown_remaining_s(c, last_updated_at_epoch_s=1000, now_epoch_s=None) == 0
+    assert cooldown_remaining_s(c, last_updated_at_epoch_s=1000, now_epoch_s=1100) == 500
+    assert cooldown_remaining_s(c, last_updated_at_epoch_s=1000, now_epoch_s=1600) == 0
+
+
+def test_engine_holds_inside_cooldown_without_validating() -> None:
+    engine = Engine(strategy="thompson")
+
+    r = engine.compute(
+        observations={},  # would fail validation if it were checked
+        previous_weights=_PREV,
+        constraints=_CONSTRAINTS,
+        last_updated_at_epoch_s=1000,
+        now_epoch_s=1300,
+    )
+
+    assert r.weights == _PREV
+    assert r.explanation.guardrails.changed is False
+    assert r.explanation.guardrails.hold_reason == "cooldown_active"
+    assert r.explanation.guardrails.guardrails_applied == ("cooldown_hold",)
+    assert r.explanation.strategy.details["cooldown_remaining_s"] == 300
+
+
+def test_engine_updates_after_cooldown_expires() -> None:
+    r = Engine(strategy="heuristic").compute(
+        observations=_OBS,
+        previous_weights=_PREV,
+        constraints=_CONSTRAINTS,
+        last_updated_at_epoch_s=1000,
+        now_epoch_s=1600,
+    )
+
+    assert r.explanation.guardrails.changed is True
+    assert r.weights["B"] > 0.5
+
+
+def test_compute_many_applies_cooldown_per_request() -> None:
+    results = Engine(strategy="heuristic").compute_many(
+        [
+            ComputeRequest("cooling", _OBS, _PREV, _CONSTRAINTS, None, 1000, 1100),
+            ComputeRequest("ready", _OBS, _PREV, _CONSTRAINTS, None, 1000, 2000),
+        ]
+    )
+
+    assert results["cooling"].explanation.guardrails.hold_reason == "cooldown_active"
+    assert results["ready"].explanation.guardrails.changed is True
+
+
+@dataclass
+class _TimestampedStore:
+    weights: dict[str, float]
+    last_updated_at: int | None
+    clock: int
+    writes: list[dict[str, float]] = field(default_factory=list)
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(self.weights)
+
+    def read_last_updated_at(self, experiment_id: str) -> int | None:
+        return self.last_updated_at
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        self.weights = dict(weights)
+        self.writes.append(dict(weights))
+        self.last_updated_at = self.clock
+
+
+@dataclass
+class _CountingSource:
+    reads: int = 0
+
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        self.reads += 1
+        return dict(_OBS)
+
+
+def test_control_loop_skips_observation_read_during_cooldown() -> None:
+    store = _TimestampedStore(weights=dict(_PREV), last_updated_at=None, clock=1000)
+    source = _CountingSource()
+
+    def tick(now: int):
+        store.clock = now
+        return run_once(
+            experiment_id="exp1",
+            window_start_epoch_s=now - 60,
+            window_end_epoch_s=now,
+            store=store,
+            source=source,
+            strategy="heuristic",
+            constraints=_CONSTRAINTS,
+            now_epoch_s=now,
+        )
+
+    first = tick(1000)
+    held = tick(1300)
+    after = tick(1700)
+
+    assert first.wrote_update is True
+    assert held.wrote_update is False
+    assert held.allocation.explanation.guardrails.hold_reason == "cooldown_active"
+    assert after.wrote_update is True
+    assert source.reads == 2
+    assert len(store.writes) == 2
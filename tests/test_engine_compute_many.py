@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_experimentation import ComputeRequest, Constraints, Engine, Observation
+from adaptive_experimentation.validation import ValidationError
+
+
+def _requests() -> list[ComputeRequest]:
+    constraints = Constraints(min_trials=1000, max_step=0.2, min_weight=0.01)
+    return [
+        ComputeRequest(
+            experiment_id="exp1",
+            observations={
+                "A": Observation(trials=2000, successes=100),
+                "B": Observation(trials=2000, successes=300),
+            },
+            previous_weights={"A": 0.5, "B": 0.5},
+            constraints=constraints,
+            seed=1,
+        ),
+        ComputeRequest(
+            experiment_id="exp2",
+            observations={
+                "A": Observation(trials=10, successes=1),
+                "B": Observation(trials=10, successes=2),
+            },
+            previous_weights={"A": 0.4, "B": 0.6},
+            seed=3,
+        ),
+        ComputeRequest(
+            experiment_id="exp3",
+            observations={
+                "A": Observation(trials=5000, successes=500),
+                "B": Observation(trials=5000, successes=450),
+                "C": Observation(trials=5000, successes=700),
+            },
+            previous_weights={"A": 0.3, "B": 0.3, "C": 0.4},
+            constraints=constraints,
+            seed=7,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_compute_many_matches_compute_in_a_loop(strategy: str) -> None:
+    engine = Engine(strategy=strategy)
+    requests = _requests()
+
+    batch = engine.compute_many(requests)
+
+    assert list(batch) == [r.experiment_id for r in requests]
+    for r in requests:
+        single = engine.compute(
+            observations=r.observations,
+            previous_weights=r.previous_weights,
+            constraints=r.constraints,
+            seed=r.seed,
+        )
+        assert batch[r.experiment_id] == single
+
+
+def test_compute_many_accepts_plain_tuples() -> None:
+    engine = Engine(strategy="heuristic")
+    obs = {"A": Observation(trials=10, successes=1), "B": Observation(trials=10, successes=2)}
+
+    batch = engine.compute_many([("exp1", obs, {"A": 0.5, "B": 0.5})])
+
+    assert batch["exp1"].weights == {"A": 0.5, "B": 0.5}
+    assert batch["exp1"].explanation.guardrails.hold_reason == "min_trials_not_met"
+
+
+def test_compute_many_rejects_duplicate_experiment_ids() -> None:
+    engine = Engine(strategy="heuristic")
+    obs = {"A": Observation(trials=10, successes=1)}
+
+    with pytest.raises(ValidationError, match="duplicate experiment_id"):
+        engine.compute_many([("exp1", obs, {"A": 1.0}), ("exp1", obs, {"A": 1.0})])
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, replace
+
+import pytest
+
+from adaptive_experimentation import Constraints, Engine, Observation, _msgpack
+from adaptive_experimentation.explanations import AllocationExplanation, StrategyExplanation
+
+_OBS = {f"v{i}": Observation(trials=2000, successes=100 + 40 * i) for i in range(20)}
+_PREV = {vid: 1.0 / 20 for vid in _OBS}
+
+
+def _explanation(strategy: str, **kwargs) -> AllocationExplanation:
+    result = Engine(strategy=strategy).compute(
+        observations=_OBS,
+        previous_weights=_PREV,
+        constraints=Constraints(min_trials=1000, max_step=0.02, min_weight=0.04),
+        seed=5,
+        **kwargs,
+    )
+    return result.explanation
+
+
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_to_dict_matches_asdict(strategy: str) -> None:
+    expl = _explanation(strategy)
+    assert expl.to_dict() == asdict(expl)
+
+
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_json_and_bytes_round_trip(strategy: str) -> None:
+    expl = _explanation(strategy)
+    assert expl.guardrails.max_step_clamps and expl.guardrails.min_weight_floors
+
+    assert json.loads(expl.to_json()) == json.loads(json.dumps(asdict(expl)))
+    assert AllocationExplanation.from_json(expl.to_json()) == expl
+    assert AllocationExplanation.from_bytes(expl.to_bytes()) == expl
+    assert AllocationExplanation.from_dict(expl.to_dict()) == expl
+    assert len(expl.to_bytes()) < len(expl.to_json())
+
+
+def test_fractional_totals_round_trip() -> None:
+    obs = {"A": Observation(trials=1500.5, successes=150.25), "B": Observation(1500.5, 180.75)}
+    expl = Engine(strategy="heuristic").compute(
+        observations=obs,
+        previous_weights={"A": 0.5, "B": 0.5},
+        constraints=Constraints(min_trials=1000),
+    ).explanation
+    assert (expl.observations.total_trials, expl.observations.total_successes) == (3001.0, 331.0)
+    assert AllocationExplanation.from_json(expl.to_json()) == expl
+    assert AllocationExplanation.from_bytes(expl.to_bytes()) == expl
+
+
+def test_cooldown_hold_round_trips() -> None:
+    expl = _explanation("thompson", last_updated_at_epoch_s=0, now_epoch_s=10)
+    assert AllocationExplanation.from_bytes(expl.to_bytes()) == expl
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf")])
+def test_to_json_rejects_non_finite_floats(value: float) -> None:
+    expl = _explanation("heuristic")
+    bad = replace(expl, strategy=StrategyExplanation(name="custom", details={"score": value}))
+    with pytest.raises(ValueError):
+        bad.to_json()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        127,
+        128,
+        255,
+        256,
+        65536,
+        2**32,
+        2**64 - 1,
+        -1,
+        -32,
+        -33,
+        -129,
+        -(2**15) - 1,
+        -(2**63),
+        0.1,
+        -1e300,
+        "",
+        "x" * 31,
+        "é" * 40,
+        "y" * 70000,
+        b"\x00\x01",
+        [1, [2, [3]]],
+        list(range(20)),
+        {"a": {"b": [1.5, None]}},
+        {f"k{i}": i for i in range(20)},
+    ],
+)
+def test_msgpack_round_trip(value) -> None:
+    assert _msgpack.unpackb(_msgpack.packb(value)) == value
+
+
+def test_msgpack_known_encodings() -> None:
+    # Reference bytes from the msgpack spec.
+    assert _msgpack.packb({"a": 1}) == b"\x81\xa1a\x01"
+    assert _msgpack.packb([True, None, -1]) == b"\x93\xc3\xc0\xff"
+    assert _msgpack.packb(1.0) == b"\xcb\x3f\xf0\x00\x00\x00\x00\x00\x00"
+
+
+def test_msgpack_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        _msgpack.packb(object())
+    with pytest.raises(OverflowError):
+        _msgpack.packb(2**64)
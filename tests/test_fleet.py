@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from adaptive_experimentation.integrations.fleet import run_fleet
+from adaptive_experimentation.types import Constraints, Observation
+
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.2, min_weight=0.0)
+
+
+@dataclass
+class _Store:
+    weights: dict[str, dict[str, float]]
+    writes: dict[str, dict[str, float]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(self.weights[experiment_id])
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        with self.lock:
+            self.writes[experiment_id] = dict(weights)
+
+
+@dataclass
+class _Source:
+    delay_s: float = 0.0
+    fail: frozenset[str] = frozenset()
+    hang: frozenset[str] = frozenset()
+    release: threading.Event = field(default_factory=threading.Event)
+    barrier: threading.Barrier | None = None
+
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        if self.barrier is not None:
+            self.barrier.wait()
+        if experiment_id in self.hang:
+            self.release.wait(5.0)
+        if experiment_id in self.fail:
+            raise RuntimeError("warehouse unavailable")
+        time.sleep(self.delay_s)
+        return {"A": Observation(2000, 100), "B": Observation(2000, 300)}
+
+
+def _store(ids: list[str]) -> _Store:
+    return _Store(weights={eid: {"A": 0.5, "B": 0.5} for eid in ids})
+
+
+def _run(ids, store, source, **kwargs):
+    return run_fleet(
+        ids,
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        store=store,
+        source=source,
+        strategy="heuristic",
+        constraints=_CONSTRAINTS,
+        **kwargs,
+    )
+
+
+def test_fleet_runs_experiments_concurrently() -> None:
+    ids = [f"exp{i}" for i in range(8)]
+    store = _store(ids)
+
+    # Every read waits until all eight are in flight, so a serial run would break the
+    # barrier (BrokenBarrierError failures) instead of depending on wall-clock time.
+    source = _Source(delay_s=0.1, barrier=threading.Barrier(len(ids), timeout=5.0))
+    report = _run(ids, store, source, max_workers=8)
+
+    assert list(report.results) == ids
+    assert report.failures == {}
+    assert set(report.updated) == set(ids) == set(store.writes)
+    assert report.stage_latency_s["read_observations"].count == 8
+    assert report.stage_latency_s["read_observations"].mean_s >= 0.1
+
+
+def test_fleet_isolates_failures() -> None:
+    ids = ["ok1", "bad", "ok2"]
+
+    report = _run(ids, _store(ids), _Source(fail=frozenset({"bad"})), max_workers=2)
+
+    assert list(report.results) == ["ok1", "ok2"]
+    assert isinstance(report.failures["bad"].error, RuntimeError)
+    assert report.failures["bad"].timed_out is False
+
+
+def test_fleet_times_out_slow_experiments() -> None:
+    ids = ["slow", "fast"]
+    source = _Source(hang=frozenset({"slow"}))
+
+    try:
+        report = _run(ids, _store(ids), source, max_workers=2, timeout_s=0.2)
+    finally:
+        source.release.set()
+
+    assert list(report.results) == ["fast"]
+    assert report.timed_out == ("slow",)
+    assert isinstance(report.failures["slow"].error, TimeoutError)
+
+
+def test_timed_out_cycle_does_not_write_when_it_finishes() -> None:
+    ids = ["slow", "fast"]
+    store = _store(ids)
+    source = _Source(hang=frozenset({"slow"}))
+
+    try:
+        report = _run(ids, store, source, max_workers=2, timeout_s=0.2)
+    finally:
+        source.release.set()
+
+    assert report.timed_out == ("slow",)
+    # The abandoned worker resumes after the release; its cancel flag stops the write.
+    for thread in threading.enumerate():
+        if thread.name.startswith("fleet"):
+            thread.join(2.0)
+    assert set(store.writes) == {"fast"}
+
+
+def test_fleet_rejects_duplicate_ids() -> None:
+    with pytest.raises(ValueError, match="unique"):
+        _run(["a", "a"], _store(["a"]), _Source())
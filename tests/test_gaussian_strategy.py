@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_experimentation import Constraints, ContinuousObservation, Engine, Observation
+from adaptive_experimentation.strategies.gaussian_strategy import (
+    GaussianHeuristicStrategy,
+    GaussianThompsonStrategy,
+)
+from adaptive_experimentation.validation import ValidationError
+
+
+def _obs(mean: float, spread: float, n: int) -> ContinuousObservation:
+    # n rewards alternating mean - spread / mean + spread
+    return ContinuousObservation.from_rewards(
+        mean + (spread if i % 2 else -spread) for i in range(n)
+    )
+
+
+_OBS = {"A": _obs(2.0, 1.0, 2000), "B": _obs(2.5, 1.0, 2000), "C": _obs(1.8, 1.0, 2000)}
+_PREV = {"A": 0.4, "B": 0.3, "C": 0.3}
+
+
+def test_sufficient_statistics_aggregate_in_constant_memory() -> None:
+    rewards = [1.0, 3.5, -2.0, 0.0, 4.25]
+    agg = ContinuousObservation.from_rewards(iter(rewards))
+    assert agg == ContinuousObservation(5, sum(rewards), sum(r * r for r in rewards))
+
+    stepwise = ContinuousObservation(0, 0.0, 0.0)
+    for r in rewards:
+        stepwise = stepwise.add(r)
+    assert stepwise == agg
+
+    merged = ContinuousObservation.from_rewards(rewards[:2]).merge(
+        ContinuousObservation.from_rewards(rewards[2:])
+    )
+    assert merged.trials == 5
+    assert merged.mean == pytest.approx(sum(rewards) / 5)
+    assert merged.variance == pytest.approx(
+        sum((r - merged.mean) ** 2 for r in rewards) / 4
+    )
+    assert merged.successes == merged.reward_sum
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "numpy"])
+def test_gaussian_thompson_prefers_highest_mean(backend: str) -> None:
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    s = GaussianThompsonStrategy(backend=backend, num_samples=500)
+    r = s.propose(_OBS, seed=3)
+    assert max(r.proposed_weights, key=r.proposed_weights.get) == "B"
+    assert sum(r.proposed_weights.values()) == pytest.approx(1.0)
+    assert r.explanation["posterior"]["B"]["mean"] == pytest.approx(5000 / 2001)
+    assert s.propose_weights(_OBS, seed=3) == r.proposed_weights
+    assert s.propose(_OBS, seed=3) == r
+
+
+def test_gaussian_heuristic_is_proportional_to_smoothed_mean() -> None:
+    w = GaussianHeuristicStrategy(alpha=1.0).propose(_OBS).proposed_weights
+    assert w["B"] > w["A"] > w["C"]
+
+    negative = {"A": _obs(-1.0, 0.5, 100), "B": _obs(-2.0, 0.5, 100)}
+    assert GaussianHeuristicStrategy().propose_weights(negative) == {"A": 0.5, "B": 0.5}
+
+
+@pytest.mark.parametrize("strategy", ["gaussian_thompson", "gaussian_heuristic"])
+def test_engine_guardrails_and_explanations_work_unchanged(strategy: str) -> None:
+    constraints = Constraints(min_trials=1000, max_step=0.1, min_weight=0.05)
+    r = Engine(strategy=strategy).compute(
+        observations=_OBS, previous_weights=_PREV, constraints=constraints, seed=1
+    )
+    assert r.explanation.strategy.name == strategy
+    assert r.explanation.observations.total_trials == 6000
+    assert r.explanation.observations.total_successes == pytest.approx(12600.0)
+    assert "max_step_clamp" in r.explanation.guardrails.guardrails_applied
+    assert r.explanation.to_dict()["guardrails"]["changed"] is True
+
+    held = Engine(strategy=strategy).compute(
+        observations={"A": _obs(1.0, 1.0, 10), "B": _obs(2.0, 1.0, 10)},
+        previous_weights={"A": 0.5, "B": 0.5},
+        constraints=constraints,
+    )
+    assert held.explanation.guardrails.hold_reason == "min_trials_not_met"
+
+
+def test_validation_of_continuous_observations() -> None:
+    engine = Engine(strategy="gaussian_heuristic")
+    prev = {"A": 0.5, "B": 0.5}
+    for bad in (
+        {"A": ContinuousObservation(10, 5.0, 1.0), "B": _obs(1.0, 1.0, 10)},
+        {"A": ContinuousObservation(0, 1.0, 1.0), "B": _obs(1.0, 1.0, 10)},
+        {"A": ContinuousObservation(-1, 0.0, 0.0), "B": _obs(1.0, 1.0, 10)},
+        {"A": _obs(1.0, 1.0, 10), "B": Observation(10, 5)},
+    ):
+        with pytest.raises(ValidationError):
+            engine.compute(observations=bad, previous_weights=prev)
+
+    with pytest.raises(TypeError):
+        GaussianThompsonStrategy().propose({"A": Observation(10, 5)})
+
+
+def test_mixed_observations_are_rejected_whichever_kind_comes_first() -> None:
+    mixed = {"A": Observation(100, 5), "B": ContinuousObservation(100, 5.5, 5.0)}
+    for strategy in ("heuristic", "thompson", "gaussian_heuristic"):
+        with pytest.raises(ValidationError, match="cannot mix"):
+            Engine(strategy=strategy).compute(
+                observations=mixed, previous_weights={"A": 0.5, "B": 0.5}
+            )
+
+
+@pytest.mark.parametrize(
+    "strategy", ["heuristic", "thompson", "ucb1", "kl_ucb", "bayes_ucb", "top_two_thompson"]
+)
+def test_binary_strategies_reject_continuous_observations(strategy: str) -> None:
+    obs = {"A": ContinuousObservation(1000, 3000.0, 9500.0), "B": _obs(2.0, 1.0, 1000)}
+    engine = Engine(strategy=strategy)
+    with pytest.raises(ValidationError, match="expects binary observations"):
+        engine.compute(observations=obs, previous_weights={"A": 0.5, "B": 0.5})
+
+
+def test_continuous_strategies_reject_binary_observations() -> None:
+    with pytest.raises(ValidationError, match="expects continuous observations"):
+        Engine(strategy="gaussian_thompson").compute(
+            observations={"A": Observation(10, 5), "B": Observation(10, 6)},
+            previous_weights={"A": 0.5, "B": 0.5},
+        )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from adaptive_experimentation.guardrails import apply_guardrails, apply_guardrails_array
+from adaptive_experimentation.types import Constraints, Observation
+from adaptive_experimentation.validation import ValidationError
+
+np = pytest.importorskip("numpy")
+
+_IDS = ["A", "B", "C", "D"]
+
+
+def _reference(trials, prev, proposed, constraints):
+    return apply_guardrails(
+        observations={
+            v: Observation(trials=t, successes=0) for v, t in zip(_IDS, trials, strict=True)
+        },
+        previous_weights=dict(zip(_IDS, prev, strict=True)),
+        proposed_weights=dict(zip(_IDS, proposed, strict=True)),
+        constraints=constraints,
+    )
+
+
+def _random_rows(rng: random.Random, rows: int):
+    def simplex() -> list[float]:
+        xs = [rng.random() ** 3 for _ in _IDS]
+        return [x / sum(xs) for x in xs]
+
+    trials = [[rng.choice([500, 5000]) if rng.random() < 0.2 else 5000 for _ in _IDS]
+              for _ in range(rows)]
+    return trials, [simplex() for _ in range(rows)], [simplex() for _ in range(rows)]
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        Constraints(min_trials=1000, max_step=0.1, min_weight=0.05),
+        Constraints(min_trials=1000, max_step=1.0, min_weight=0.2),
+        Constraints(min_trials=1000, max_step=0.2, min_weight=0.0),
+    ],
+)
+def test_batch_matches_mapping_guardrails(constraints: Constraints) -> None:
+    trials, prev, proposed = _random_rows(random.Random(0), rows=200)
+
+    final, expls = apply_guardrails_array(
+        variant_ids=_IDS,
+        trials=trials,
+        previous_weights=prev,
+        proposed_weights=proposed,
+        constraints=constraints,
+    )
+
+    assert final.shape == (200, len(_IDS))
+    for r in range(200):
+        weights, expl = _reference(trials[r], prev[r], proposed[r], constraints)
+        assert final[r].tolist() == pytest.approx([weights[v] for v in _IDS], abs=1e-12)
+        assert expls[r].keys() == expl.keys()
+        assert expls[r]["changed"] == expl["changed"]
+        assert expls[r]["guardrails_applied"] == expl["guardrails_applied"]
+        assert expls[r].get("variants_below_min_trials") == expl.get("variants_below_min_trials")
+        assert expls[r].get("max_step_clamps") == expl.get("max_step_clamps")
+        assert expls[r].get("min_weight_floors") == expl.get("min_weight_floors")
+
+
+def test_single_row_returns_single_explanation() -> None:
+    c = Constraints(max_step=0.1, min_weight=0.0, min_trials=1000)
+
+    final, expl = apply_guardrails_array(
+        variant_ids=["A", "B"],
+        trials=[2000, 2000],
+        previous_weights=[0.5, 0.5],
+        proposed_weights=[0.0, 1.0],
+        constraints=c,
+    )
+
+    assert final.tolist() == pytest.approx([0.4, 0.6])
+    assert expl["max_step_clamps"]["A"] == {"raw": 0.0, "clamped": 0.4, "lo": 0.4, "hi": 0.6}
+
+
+def test_per_row_variant_ids() -> None:
+    final, expls = apply_guardrails_array(
+        variant_ids=[["A", "B"], ["X", "Y"]],
+        trials=[[10, 10], [2000, 2000]],
+        previous_weights=[[0.5, 0.5], [0.5, 0.5]],
+        proposed_weights=[[0.1, 0.9], [0.1, 0.9]],
+        constraints=Constraints(min_trials=1000, max_step=0.1, min_weight=0.0),
+    )
+
+    assert expls[0]["variants_below_min_trials"] == ["A", "B"]
+    assert set(expls[1]["max_step_clamps"]) == {"X", "Y"}
+
+
+def test_variant_ids_may_be_numpy_arrays() -> None:
+    kwargs = dict(
+        trials=[[2000, 2000], [2000, 2000]],
+        previous_weights=[[0.5, 0.5], [0.5, 0.5]],
+        proposed_weights=[[0.1, 0.9], [0.1, 0.9]],
+        constraints=Constraints(min_trials=1000, max_step=0.1, min_weight=0.0),
+    )
+    _, shared = apply_guardrails_array(variant_ids=np.array(["A", "B"]), **kwargs)
+    _, per_row = apply_guardrails_array(variant_ids=np.array([["A", "B"], ["X", "Y"]]), **kwargs)
+
+    assert set(shared[1]["max_step_clamps"]) == {"A", "B"}
+    assert set(per_row[1]["max_step_clamps"]) == {"X", "Y"}
+
+
+@pytest.mark.parametrize(
+    ("prev", "proposed", "match"),
+    [
+        ([[0.5, 0.5], [0.9, 0.9]], [[0.5, 0.5]] * 2, "row 1: previous_weights must sum to 1"),
+        ([[0.5, 0.5], [-0.5, 1.5]], [[0.5, 0.5]] * 2, "row 1: A: weight must be between 0"),
+        ([[float("nan"), 1.0], [0.5, 0.5]], [[0.5, 0.5]] * 2, "row 0: A: weight must be"),
+        ([[0.5, 0.5]] * 2, [[0.5, float("nan")], [0.5, 0.5]], "proposed_weights must be"),
+        ([[0.5, 0.5]] * 2, [[0.5, 0.5], [-0.1, 1.1]], "proposed_weights must be"),
+    ],
+)
+def test_invalid_weights_raise(prev, proposed, match) -> None:
+    with pytest.raises(ValidationError, match=match):
+        apply_guardrails_array(
+            variant_ids=["A", "B"],
+            trials=[[2000, 2000], [2000, 2000]],
+            previous_weights=prev,
+            proposed_weights=proposed,
+            constraints=Constraints(min_trials=1000),
+        )
+
+
+def test_infeasible_min_weight_raises() -> None:
+    with pytest.raises(ValidationError, match="infeasible"):
+        apply_guardrails_array(
+            variant_ids=["A", "B"],
+            trials=[2000, 2000],
+            previous_weights=[0.5, 0.5],
+            proposed_weights=[0.5, 0.5],
+            constraints=Constraints(min_weight=0.6, min_trials=1000),
+        )
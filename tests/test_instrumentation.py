@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from adaptive_experimentation import Engine
+from adaptive_experimentation.instrumentation import StageRecorder, Tracer
+from adaptive_experimentation.integrations.control_loop import run_once
+from adaptive_experimentation.types import Constraints, Observation
+
+_OBS = {
+    "A": Observation(trials=2000, successes=600),
+    "B": Observation(trials=2000, successes=100),
+}
+_PREV = {"A": 0.5, "B": 0.5}
+
+
+class _Store:
+    def __init__(self) -> None:
+        self.weights = {"exp": dict(_PREV)}
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(self.weights[experiment_id])
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        self.weights[experiment_id] = dict(weights)
+
+
+class _Source:
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        return dict(_OBS)
+
+
+def test_stage_recorder_is_a_tracer() -> None:
+    assert isinstance(StageRecorder(), Tracer)
+
+
+def test_engine_reports_compute_stages_and_counters() -> None:
+    recorder = StageRecorder()
+    engine = Engine(strategy="heuristic", tracer=recorder)
+    constraints = Constraints(min_trials=1000, max_step=0.1, min_weight=0.0)
+
+    engine.compute(observations=_OBS, previous_weights=_PREV, constraints=constraints)
+
+    latency = recorder.latency()
+    assert list(latency) == ["validation", "strategy", "guardrails", "explanation"]
+    assert all(s.count == 1 and s.total_s >= 0.0 for s in latency.values())
+
+    guardrails = recorder.counters()["guardrails"]
+    assert guardrails["variants"] == 2
+    assert guardrails["clamp_hits"] == 2
+    assert guardrails["floor_hits"] == 0
+    assert guardrails["held"] == 0
+
+
+def test_tracer_does_not_change_results() -> None:
+    traced = Engine(strategy="thompson", tracer=StageRecorder()).compute(
+        observations=_OBS, previous_weights=_PREV, seed=7
+    )
+    plain = Engine(strategy="thompson").compute(
+        observations=_OBS, previous_weights=_PREV, seed=7
+    )
+    assert traced == plain
+    assert Engine(strategy="thompson", tracer=StageRecorder()) == Engine(strategy="thompson")
+
+
+def test_cooldown_hold_reports_only_cooldown_stage() -> None:
+    recorder = StageRecorder()
+    Engine(tracer=recorder).compute(
+        observations=_OBS,
+        previous_weights=_PREV,
+        last_updated_at_epoch_s=1_000,
+        now_epoch_s=1_010,
+    )
+    assert list(recorder.latency()) == ["cooldown"]
+    assert recorder.counters()["cooldown"] == {"held": 1, "variants": 2}
+
+
+def test_run_once_reports_io_and_compute_stages() -> None:
+    recorder = StageRecorder()
+    result = run_once(
+        experiment_id="exp",
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        store=_Store(),
+        source=_Source(),
+        strategy="heuristic",
+        constraints=Constraints(min_trials=1000, max_step=0.1, min_weight=0.0),
+        tracer=recorder,
+    )
+
+    assert result.wrote_update
+    assert set(recorder.latency()) == {
+        "read_weights",
+        "read_observations",
+        "validation",
+        "strategy",
+        "guardrails",
+        "explanation",
+        "write_weights",
+    }
+    assert recorder.latency()["read_weights"].total_s == result.stage_latency_s["read_weights"]
+    assert recorder.counters()["read_observations"] == {"variants": 2}
+
+    recorder.reset()
+    assert recorder.latency() == {}
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_experimentation import ComputeRequest, Engine
+from adaptive_experimentation.strategies.base import Strategy, StrategyResult
+from adaptive_experimentation.strategies.heuristic_strategy import HeuristicStrategy
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+from adaptive_experimentation.types import Constraints, Observation
+
+_OBS = {
+    "A": Observation(trials=2000, successes=300),
+    "B": Observation(trials=2000, successes=200),
+    "C": Observation(trials=2000, successes=100),
+}
+_PREV = {"A": 0.4, "B": 0.3, "C": 0.3}
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.1, min_weight=0.05)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        HeuristicStrategy(alpha=2.0),
+        ThompsonStrategy(),
+        ThompsonStrategy(mode="prob_best", num_samples=200),
+    ],
+)
+def test_propose_weights_matches_propose(strategy: Strategy) -> None:
+    expected = strategy.propose(_OBS, seed=11).proposed_weights
+    assert strategy.propose_weights(_OBS, seed=11) == expected
+
+
+def test_base_propose_weights_falls_back_to_propose() -> None:
+    class Fixed(Strategy):
+        name = "fixed"
+
+        def propose(self, observations, *, seed=None):
+            return StrategyResult(proposed_weights={"A": 1.0}, explanation={})
+
+    assert Fixed().propose_weights(_OBS) == {"A": 1.0}
+
+
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_lean_engine_returns_same_weights_without_explanation(strategy: str) -> None:
+    full = Engine(strategy=strategy).compute(
+        observations=_OBS, previous_weights=_PREV, constraints=_CONSTRAINTS, seed=3
+    )
+    lean = Engine(strategy=strategy, explain=False).compute(
+        observations=_OBS, previous_weights=_PREV, constraints=_CONSTRAINTS, seed=3
+    )
+    assert lean.weights == full.weights
+    assert lean.explanation is None
+
+
+def test_lean_engine_cooldown_hold_and_compute_many() -> None:
+    engine = Engine(explain=False)
+    held = engine.compute(
+        observations=_OBS,
+        previous_weights=_PREV,
+        last_updated_at_epoch_s=100,
+        now_epoch_s=110,
+    )
+    assert held.weights == _PREV
+    assert held.explanation is None
+
+    results = engine.compute_many([ComputeRequest("e1", _OBS, _PREV, _CONSTRAINTS)])
+    assert results["e1"].explanation is None
+
+
+def test_lean_engine_still_validates() -> None:
+    with pytest.raises(ValueError):
+        Engine(explain=False).compute(
+            observations={"A": Observation(trials=1, successes=2)},
+            previous_weights={"A": 1.0},
+        )
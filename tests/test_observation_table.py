@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from adaptive_experimentation import Constraints, Engine, Observation, ObservationTable
+from adaptive_experimentation.guardrails import apply_guardrails
+from adaptive_experimentation.validation import ValidationError, validate_observations
+
+_OBS = {
+    "A": Observation(trials=2000, successes=100),
+    "B": Observation(trials=2000, successes=300),
+    "C": Observation(trials=2000, successes=150),
+}
+_PREV = {"A": 0.3, "B": 0.3, "C": 0.4}
+
+
+def test_table_behaves_like_observation_mapping() -> None:
+    table = ObservationTable(["A", "B"], [10, 20], [1, 5])
+
+    assert len(table) == 2
+    assert list(table) == ["A", "B"]
+    assert table["B"] == Observation(trials=20, successes=5)
+    assert "A" in table and "Z" not in table
+    assert table == {"A": Observation(10, 1), "B": Observation(20, 5)}
+    assert table.trials.typecode == "q"
+
+
+def test_from_mapping_round_trips() -> None:
+    table = ObservationTable.from_mapping(_OBS)
+
+    assert dict(table) == _OBS
+    assert ObservationTable.from_mapping(table) is table
+
+
+def test_table_rejects_mismatched_columns() -> None:
+    with pytest.raises(ValueError, match="column lengths differ"):
+        ObservationTable(["A", "B"], [10], [1, 2])
+    with pytest.raises(ValueError, match="unique"):
+        ObservationTable(["A", "A"], [10, 10], [1, 2])
+
+
+def test_validation_reads_table_columns() -> None:
+    table = ObservationTable.wrap(("A",), array("q", [10]), array("q", [11]))
+    with pytest.raises(ValidationError, match="successes must be <= trials"):
+        validate_observations(table)
+
+
+def test_fractional_tables_hold_float64_columns() -> None:
+    table = ObservationTable(["A", "B"], [10.5, 20.0], [1.25, 5.0], fractional=True)
+    assert table.fractional and table.trials.typecode == "d"
+    assert table["A"] == Observation(trials=10.5, successes=1.25)
+    assert not ObservationTable(["A"], [10], [1]).fractional
+
+    decayed = {"A": Observation(10.5, 1.25), "B": Observation(20, 5)}
+    assert ObservationTable.from_mapping(decayed).fractional
+    assert ObservationTable.from_mapping(decayed) == decayed
+    with pytest.raises(TypeError):
+        ObservationTable(["A"], [10.5], [1.0])
+
+
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_engine_gives_same_result_for_table_and_mapping(strategy: str) -> None:
+    engine = Engine(strategy=strategy)
+    constraints = Constraints(min_trials=1000, max_step=0.2, min_weight=0.05)
+
+    from_dict = engine.compute(
+        observations=_OBS, previous_weights=_PREV, constraints=constraints, seed=3
+    )
+    from_table = engine.compute(
+        observations=ObservationTable.from_mapping(_OBS),
+        previous_weights=_PREV,
+        constraints=constraints,
+        seed=3,
+    )
+
+    assert from_table.weights == from_dict.weights
+    assert from_table.explanation == from_dict.explanation
+
+
+def test_guardrails_hold_reads_table_trials() -> None:
+    table = ObservationTable(["A", "B"], [10, 5000], [1, 100])
+
+    weights, expl = apply_guardrails(
+        observations=table,
+        previous_weights={"A": 0.5, "B": 0.5},
+        proposed_weights={"A": 0.1, "B": 0.9},
+        constraints=Constraints(min_trials=1000),
+    )
+
+    assert weights == {"A": 0.5, "B": 0.5}
+    assert expl["variants_below_min_trials"] == ["A"]
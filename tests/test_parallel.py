@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from adaptive_experimentation import (
+    ComputeRequest,
+    ContinuousObservation,
+    Engine,
+    ObservationTable,
+)
+from adaptive_experimentation.instrumentation import StageRecorder
+from adaptive_experimentation.parallel import compute_parallel
+from adaptive_experimentation.types import Constraints, Observation
+from adaptive_experimentation.validation import ValidationError
+
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.1, min_weight=0.05)
+
+
+def _requests(n: int) -> list[ComputeRequest]:
+    reqs = []
+    for i in range(n):
+        obs = {
+            "A": Observation(trials=2000, successes=100 + i),
+            "B": Observation(trials=2000, successes=150 + 2 * i),
+            "C": Observation(trials=2000, successes=120),
+        }
+        if i % 3 == 0:
+            obs = ObservationTable.from_mapping(obs)
+        prev = {"B": 0.3, "A": 0.4, "C": 0.3} if i % 2 else {"A": 0.4, "B": 0.3, "C": 0.3}
+        reqs.append(ComputeRequest(f"exp{i}", obs, prev, _CONSTRAINTS, seed=i))
+    return reqs
+
+
+@pytest.mark.parametrize("explain", [True, False])
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_parallel_matches_compute_many(strategy: str, explain: bool) -> None:
+    engine = Engine(strategy=strategy, explain=explain)
+    reqs = _requests(23)
+    expected = engine.compute_many(reqs)
+
+    results = compute_parallel(engine, reqs, max_workers=2, chunk_size=5)
+    assert list(results) == list(expected)
+    assert results == expected
+
+
+def test_reuses_executor_and_handles_fractional_counts() -> None:
+    obs = {"A": Observation(trials=1500.5, successes=80.25), "B": Observation(2000, 90)}
+    reqs = [("e1", obs, {"A": 0.5, "B": 0.5}, _CONSTRAINTS, 1)] + _requests(4)
+    engine = Engine(strategy="thompson")
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = compute_parallel(engine, reqs, executor=pool)
+    assert results == engine.compute_many(reqs)
+
+
+def test_single_worker_runs_inline() -> None:
+    engine = Engine()
+    reqs = _requests(3)
+    assert compute_parallel(engine, reqs, max_workers=1) == engine.compute_many(reqs)
+    assert compute_parallel(engine, [], max_workers=2) == {}
+
+
+def test_errors_propagate_and_inputs_are_checked() -> None:
+    bad = ComputeRequest("bad", {"A": Observation(10, 20)}, {"A": 1.0})
+    with pytest.raises(ValidationError):
+        compute_parallel(Engine(), [*_requests(2), bad], max_workers=2)
+    with pytest.raises(ValidationError):
+        compute_parallel(Engine(), _requests(2) * 2, max_workers=2)
+    with pytest.raises(ValueError):
+        compute_parallel(Engine(tracer=StageRecorder()), _requests(2))
+    with pytest.raises(ValueError):
+        compute_parallel(Engine(), _requests(2), chunk_size=0)
+
+
+def test_continuous_observations_are_shipped_as_is() -> None:
+    obs = {
+        "A": ContinuousObservation.from_rewards([1.0, 2.0, 3.0] * 500),
+        "B": ContinuousObservation.from_rewards([2.0, 2.5] * 700),
+    }
+    reqs = [(f"e{i}", obs, {"A": 0.5, "B": 0.5}, _CONSTRAINTS, i) for i in range(4)]
+    engine = Engine(strategy="gaussian_thompson", strategy_params={"num_samples": 100})
+    assert compute_parallel(engine, reqs, max_workers=2) == engine.compute_many(reqs)
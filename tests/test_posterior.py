@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_experimentation import ContinuousObservation, Engine, PosteriorStats, posterior
+from adaptive_experimentation.explanations import AllocationExplanation
+from adaptive_experimentation.strategies import registry
+from adaptive_experimentation.strategies.registry import register_strategy
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+from adaptive_experimentation.types import Constraints, Observation
+
+_OBS = {
+    "A": Observation(trials=1000, successes=100),
+    "B": Observation(trials=1000, successes=115),
+}
+_PREV = {"A": 0.5, "B": 0.5}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    posterior.clear_cache()
+    yield
+    posterior.clear_cache()
+
+
+def test_credible_interval_matches_closed_form_and_is_cached() -> None:
+    # Beta(1, 1) is uniform, Beta(2, 1) has CDF x^2.
+    assert posterior.credible_interval(1.0, 1.0, 0.9) == pytest.approx((0.05, 0.95))
+    lo, hi = posterior.credible_interval(2.0, 1.0, 0.9)
+    assert (lo**2, hi**2) == pytest.approx((0.05, 0.95))
+
+    posterior.credible_interval(2.0, 1.0, 0.9)
+    info = posterior.cache_info()["credible_interval"]
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_summarize_shape_and_prob_best() -> None:
+    stats = PosteriorStats(level=0.95, prob_best=True, num_samples=20_000)
+    out = posterior.summarize(["A", "B"], [101.0, 116.0], [901.0, 886.0], stats)
+
+    assert out["level"] == 0.95
+    a, b = out["variants"]["A"], out["variants"]["B"]
+    assert a["mean"] == pytest.approx(101 / 1002)
+    assert a["lower"] < a["mean"] < a["upper"]
+    assert b["prob_best"] > 0.8
+    assert a["prob_best"] + b["prob_best"] == pytest.approx(1.0)
+    # Same inputs and seed: served from the cache.
+    assert posterior.summarize(["A", "B"], [101.0, 116.0], [901.0, 886.0], stats) == out
+    assert posterior.cache_info()["prob_best"].hits == 1
+
+
+def test_engine_attaches_stats_only_when_requested() -> None:
+    plain = Engine(strategy="thompson").compute(
+        observations=_OBS, previous_weights=_PREV, constraints=Constraints(), seed=1
+    )
+    assert "posterior_stats" not in plain.explanation.strategy.details
+    assert posterior.cache_info()["credible_interval"].misses == 0
+
+    engine = Engine(
+        strategy="thompson",
+        strategy_params={"prior_success": 2.0},
+        posterior_stats=PosteriorStats(level=0.9),
+    )
+    result = engine.compute(
+        observations=_OBS, previous_weights=_PREV, constraints=Constraints(), seed=1
+    )
+    stats = result.explanation.strategy.details["posterior_stats"]
+    assert stats["level"] == 0.9
+    assert stats["variants"]["A"]["alpha"] == 102.0
+    assert stats["variants"]["A"]["beta"] == 901.0
+    assert "prob_best" not in stats["variants"]["A"]
+
+    # Explanations with stats still round-trip through the codecs.
+    assert AllocationExplanation.from_json(result.explanation.to_json()) == result.explanation
+
+
+def test_stats_are_labeled_with_the_prior_they_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _PriorAttributeOnly(ThompsonStrategy):
+        # Carries a prior_success attribute but does not expose a Beta posterior.
+        def beta_posterior(self, observations):
+            return None
+
+    monkeypatch.setattr(registry, "_factories", dict(registry._factories))
+    register_strategy("attribute_only", _PriorAttributeOnly)
+    stats = PosteriorStats(level=0.9)
+    for strategy, params, prior, alpha in [
+        ("thompson", {"prior_success": 2.0}, "strategy", 102.0),
+        ("bayes_ucb", {"prior_success": 3.0}, "strategy", 103.0),
+        ("heuristic", None, "uniform", 101.0),
+        ("attribute_only", {"prior_success": 5.0}, "uniform", 101.0),
+    ]:
+        engine = Engine(strategy=strategy, strategy_params=params, posterior_stats=stats)
+        result = engine.compute(observations=_OBS, previous_weights=_PREV, seed=1)
+        details = result.explanation.strategy.details["posterior_stats"]
+        assert details["prior"] == prior
+        assert details["variants"]["A"]["alpha"] == alpha
+
+
+def test_lean_mode_and_continuous_observations_skip_stats() -> None:
+    engine = Engine(strategy="thompson", explain=False, posterior_stats=PosteriorStats())
+    engine.compute(observations=_OBS, previous_weights=_PREV, seed=1)
+    assert posterior.cache_info()["credible_interval"].misses == 0
+
+    continuous = {
+        "A": ContinuousObservation(trials=100, reward_sum=50.0, reward_sum_sq=40.0),
+        "B": ContinuousObservation(trials=100, reward_sum=60.0, reward_sum_sq=50.0),
+    }
+    result = Engine(strategy="gaussian_heuristic", posterior_stats=PosteriorStats()).compute(
+        observations=continuous, previous_weights=_PREV
+    )
+    assert "posterior_stats" not in result.explanation.strategy.details
+
+
+def test_bayes_ucb_reuses_cached_quantiles() -> None:
+    engine = Engine(strategy="bayes_ucb")
+    for _ in range(3):
+        engine.compute(observations=_OBS, previous_weights=_PREV)
+    info = posterior.cache_info()["beta_quantile"]
+    assert (info.misses, info.hits) == (2, 4)
+
+
+def test_rejects_invalid_stats() -> None:
+    with pytest.raises(ValueError, match="level"):
+        PosteriorStats(level=1.0)
+    with pytest.raises(ValueError, match="num_samples"):
+        PosteriorStats(num_samples=0)
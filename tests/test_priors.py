@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from adaptive_experimentation import Engine, Observation, ObservationTable
+from adaptive_experimentation.priors import (
+    UNIFORM_PRIOR,
+    BetaPrior,
+    PriorCache,
+    fit_beta_prior,
+    fit_beta_prior_from,
+)
+
+
+def _family(alpha: float, beta: float, *, arms: int, trials: int, seed: int = 0):
+    rng = random.Random(seed)
+    histories = []
+    for _ in range(arms // 2):
+        obs = {}
+        for v in ("A", "B"):
+            rate = rng.betavariate(alpha, beta)
+            successes = sum(rng.random() < rate for _ in range(trials))
+            obs[v] = Observation(trials=trials, successes=successes)
+        histories.append(obs)
+    return histories
+
+
+def test_method_of_moments_recovers_family_prior() -> None:
+    prior = fit_beta_prior_from(_family(5.0, 45.0, arms=400, trials=500))
+    assert prior.fitted_on == 400
+    assert prior.mean == pytest.approx(0.1, abs=0.01)
+    assert 35.0 < prior.strength < 70.0
+
+    # A tighter family is capped at max_strength.
+    assert fit_beta_prior_from(_family(20.0, 180.0, arms=400, trials=500)).strength == 100.0
+
+
+def test_fit_accepts_tables_and_columns() -> None:
+    histories = _family(5.0, 45.0, arms=40, trials=200, seed=1)
+    tables = [ObservationTable.from_mapping(h) for h in histories]
+    assert fit_beta_prior_from(tables) == fit_beta_prior_from(histories)
+
+    trials = [o.trials for h in histories for o in h.values()]
+    successes = [o.successes for h in histories for o in h.values()]
+    assert fit_beta_prior(trials, successes) == fit_beta_prior_from(histories)
+
+
+def test_degenerate_inputs_fall_back_or_cap() -> None:
+    assert fit_beta_prior([100], [10], min_arms=2) is UNIFORM_PRIOR
+    assert fit_beta_prior([100, 100], [0, 0], min_arms=2) is UNIFORM_PRIOR
+    assert fit_beta_prior([100, 5], [10, 1], min_trials=50, min_arms=2) is UNIFORM_PRIOR
+
+    # No spread beyond binomial noise: the strength is not identifiable.
+    assert fit_beta_prior([10_000] * 12, [1000] * 12) is UNIFORM_PRIOR
+
+    # Rates of 0 and 1 spread more than any Beta(mean=0.5) can: strength would be <= 0.
+    assert fit_beta_prior([1000] * 12, [0, 1000] * 6) is UNIFORM_PRIOR
+
+    capped = fit_beta_prior([1000, 1000], [100, 200], min_arms=2, max_strength=5.0)
+    assert capped.strength == pytest.approx(5.0)
+    assert capped.mean == pytest.approx(0.15)
+
+    with pytest.raises(ValueError):
+        BetaPrior(0.0, 1.0)
+    with pytest.raises(ValueError, match="min_arms"):
+        fit_beta_prior([100, 100], [10, 20], min_arms=1)
+
+
+def test_few_arms_fall_back_even_with_spread() -> None:
+    # Four well-measured arms with a real spread of rates are still too few to
+    # estimate the between-arm variance.
+    histories = _family(5.0, 45.0, arms=4, trials=5000)
+    assert fit_beta_prior_from(histories) is UNIFORM_PRIOR
+    assert fit_beta_prior_from(histories, min_arms=4).fitted_on == 4
+
+
+def test_fitted_prior_feeds_thompson() -> None:
+    prior = BetaPrior(10.0, 90.0, fitted_on=12)
+    result = Engine(strategy="thompson", strategy_params=prior.strategy_params()).compute(
+        observations={"A": Observation(20, 1), "B": Observation(20, 3)},
+        previous_weights={"A": 0.5, "B": 0.5},
+        seed=1,
+    )
+    details = result.explanation.strategy.details
+    assert details["priors"] == {"prior_success": 10.0, "prior_failure": 90.0}
+    assert details["posterior"]["A"] == {"alpha": 11.0, "beta": 109.0}
+
+
+def test_prior_cache_fits_once_per_family_and_expires() -> None:
+    now = [0.0]
+    cache = PriorCache(max_age_s=60.0, clock=lambda: now[0])
+    calls = []
+
+    def load():
+        calls.append(1)
+        return _family(2.0, 18.0, arms=20, trials=100)
+
+    first = cache.get_or_fit("checkout", load)
+    assert cache.get_or_fit("checkout", load) is first
+    assert len(calls) == 1
+
+    now[0] = 61.0
+    assert cache.get("checkout") is None
+    cache.get_or_fit("checkout", load)
+    assert len(calls) == 2
+
+    cache.invalidate("checkout")
+    assert cache.get("checkout") is None
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from adaptive_experimentation import ComputeRequest, Engine, Observation
+from adaptive_experimentation.integrations.control_loop import run_once
+from adaptive_experimentation.integrations.fleet import run_batch, run_fleet
+from adaptive_experimentation.parallel import compute_parallel
+from adaptive_experimentation.seeding import derive_seed, experiment_seed
+from adaptive_experimentation.types import Constraints
+
+_OBS = {"A": Observation(2000, 200), "B": Observation(2000, 210), "C": Observation(2000, 190)}
+_PREV = {"A": 0.4, "B": 0.3, "C": 0.3}
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.2, min_weight=0.0)
+_IDS = [f"exp{i}" for i in range(12)]
+
+
+def test_derive_seed_is_stable_and_key_sensitive() -> None:
+    assert derive_seed(42, "exp", 0) == derive_seed(42, "exp", 0)
+    assert 0 <= derive_seed(42) < 2**64
+    seeds = {
+        derive_seed(42, "exp", 0),
+        derive_seed(42, "exp", 1),
+        derive_seed(43, "exp", 0),
+        derive_seed(42, "exp0"),
+        derive_seed(42, "ex", "p0"),
+        derive_seed(42, "1"),
+        derive_seed(42, 1),
+        derive_seed(42, b"1"),
+    }
+    assert len(seeds) == 8
+    assert experiment_seed(7, "exp", 0, 60) == derive_seed(7, "exp", 0, 60)
+
+
+def test_derive_seed_rejects_unhashable_key_types() -> None:
+    with pytest.raises(TypeError):
+        derive_seed(1, 1.5)
+    with pytest.raises(TypeError):
+        derive_seed(1, True)
+
+
+def test_same_results_serial_threaded_and_process_pool() -> None:
+    engine = Engine(strategy="thompson")
+    reqs = [
+        ComputeRequest(eid, _OBS, _PREV, _CONSTRAINTS, derive_seed(99, eid, 0, 60))
+        for eid in _IDS
+    ]
+    serial = engine.compute_many(reqs)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {r.experiment_id: pool.submit(engine.compute_many, [r]) for r in reqs}
+    threaded = {eid: fut.result()[eid] for eid, fut in futures.items()}
+    pooled = compute_parallel(engine, reqs[::-1], max_workers=2, chunk_size=3)
+
+    assert threaded == serial
+    assert pooled == serial
+    assert len({tuple(r.weights.values()) for r in serial.values()}) == len(_IDS)
+
+
+class _Store:
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(_PREV)
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        pass
+
+
+class _Source:
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        return dict(_OBS)
+
+
+def test_runners_derive_the_same_seeds() -> None:
+    kwargs = dict(
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        store=_Store(),
+        source=_Source(),
+        constraints=_CONSTRAINTS,
+        root_seed=5,
+    )
+    single = {eid: run_once(experiment_id=eid, **kwargs).allocation for eid in _IDS}
+    fleet = run_fleet(_IDS, max_workers=3, **kwargs)
+    batch = run_batch(_IDS, **kwargs)
+
+    assert {eid: r.allocation for eid, r in fleet.results.items()} == single
+    assert {eid: r.allocation for eid, r in batch.results.items()} == single
+
+    explicit = run_once(
+        experiment_id="exp0",
+        seed=experiment_seed(5, "exp0", 0, 60),
+        **{k: v for k, v in kwargs.items() if k != "root_seed"},
+    )
+    assert explicit.allocation == single["exp0"]
+
+
+def test_seed_and_root_seed_are_exclusive() -> None:
+    with pytest.raises(ValueError):
+        run_once(
+            experiment_id="exp0",
+            window_start_epoch_s=0,
+            window_end_epoch_s=60,
+            store=_Store(),
+            source=_Source(),
+            seed=1,
+            root_seed=2,
+        )
+    with pytest.raises(ValueError):
+        run_fleet(
+            _IDS,
+            window_start_epoch_s=0,
+            window_end_epoch_s=60,
+            store=_Store(),
+            source=_Source(),
+            seed=1,
+            root_seed=2,
+        )
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from adaptive_experimentation.simulation import (  # noqa: E402
+    Scenario,
+    run_scenario,
+    simulate,
+)
+from adaptive_experimentation.types import Constraints  # noqa: E402
+
+_RATES = {"A": 0.05, "B": 0.08, "C": 0.04}
+
+
+def _scenario(name: str = "explore", **kwargs) -> Scenario:
+    defaults = dict(
+        true_rates=_RATES,
+        traffic_per_window=20_000,
+        num_windows=15,
+        strategy_params={"mode": "prob_best", "num_samples": 200},
+        constraints=Constraints.explore_defaults(),
+    )
+    return Scenario(name=name, **{**defaults, **kwargs})
+
+
+def test_run_is_deterministic_and_converges_to_best() -> None:
+    first = run_scenario(_scenario(), seed=1)
+    assert first == run_scenario(_scenario(), seed=1)
+
+    assert len(first.regret_per_window) == 15
+    assert all(r >= 0.0 for r in first.regret_per_window)
+    assert first.convergence_window is not None
+    assert max(first.final_weights, key=first.final_weights.get) == "B"
+    assert first.clamp_hits > 0
+
+
+def test_min_trials_holds_are_counted() -> None:
+    run = run_scenario(
+        _scenario(traffic_per_window=900, constraints=Constraints(min_trials=1000)), seed=0
+    )
+    assert run.min_trials_holds == 15
+    assert run.regret_per_window[0] == pytest.approx(run.regret_per_window[-1], rel=0.5)
+    assert run.final_weights == pytest.approx({"A": 1 / 3, "B": 1 / 3, "C": 1 / 3})
+
+
+def test_cumulative_observations_change_the_trajectory() -> None:
+    window = run_scenario(_scenario(strategy="heuristic", strategy_params=None), seed=3)
+    cumulative = run_scenario(
+        _scenario(strategy="heuristic", strategy_params=None, cumulative=True), seed=3
+    )
+    assert cumulative.regret_per_window[0] == window.regret_per_window[0]
+    assert cumulative.cumulative_regret != window.cumulative_regret
+
+
+def test_simulate_is_independent_of_worker_count() -> None:
+    scenarios = [
+        _scenario("explore"),
+        _scenario("safe", constraints=Constraints.safe_defaults()),
+    ]
+    serial = simulate(scenarios, range(3), max_workers=1)
+    pooled = simulate(scenarios, range(3), max_workers=2)
+    assert serial == pooled
+    assert [(r.scenario, r.seed) for r in serial.runs] == [
+        (name, seed) for name in ("explore", "safe") for seed in range(3)
+    ]
+
+    summary = serial.summary()
+    assert list(summary) == ["explore", "safe"]
+    assert summary["explore"].runs == 3
+    assert summary["explore"].mean_regret < summary["safe"].mean_regret
+
+
+def test_invalid_inputs() -> None:
+    with pytest.raises(ValueError):
+        Scenario(name="x", true_rates={"A": 0.1})
+    with pytest.raises(ValueError):
+        simulate([_scenario(), _scenario()], [0], max_workers=1)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pytest
+
+from adaptive_experimentation import Constraints, Engine, Observation
+from adaptive_experimentation.strategies import registry
+from adaptive_experimentation.strategies.base import Strategy, StrategyResult
+from adaptive_experimentation.strategies.registry import (
+    available_strategies,
+    get_strategy,
+    register_strategy,
+)
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+
+
+class _UniformStrategy(Strategy):
+    name = "uniform"
+
+    def propose(self, observations, *, seed=None) -> StrategyResult:
+        n = len(observations)
+        return StrategyResult({vid: 1.0 / n for vid in observations}, {"strategy": self.name})
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_factories", dict(registry._factories))
+    monkeypatch.setattr(registry, "_instances", OrderedDict())
+
+
+def test_instances_are_cached_per_name_and_params() -> None:
+    a = get_strategy("thompson", prior_success=2.0)
+
+    assert get_strategy("thompson", prior_success=2.0) is a
+    assert get_strategy("thompson") is not a
+    assert a.prior_success == 2.0
+
+
+def test_instance_cache_is_bounded_lru(monkeypatch) -> None:
+    monkeypatch.setattr(registry, "MAX_CACHED_INSTANCES", 3)
+    first = get_strategy("thompson", prior_success=1.0)
+    for prior in (2.0, 3.0):
+        get_strategy("thompson", prior_success=prior)
+    assert get_strategy("thompson", prior_success=1.0) is first  # now most recent
+
+    get_strategy("thompson", prior_success=4.0)
+    assert len(registry._instances) == 3
+    assert get_strategy("thompson", prior_success=1.0) is first
+    assert ("thompson", (("prior_success", 2.0),)) not in registry._instances
+
+
+def test_unknown_strategy_raises() -> None:
+    with pytest.raises(ValueError, match="unknown strategy"):
+        get_strategy("nope")
+
+
+def test_register_strategy_as_decorator() -> None:
+    register_strategy("uniform")(_UniformStrategy)
+
+    assert "uniform" in available_strategies()
+    assert isinstance(get_strategy("uniform"), _UniformStrategy)
+    with pytest.raises(ValueError, match="already registered"):
+        register_strategy("uniform", ThompsonStrategy)
+
+
+def test_strategy_loaded_from_entry_point(monkeypatch) -> None:
+    class _EntryPoint:
+        name = "uniform"
+
+        def load(self):
+            return _UniformStrategy
+
+    monkeypatch.setattr(
+        "importlib.metadata.entry_points",
+        lambda group: [_EntryPoint()] if group == registry.ENTRY_POINT_GROUP else [],
+    )
+
+    assert isinstance(get_strategy("uniform"), _UniformStrategy)
+
+
+def test_engine_passes_strategy_params() -> None:
+    engine = Engine(
+        strategy="thompson",
+        strategy_params={"mode": "prob_best", "num_samples": 200, "prior_success": 3.0},
+    )
+
+    r = engine.compute(
+        observations={"A": Observation(2000, 100), "B": Observation(2000, 300)},
+        previous_weights={"A": 0.5, "B": 0.5},
+        constraints=Constraints(min_trials=1000),
+        seed=1,
+    )
+
+    assert r.explanation.strategy.details["mode"] == "prob_best"
+    assert r.explanation.strategy.details["priors"]["prior_success"] == 3.0
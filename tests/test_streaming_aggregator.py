@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from adaptive_experimentation import Constraints, Observation, ObservationTable
+from adaptive_experimentation.integrations.control_loop import run_once
+from adaptive_experimentation.integrations.streaming import StreamingAggregator
+
+
+def test_tumbling_window_counts_and_zero_copy_snapshot() -> None:
+    agg = StreamingAggregator(window_s=60)
+    agg.register("exp", ["A", "B"])
+    agg.ingest("exp", ["A", "B", "A", "B"], [1, 0, 0, 1], event_time_epoch_s=10)
+    agg.ingest("exp", ["B"], [True], event_time_epoch_s=59)
+
+    snapshot = agg.read_observations("exp", 0, 60)
+
+    assert isinstance(snapshot, ObservationTable)
+    assert dict(snapshot) == {"A": Observation(2, 1), "B": Observation(3, 2)}
+
+    # Late event for the same window must not change the snapshot already handed out.
+    agg.ingest("exp", ["A"], [1], event_time_epoch_s=30)
+    assert dict(snapshot) == {"A": Observation(2, 1), "B": Observation(3, 2)}
+    assert agg.read_observations("exp", 0, 60)["A"] == Observation(3, 2)
+
+
+def test_sliding_window_sums_buckets() -> None:
+    agg = StreamingAggregator(window_s=60, slide_s=20)
+    for t in (0, 20, 40, 60):
+        agg.ingest("exp", ["A", "B"], [1, 0], event_time_epoch_s=t)
+
+    assert agg.read_observations("exp", 0, 60)["A"] == Observation(3, 3)
+    assert agg.read_observations("exp", 20, 80)["B"] == Observation(3, 0)
+    assert agg.window_bounds(now_epoch_s=85) == (20, 80)
+
+
+def test_unregistered_variants_are_added_with_zero_history() -> None:
+    agg = StreamingAggregator(window_s=60)
+    agg.ingest("exp", ["A"], [0], event_time_epoch_s=0)
+    agg.ingest("exp", ["C"], [1], event_time_epoch_s=70)
+
+    first = agg.read_observations("exp", 0, 60)
+
+    assert list(first) == ["A", "C"]
+    assert first["C"] == Observation(0, 0)
+
+
+def test_events_older_than_retention_are_dropped() -> None:
+    agg = StreamingAggregator(window_s=10, retention_buckets=2)
+    agg.ingest("exp", ["A"], [0], event_time_epoch_s=100)
+    agg.ingest("exp", ["A", "A"], [0, 0], event_time_epoch_s=5)
+
+    assert agg.dropped_events == 2
+
+
+def test_rejects_misaligned_inputs() -> None:
+    agg = StreamingAggregator(window_s=60)
+    with pytest.raises(ValueError, match="same length"):
+        agg.ingest("exp", ["A", "B"], [1])
+    with pytest.raises(ValueError, match="divide window_s"):
+        StreamingAggregator(window_s=60, slide_s=25)
+    with pytest.raises(KeyError):
+        agg.read_observations("missing", 0, 60)
+
+
+@dataclass
+class _Store:
+    weights: dict[str, float]
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(self.weights)
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        self.weights = dict(weights)
+
+
+def test_aggregator_feeds_run_once() -> None:
+    agg = StreamingAggregator(window_s=60)
+    agg.register("exp", ["A", "B"])
+    variants = ["A"] * 2000 + ["B"] * 2000
+    clicks = [1] * 100 + [0] * 1900 + [1] * 300 + [0] * 1700
+    agg.ingest("exp", variants, clicks, event_time_epoch_s=0)
+    store = _Store(weights={"A": 0.5, "B": 0.5})
+
+    result = run_once(
+        experiment_id="exp",
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        store=store,
+        source=agg,
+        strategy="heuristic",
+        constraints=Constraints(min_trials=1000, max_step=0.2, min_weight=0.0),
+    )
+
+    assert result.wrote_update is True
+    assert result.allocation.explanation.observations.total_successes == 400
+    assert store.weights["B"] > 0.5
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_experimentation import Constraints, Engine, Observation
+from adaptive_experimentation.strategies import thompson_strategy
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+
+_OBS = {
+    "A": Observation(trials=1000, successes=100),
+    "B": Observation(trials=1000, successes=200),
+    "C": Observation(trials=1000, successes=50),
+}
+
+
+def test_numpy_backend_is_reproducible_with_seed() -> None:
+    pytest.importorskip("numpy")
+    s = ThompsonStrategy(backend="numpy")
+
+    r1 = s.propose(_OBS, seed=123)
+    r2 = s.propose(_OBS, seed=123)
+
+    assert r1.proposed_weights == r2.proposed_weights
+    assert abs(sum(r1.proposed_weights.values()) - 1.0) < 1e-9
+    assert r1.explanation["backend"] == "numpy"
+    assert r1.explanation["posterior"]["A"] == {"alpha": 101.0, "beta": 901.0}
+
+
+def test_numpy_backend_samples_follow_posterior() -> None:
+    pytest.importorskip("numpy")
+    s = ThompsonStrategy(backend="numpy")
+
+    samples = [s.propose(_OBS, seed=i).explanation["samples"] for i in range(200)]
+    mean_b = sum(x["B"] for x in samples) / len(samples)
+
+    assert mean_b == pytest.approx(201 / 1002, abs=0.01)
+
+
+def test_auto_backend_falls_back_to_stdlib_without_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(thompson_strategy, "optional_numpy", lambda: None)
+
+    s = ThompsonStrategy(backend="auto")
+    r = s.propose(_OBS, seed=123)
+
+    assert s.backend == "stdlib"
+    assert r.proposed_weights == ThompsonStrategy().propose(_OBS, seed=123).proposed_weights
+
+
+def test_unknown_backend_raises() -> None:
+    with pytest.raises(ValueError, match="unknown backend"):
+        ThompsonStrategy(backend="cuda")
+
+
+def test_engine_default_thompson_backend_is_stdlib() -> None:
+    r = Engine(strategy="thompson").compute(
+        observations=_OBS,
+        previous_weights={"A": 0.3, "B": 0.3, "C": 0.4},
+        constraints=Constraints.neutral_defaults(),
+        seed=1,
+    )
+    assert r.explanation.strategy.details["backend"] == "stdlib"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+from adaptive_experimentation.types import Observation
+
+_OBS = {
+    "A": Observation(trials=1000, successes=100),
+    "B": Observation(trials=1000, successes=115),
+    "C": Observation(trials=1000, successes=50),
+}
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "numpy"])
+def test_prob_best_weights_are_probabilities(backend: str) -> None:
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    s = ThompsonStrategy(mode="prob_best", num_samples=2000, backend=backend)
+
+    r = s.propose(_OBS, seed=5)
+    w = r.proposed_weights
+
+    assert abs(sum(w.values()) - 1.0) < 1e-9
+    assert w["B"] > w["A"] > w["C"]
+    assert r.explanation["prob_best"] == w
+    assert r.explanation["samples_used"] == 2000
+    for vid, p in w.items():
+        assert r.explanation["mc_stderr"][vid] == pytest.approx(math.sqrt(p * (1 - p) / 2000))
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "numpy"])
+def test_prob_best_is_reproducible_with_seed(backend: str) -> None:
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    s = ThompsonStrategy(mode="prob_best", num_samples=500, backend=backend)
+
+    assert s.propose(_OBS, seed=9).proposed_weights == s.propose(_OBS, seed=9).proposed_weights
+
+
+def test_prob_best_is_less_noisy_than_single_draw() -> None:
+    single = ThompsonStrategy()
+    mc = ThompsonStrategy(mode="prob_best", num_samples=1000)
+
+    def spread(strategy: ThompsonStrategy) -> float:
+        ws = [strategy.propose(_OBS, seed=i).proposed_weights["A"] for i in range(20)]
+        return max(ws) - min(ws)
+
+    assert spread(mc) < spread(single)
+
+
+def test_prob_best_stops_at_time_budget() -> None:
+    s = ThompsonStrategy(mode="prob_best", num_samples=10_000_000, time_budget_s=0.01)
+
+    r = s.propose(_OBS, seed=1)
+
+    assert 1 <= r.explanation["samples_used"] < 10_000_000
+    assert abs(sum(r.proposed_weights.values()) - 1.0) < 1e-9
+
+
+def test_prob_best_rejects_bad_parameters() -> None:
+    with pytest.raises(ValueError, match="unknown mode"):
+        ThompsonStrategy(mode="greedy")
+    with pytest.raises(ValueError, match="num_samples"):
+        ThompsonStrategy(mode="prob_best", num_samples=0)
+    with pytest.raises(ValueError, match="time_budget_s"):
+        ThompsonStrategy(mode="prob_best", time_budget_s=0.0)
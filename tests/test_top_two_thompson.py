@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from adaptive_experimentation.strategies.registry import get_strategy
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+from adaptive_experimentation.strategies.top_two_strategy import (
+    TopTwoThompsonStrategy,
+    _top_two,
+)
+from adaptive_experimentation.types import Observation
+
+_OBS = {
+    "A": Observation(trials=1000, successes=100),
+    "B": Observation(trials=1000, successes=115),
+    "C": Observation(trials=1000, successes=50),
+}
+
+
+def test_closed_form_matches_resampling_definition() -> None:
+    p = [0.6, 0.3, 0.1]
+    beta = 0.5
+    # Leader i with prob p_i; challenger j != i with prob p_j / (1 - p_i).
+    expected = [
+        beta * p[j] + (1 - beta) * sum(p[i] * p[j] / (1 - p[i]) for i in range(3) if i != j)
+        for j in range(3)
+    ]
+    assert _top_two(p, beta) == pytest.approx(expected)
+    assert sum(_top_two(p, beta)) == pytest.approx(1.0)
+
+
+def test_certain_leader_shares_challenger_mass_evenly() -> None:
+    assert _top_two([1.0, 0.0, 0.0], 0.5) == [0.5, 0.25, 0.25]
+    assert _top_two([1.0], 0.5) == [1.0]
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "numpy"])
+def test_top_two_gives_the_runner_up_more_traffic_than_prob_best(backend) -> None:
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    prob_best = ThompsonStrategy(mode="prob_best", backend=backend).propose(_OBS, seed=3)
+    top_two = TopTwoThompsonStrategy(backend=backend).propose(_OBS, seed=3)
+
+    assert top_two.explanation["prob_best"] == prob_best.proposed_weights
+    assert top_two.explanation["leader_prob"] == 0.5
+    assert top_two.explanation["strategy"] == "top_two_thompson"
+    assert sum(top_two.proposed_weights.values()) == pytest.approx(1.0)
+    assert top_two.proposed_weights["B"] < prob_best.proposed_weights["B"]
+    assert top_two.proposed_weights["A"] > prob_best.proposed_weights["A"]
+
+
+def test_lean_path_matches_and_leader_prob_one_is_prob_best() -> None:
+    s = get_strategy("top_two_thompson", num_samples=500)
+    assert s.propose_weights(_OBS, seed=4) == s.propose(_OBS, seed=4).proposed_weights
+
+    pure = TopTwoThompsonStrategy(leader_prob=1.0, num_samples=500)
+    assert pure.propose_weights(_OBS, seed=4) == pytest.approx(
+        ThompsonStrategy(mode="prob_best", num_samples=500).propose_weights(_OBS, seed=4)
+    )
+
+
+def test_rejects_invalid_leader_prob() -> None:
+    with pytest.raises(ValueError, match="leader_prob"):
+        TopTwoThompsonStrategy(leader_prob=0.0)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from adaptive_experimentation import Constraints, Engine
+from adaptive_experimentation._special import betainc, betaincinv, betaincinv_array
+from adaptive_experimentation.explanations import AllocationExplanation
+from adaptive_experimentation.strategies.registry import get_strategy
+from adaptive_experimentation.strategies.ucb_strategy import (
+    BayesUCBStrategy,
+    KLUCBStrategy,
+    UCB1Strategy,
+)
+from adaptive_experimentation.types import Observation
+
+_OBS = {
+    "A": Observation(trials=1000, successes=100),
+    "B": Observation(trials=1000, successes=115),
+    "C": Observation(trials=200, successes=18),
+}
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "p", "expected"),
+    [
+        (1.0, 1.0, 0.3, 0.3),
+        (3.0, 1.0, 0.5, 0.5 ** (1 / 3)),
+        (1.0, 4.0, 0.9, 1 - 0.1 ** (1 / 4)),
+        (0.5, 0.5, 0.25, math.sin(math.pi * 0.25 / 2) ** 2),
+    ],
+)
+def test_betaincinv_matches_closed_forms(a, b, p, expected) -> None:
+    assert betaincinv(a, b, p) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("p", [1e-9, 0.025, 0.5, 0.975, 1 - 1e-6])
+def test_betaincinv_inverts_betainc(p) -> None:
+    for a, b in [(2.0, 3.0), (251.0, 4751.0), (1e5, 2e6)]:
+        assert betainc(a, b, betaincinv(a, b, p)) == pytest.approx(p, rel=1e-9, abs=1e-15)
+
+
+def test_ucb1_index_matches_formula() -> None:
+    r = UCB1Strategy(exploration=0.5).propose(_OBS)
+    log_total = math.log(2200)
+    expected = 115 / 1000 + 0.5 * math.sqrt(2 * log_total / 1000)
+    assert r.explanation["index"]["B"] == pytest.approx(expected)
+    assert r.explanation["means"]["C"] == pytest.approx(0.09)
+
+
+def test_kl_ucb_index_is_the_kl_bound() -> None:
+    r = KLUCBStrategy().propose(_OBS)
+    budget = math.log(2200)
+    for vid, o in _OBS.items():
+        mean, q = o.successes / o.trials, r.explanation["index"][vid]
+        kl = mean * math.log(mean / q) + (1 - mean) * math.log((1 - mean) / (1 - q))
+        assert q > mean
+        assert o.trials * kl == pytest.approx(budget, rel=1e-9)
+
+
+def test_bayes_ucb_index_is_a_posterior_quantile() -> None:
+    s = BayesUCBStrategy()
+    r = s.propose(_OBS)
+    assert r.explanation["level"] == pytest.approx(1 - 1 / 2200)
+    assert r.explanation["index"]["C"] == pytest.approx(
+        betaincinv(19.0, 183.0, 1 - 1 / 2200), rel=1e-12
+    )
+
+
+@pytest.mark.parametrize("name", ["ucb1", "kl_ucb", "bayes_ucb"])
+def test_optimism_favors_the_less_explored_variant(name) -> None:
+    # C has a lower mean than B but far fewer trials, so its bound is higher.
+    w = get_strategy(name).propose_weights(_OBS)
+    assert w == {"A": 0.0, "B": 0.0, "C": 1.0}
+
+
+@pytest.mark.parametrize("name", ["ucb1", "kl_ucb", "bayes_ucb"])
+def test_index_policies_are_deterministic_and_lean_matches(name) -> None:
+    s = get_strategy(name)
+    r = s.propose(_OBS, seed=1)
+    assert r.proposed_weights == s.propose(_OBS, seed=2).proposed_weights
+    assert s.propose_weights(_OBS) == r.proposed_weights
+    assert r.explanation["strategy"] == name
+
+
+def test_untried_variants_come_first_and_ties_split() -> None:
+    obs = {**_OBS, "D": Observation(trials=0, successes=0), "E": Observation(0, 0)}
+    for s in (UCB1Strategy(), KLUCBStrategy()):
+        assert s.propose_weights(obs) == {"A": 0.0, "B": 0.0, "C": 0.0, "D": 0.5, "E": 0.5}
+
+
+@pytest.mark.parametrize("name", ["ucb1", "kl_ucb"])
+def test_untried_index_is_null_and_explanation_round_trips(name) -> None:
+    obs = {**_OBS, "D": Observation(trials=0, successes=0)}
+    result = Engine(strategy=name).compute(
+        observations=obs,
+        previous_weights={"A": 0.25, "B": 0.25, "C": 0.25, "D": 0.25},
+        constraints=Constraints(min_trials=0),
+    )
+    explanation = result.explanation
+    assert explanation.strategy.details["index"]["D"] is None
+    assert explanation.proposed_weights["D"] == 1.0
+    assert "Infinity" not in explanation.to_json()
+    assert AllocationExplanation.from_json(explanation.to_json()) == explanation
+
+
+@pytest.mark.parametrize("cls", [UCB1Strategy, KLUCBStrategy])
+def test_numpy_backend_matches_stdlib(cls) -> None:
+    pytest.importorskip("numpy")
+    obs = {**_OBS, "D": Observation(trials=0, successes=0), "E": Observation(3, 0)}
+    a = cls().propose(obs).explanation["index"]
+    b = cls(backend="numpy").propose(obs).explanation["index"]
+    assert a == pytest.approx(b, rel=1e-12)
+
+
+def test_bayes_ucb_numpy_backend_matches_stdlib() -> None:
+    pytest.importorskip("numpy")
+    obs = {**_OBS, "D": Observation(trials=0, successes=0), "E": Observation(50_000, 4_000)}
+    a = BayesUCBStrategy(c=1.0).propose(obs).explanation
+    b = BayesUCBStrategy(c=1.0, backend="numpy").propose(obs).explanation
+    assert b["backend"] == "numpy"
+    assert b["index"] == pytest.approx(a["index"], rel=1e-10)
+
+
+def test_betaincinv_array_matches_scalar() -> None:
+    np = pytest.importorskip("numpy")
+    a = np.array([1.0, 3.0, 0.5, 251.0, 1e5])
+    b = np.array([1.0, 1.0, 0.5, 4751.0, 2e6])
+    for p in (1e-9, 0.025, 0.5, 1 - 1e-6):
+        expected = [betaincinv(x, y, p) for x, y in zip(a, b, strict=True)]
+        assert betaincinv_array(a, b, p).tolist() == pytest.approx(expected, rel=1e-12)
+
+
+def test_engine_guardrails_limit_the_winner_take_all_proposal() -> None:
+    engine = Engine(strategy="kl_ucb")
+    result = engine.compute(
+        observations=_OBS,
+        previous_weights={"A": 0.4, "B": 0.4, "C": 0.2},
+        constraints=Constraints(min_trials=100, max_step=0.1, min_weight=0.05),
+    )
+    # Each variant moves by max_step: A, B down to 0.3 and C up to 0.3.
+    assert result.weights == pytest.approx({"A": 1 / 3, "B": 1 / 3, "C": 1 / 3})
+    assert result.explanation.proposed_weights["C"] == 1.0
+    assert result.explanation.strategy.details["index"]["C"] > 0.115
+
+
+def test_rejects_invalid_params() -> None:
+    with pytest.raises(ValueError, match="exploration"):
+        UCB1Strategy(exploration=-1.0)
+    with pytest.raises(ValueError, match="c must"):
+        KLUCBStrategy(c=-1.0)
+    with pytest.raises(ValueError, match="priors"):
+        BayesUCBStrategy(prior_success=0.0)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from adaptive_experimentation import ComputeRequest, Engine, Observation, ObservationTable
+from adaptive_experimentation import validation as validation_module
+from adaptive_experimentation.integrations.control_loop import run_once
+from adaptive_experimentation.types import Constraints
+from adaptive_experimentation.validation import ValidationError
+
+_TABLE = ObservationTable(["A", "B", "C"], [2000, 2000, 2000], [300, 200, 100])
+_PREV = {"A": 0.4, "B": 0.3, "C": 0.3}
+_CONSTRAINTS = Constraints(min_trials=1000, max_step=0.1, min_weight=0.05)
+
+
+def test_constructor_validates_rows() -> None:
+    assert _TABLE.validated
+    with pytest.raises(ValidationError, match="trials must be >= 0"):
+        ObservationTable(["A", "B"], [100, -5], [20, 3])
+    with pytest.raises(ValidationError, match="successes must be <= trials"):
+        ObservationTable(["A", "B"], [100, 5], [20, 30])
+    with pytest.raises(ValidationError, match="non-empty string"):
+        ObservationTable(["A", ""], [100, 5], [20, 3])
+
+
+def test_wrapped_tables_are_checked_until_validated() -> None:
+    bad = ObservationTable.wrap(("A", "B"), array("q", [100, 5]), array("q", [20, 30]))
+    assert not bad.validated
+    with pytest.raises(ValidationError, match="successes must be <= trials"):
+        Engine().compute(observations=bad, previous_weights={"A": 0.5, "B": 0.5})
+    with pytest.raises(ValidationError):
+        bad.validate()
+    assert not bad.validated
+
+    good = ObservationTable.wrap(("A", "B"), array("q", [100, 5]), array("q", [20, 3]))
+    assert good.validate() is good
+    assert good.validated
+
+
+@pytest.mark.parametrize("strategy", ["heuristic", "thompson"])
+def test_validated_table_skips_row_checks_with_same_result(
+    strategy: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = Engine(strategy=strategy)
+    kwargs = dict(previous_weights=_PREV, constraints=_CONSTRAINTS, seed=4)
+    expected = engine.compute(observations=dict(_TABLE.items()), **kwargs)
+
+    calls = []
+    original = validation_module.validate_observation_rows
+    monkeypatch.setattr(
+        validation_module,
+        "validate_observation_rows",
+        lambda *args: calls.append(args) or original(*args),
+    )
+    assert engine.compute(observations=_TABLE, **kwargs) == expected
+    assert calls == []
+
+    engine.compute(
+        observations={"A": Observation(10, 1), "B": Observation(10, 2)},
+        previous_weights={"A": 0.5, "B": 0.5},
+    )
+    assert len(calls) == 1
+
+
+def test_previous_weights_are_always_checked() -> None:
+    bad_weights = {"A": 0.5, "B": 0.5, "C": 0.5}
+    with pytest.raises(ValidationError):
+        Engine().compute(observations=_TABLE, previous_weights=bad_weights)
+    with pytest.raises(ValidationError):
+        Engine().compute_many([ComputeRequest("e1", _TABLE, bad_weights)])
+
+
+class _Store:
+    def __init__(self, weights: dict[str, float]) -> None:
+        self.weights = weights
+
+    def read_weights(self, experiment_id: str) -> dict[str, float]:
+        return dict(self.weights)
+
+    def write_weights(self, experiment_id: str, weights, explanation) -> None:
+        pass
+
+
+class _Source:
+    def read_observations(self, experiment_id: str, start: int, end: int):
+        return _TABLE
+
+
+def test_run_once_checks_keys_for_validated_tables() -> None:
+    kwargs = dict(
+        experiment_id="exp",
+        window_start_epoch_s=0,
+        window_end_epoch_s=60,
+        source=_Source(),
+        strategy="heuristic",
+        constraints=_CONSTRAINTS,
+    )
+    assert run_once(**kwargs, store=_Store(_PREV)).wrote_update
+    with pytest.raises(ValueError, match="[Vv]ariant"):
+        run_once(**kwargs, store=_Store({"A": 0.5, "B": 0.5}))
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from adaptive_experimentation import Constraints, Engine, Observation
+from adaptive_experimentation.integrations.accumulator import WindowedAccumulator
+from adaptive_experimentation.strategies.thompson_strategy import ThompsonStrategy
+
+
+def _buckets(n: int, seed: int = 0) -> list[dict[str, Observation]]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        ta, tb = rng.randint(0, 500), rng.randint(0, 500)
+        out.append(
+            {"A": Observation(ta, rng.randint(0, ta)), "B": Observation(tb, rng.randint(0, tb))}
+        )
+    return out
+
+
+def test_sliding_totals_cover_last_num_buckets() -> None:
+    acc = WindowedAccumulator(num_buckets=4)
+    buckets = _buckets(11)
+    for b in buckets:
+        acc.push("exp", b)
+
+    table = acc.sliding("exp")
+
+    for vid in ("A", "B"):
+        assert table[vid].trials == sum(b[vid].trials for b in buckets[-4:])
+        assert table[vid].successes == sum(b[vid].successes for b in buckets[-4:])
+    assert acc.read_observations("exp", 0, 0) == table
+
+
+def test_decayed_totals_match_brute_force() -> None:
+    acc = WindowedAccumulator(num_buckets=6, half_life_buckets=2.0)
+    buckets = _buckets(23)
+    for b in buckets:
+        acc.push("exp", b)
+
+    table = acc.read_observations("exp", 0, 0)
+    gamma = 0.5 ** (1 / 2.0)
+
+    for vid in ("A", "B"):
+        expected = sum(gamma**age * b[vid].trials for age, b in enumerate(reversed(buckets[-6:])))
+        assert table[vid].trials == pytest.approx(expected, rel=1e-12)
+        assert 0.0 <= table[vid].successes <= table[vid].trials
+
+
+def test_new_variants_start_with_zero_history() -> None:
+    acc = WindowedAccumulator(num_buckets=3)
+    acc.push("exp", {"A": Observation(10, 1)})
+    acc.push("exp", {"A": Observation(10, 1), "B": Observation(5, 2)})
+
+    assert dict(acc.sliding("exp")) == {"A": Observation(20, 2), "B": Observation(5, 2)}
+
+
+def test_decayed_counts_feed_thompson_and_engine() -> None:
+    acc = WindowedAccumulator(num_buckets=8, half_life_buckets=3.0)
+    for _ in range(8):
+        acc.push("exp", {"A": Observation(400, 20), "B": Observation(400, 60)})
+    obs = acc.decayed("exp")
+
+    proposed = ThompsonStrategy().propose(obs, seed=1)
+    result = Engine(strategy="thompson").compute(
+        observations=obs,
+        previous_weights={"A": 0.5, "B": 0.5},
+        constraints=Constraints(min_trials=1000, max_step=0.2, min_weight=0.0),
+        seed=1,
+    )
+
+    assert obs.fractional and obs.validated
+    assert not acc.sliding("exp").fractional
+    assert isinstance(obs["A"].trials, float)
+    alpha = proposed.explanation["posterior"]["A"]["alpha"]
+    assert alpha == pytest.approx(1.0 + obs["A"].successes)
+    assert result.explanation.guardrails.changed is True
+    assert result.weights["B"] > 0.5
+
+
+def test_rejects_bad_parameters() -> None:
+    with pytest.raises(ValueError, match="num_buckets"):
+        WindowedAccumulator(num_buckets=0)
+    with pytest.raises(ValueError, match="half_life_buckets"):
+        WindowedAccumulator(num_buckets=3, half_life_buckets=0.0)
+    with pytest.raises(KeyError):
+        WindowedAccumulator(num_buckets=3).sliding("missing")